@@ -6,11 +6,15 @@ Code Generation Module
 """
 
 from .json_contract import JSONContractGenerator, TestContract
-from .code_generator import CodeGenerator, TestFramework
+from .code_generator import CodeGenerator, TestFramework, BatchGenerationReport
+from .locator_index import LocatorIndex, IndexedElement
 
 __all__ = [
     'JSONContractGenerator',
     'TestContract',
     'CodeGenerator',
-    'TestFramework'
+    'TestFramework',
+    'BatchGenerationReport',
+    'LocatorIndex',
+    'IndexedElement'
 ]
@@ -10,8 +10,9 @@ import json
 import sys
 from pathlib import Path
 
-from .code_generator import CodeGenerator, TestFramework
+from .code_generator import CodeGenerator, TestFramework, DEFAULT_BYTECODE_CACHE_DIR
 from .json_contract import JSONContractGenerator
+from .locator_index import LocatorIndex
 from ..test_generation import TestScenarioGenerator
 from ..test_generation.llm_client import LLMProvider
 
@@ -29,6 +30,22 @@ def main():
     gen_parser.add_argument("contracts", help="Path to JSON contracts file")
     gen_parser.add_argument("-o", "--output", default="generated_tests", help="Output directory")
     gen_parser.add_argument("-f", "--framework", choices=["playwright", "selenium"], default="playwright")
+    gen_parser.add_argument("-w", "--workers", type=int, help="Render tests in N worker processes")
+    gen_parser.add_argument("--template-dir", help="Directory with custom Jinja2 templates")
+    gen_parser.add_argument("--precompiled", help="Directory with precompiled templates (see 'precompile')")
+    gen_parser.add_argument("--no-bytecode-cache", action="store_true", help="Disable Jinja2 bytecode cache")
+    gen_parser.add_argument("--incremental", action="store_true",
+                            help="Skip unchanged tests and remove tests of deleted contracts")
+    gen_parser.add_argument("--changed-list", help="Write paths of regenerated files to this file (for lint/review)")
+    gen_parser.add_argument("--shared-browser", action="store_true",
+                            help="conftest: one browser per worker, fresh context per test")
+    gen_parser.add_argument("--login-url", help="conftest: log in once per worker and reuse storage state")
+
+    # Command: precompile (templates → Python modules)
+    pre_parser = subparsers.add_parser("precompile", help="Precompile Jinja2 templates into Python modules")
+    pre_parser.add_argument("-o", "--output", default=".jinja_precompiled", help="Output directory")
+    pre_parser.add_argument("-f", "--framework", choices=["playwright", "selenium"], default="playwright")
+    pre_parser.add_argument("--template-dir", help="Directory with custom Jinja2 templates")
 
     # Command: full-pipeline (requirements → scenarios → contracts → code)
     full_parser = subparsers.add_parser("full", help="Full pipeline: requirements to code")
@@ -38,12 +55,28 @@ def main():
     full_parser.add_argument("--model", help="Specific model name (e.g., llama2, gpt-4)")
     full_parser.add_argument("--api-key", help="LLM API key")
     full_parser.add_argument("--base-url", required=True, help="Base URL of application")
+    full_parser.add_argument("--locator-index", help="Path to locator index JSON (see 'index' command)")
+    full_parser.add_argument("-w", "--workers", type=int, help="Parallel workers for contracts and rendering")
+    full_parser.add_argument("--precompiled", help="Directory with precompiled templates (see 'precompile')")
+    full_parser.add_argument("--shared-browser", action="store_true",
+                             help="conftest: one browser per worker, fresh context per test")
+    full_parser.add_argument("--login-url", help="conftest: log in once per worker and reuse storage state")
 
     # Command: create-contracts (scenarios → contracts)
     contract_parser = subparsers.add_parser("contracts", help="Create JSON contracts from scenarios")
     contract_parser.add_argument("scenarios", help="Path to test scenarios JSON")
     contract_parser.add_argument("-o", "--output", default="test_contracts.json")
     contract_parser.add_argument("--base-url", help="Base URL of application")
+    contract_parser.add_argument("--locator-index", help="Path to locator index JSON (see 'index' command)")
+    contract_parser.add_argument("-w", "--workers", type=int, help="Generate contracts in N worker processes")
+
+    # Command: index (crawl pages → locator index)
+    index_parser = subparsers.add_parser("index", help="Crawl application pages and build locator index")
+    index_parser.add_argument("urls", nargs="+", help="Page URLs (or local HTML files) to index")
+    index_parser.add_argument("-o", "--output", default="locator_index.json")
+    index_parser.add_argument("--username", help="Log in with this user before crawling")
+    index_parser.add_argument("--password", help="Password for --username")
+    index_parser.add_argument("--headed", action="store_true", help="Show browser while crawling")
 
     args = parser.parse_args()
 
@@ -58,7 +91,11 @@ def main():
 
             generator = CodeGenerator(
                 framework=TestFramework[args.framework.upper()],
-                output_dir=args.output
+                template_dir=args.template_dir,
+                output_dir=args.output,
+                bytecode_cache_dir=None if args.no_bytecode_cache else DEFAULT_BYTECODE_CACHE_DIR,
+                precompiled_dir=args.precompiled,
+                incremental=args.incremental
             )
 
             # Загрузка контрактов
@@ -69,18 +106,33 @@ def main():
 
             # Генерация тестов
             print("\nGenerating test code...")
-            generated_files = generator.generate_batch(contracts)
+            report = generator.generate_batch_report(contracts, workers=args.workers)
+            generated_files = report.files
 
-            print(f"\n✓ Generated {len(generated_files)} test files:")
-            for file_path in generated_files:
+            print(f"\n✓ Generated {len(generated_files)} test files "
+                  f"in {report.duration:.2f}s ({report.files_per_second:.1f} files/s, "
+                  f"{report.workers} workers):")
+            for file_path in report.changed_files:
                 print(f"  - {file_path}")
 
+            if args.incremental:
+                print(f"\n  Unchanged (skipped): {len(report.skipped_files)}")
+                for file_path in report.removed_files:
+                    print(f"  Removed (orphaned): {file_path}")
+
+            if args.changed_list:
+                with open(args.changed_list, 'w', encoding='utf-8') as f:
+                    f.writelines(f"{file_path}\n" for file_path in report.changed_files)
+                print(f"\n✓ Changed files list: {args.changed_list}")
+
             # Генерация conftest.py
             if contracts:
                 conftest = generator.generate_conftest(
                     base_url=contracts[0].to_dict().get("base_url", "http://localhost"),
                     browser=contracts[0].browser,
-                    headless=contracts[0].headless
+                    headless=contracts[0].headless,
+                    shared_browser=args.shared_browser,
+                    login_url=args.login_url
                 )
                 print(f"\n✓ Generated conftest: {conftest}")
 
@@ -100,10 +152,13 @@ def main():
 
             # Генерация контрактов
             print("\nGenerating JSON contracts...")
-            contract_gen = JSONContractGenerator()
+            contract_gen = JSONContractGenerator(
+                locator_index=_load_locator_index(args.locator_index)
+            )
             contracts = contract_gen.generate_batch_contracts(
                 scenarios,
-                base_url=args.base_url
+                base_url=args.base_url,
+                workers=args.workers
             )
 
             # Экспорт
@@ -131,10 +186,13 @@ def main():
 
             # Step 3: Create JSON contracts
             print("[3/4] Creating JSON contracts...")
-            contract_gen = JSONContractGenerator()
+            contract_gen = JSONContractGenerator(
+                locator_index=_load_locator_index(args.locator_index)
+            )
             contracts = contract_gen.generate_batch_contracts(
                 scenarios,
-                base_url=args.base_url
+                base_url=args.base_url,
+                workers=args.workers
             )
             print(f"  ✓ Created {len(contracts)} test contracts")
 
@@ -142,19 +200,23 @@ def main():
             print("[4/4] Generating Playwright test code...")
             code_gen = CodeGenerator(
                 framework=TestFramework.PLAYWRIGHT,
-                output_dir=args.output
+                output_dir=args.output,
+                precompiled_dir=args.precompiled
             )
-            generated_files = code_gen.generate_batch(contracts)
+            report = code_gen.generate_batch_report(contracts, workers=args.workers)
+            generated_files = report.files
             conftest = code_gen.generate_conftest(
                 base_url=args.base_url,
                 browser="chromium",
-                headless=False
+                headless=False,
+                shared_browser=args.shared_browser,
+                login_url=args.login_url
             )
 
             print(f"\n✓ Pipeline complete!")
             print(f"  - Scenarios: {len(scenarios)}")
             print(f"  - Contracts: {len(contracts)}")
-            print(f"  - Test files: {len(generated_files)}")
+            print(f"  - Test files: {len(generated_files)} ({report.files_per_second:.1f} files/s)")
             print(f"  - Output dir: {args.output}")
 
             print(f"\nGenerated files:")
@@ -167,6 +229,46 @@ def main():
             print(f"  cd {args.output}")
             print(f"  pytest -v")
 
+        elif args.command == "precompile":
+            # Предкомпиляция шаблонов
+            generator = CodeGenerator(
+                framework=TestFramework[args.framework.upper()],
+                template_dir=args.template_dir,
+                output_dir=args.output
+            )
+            names = generator.precompile_templates(args.output)
+
+            print(f"✓ Precompiled {len(names)} templates to: {args.output}")
+            for name in names:
+                print(f"  - {name}")
+            print(f"\nUse: generate ... --precompiled {args.output}")
+
+        elif args.command == "index":
+            # Построение индекса локаторов
+            index = LocatorIndex()
+
+            html_files = [u for u in args.urls if Path(u).is_file()]
+            urls = [u for u in args.urls if u not in html_files]
+
+            for html_file in html_files:
+                print(f"Indexing static HTML: {html_file}")
+                index.add_html(html_file, Path(html_file).read_text(encoding='utf-8'))
+
+            if urls:
+                print(f"Crawling {len(urls)} pages with Playwright...")
+                setup = None
+                if args.username:
+                    def setup(page):
+                        page.goto(urls[0])
+                        page.fill('[data-test="username"]', args.username)
+                        page.fill('[data-test="password"]', args.password or "")
+                        page.click('[data-test="login-button"]')
+                        page.wait_for_load_state("domcontentloaded")
+                index.crawl(urls, headless=not args.headed, setup=setup)
+
+            index.save(args.output)
+            print(f"\n✓ Indexed {len(index)} elements on {len(index.pages)} pages: {args.output}")
+
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
         import traceback
@@ -174,5 +276,14 @@ def main():
         sys.exit(1)
 
 
+def _load_locator_index(path):
+    """Загрузка индекса локаторов, если путь указан"""
+    if not path:
+        return None
+    index = LocatorIndex.load(path)
+    print(f"Using locator index: {path} ({len(index)} elements)")
+    return index
+
+
 if __name__ == "__main__":
     main()
@@ -6,12 +6,19 @@ Code Generator
 """
 
 import os
-from typing import List, Dict, Any, Optional
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Callable
 from pathlib import Path
 from enum import Enum
-from jinja2 import Environment, FileSystemLoader, Template
+from jinja2 import (
+    Environment, FileSystemLoader, DictLoader, ChoiceLoader, ModuleLoader,
+    FileSystemBytecodeCache, Template, TemplateNotFound
+)
 
 from .json_contract import TestContract, ActionType, LocatorStrategy
+from .manifest import GenerationManifest, hash_contract, hash_text
 
 
 class TestFramework(Enum):
@@ -21,6 +28,273 @@ class TestFramework(Enum):
     PYTEST_PLAYWRIGHT = "pytest-playwright"
 
 
+# Встроенный шаблон Playwright теста
+DEFAULT_TEST_TEMPLATE = '''"""
+{{ contract.test_name }}
+
+{{ contract.description }}
+"""
+
+import pytest
+from playwright.sync_api import Page, expect
+
+
+@pytest.mark.{{ contract.test_type }}
+@pytest.mark.priority_{{ contract.priority }}
+{% for tag in contract.tags %}
+@pytest.mark.{{ tag }}
+{% endfor %}
+def {{ contract.test_id }}(page: Page):
+    """{{ contract.description }}"""
+
+    # Preconditions
+{% for precondition in contract.preconditions %}
+    # {{ precondition }}
+{% endfor %}
+
+    # Test steps
+{% for action in contract.actions %}
+    # {{ action.description }}
+{% if action.type == "navigate" %}
+    page.goto("{{ action.value }}")
+{% elif action.type == "click" %}
+    page.locator({{ action.locator | to_locator }}).click()
+{% elif action.type == "fill" %}
+    page.locator({{ action.locator | to_locator }}).fill("{{ action.value }}")
+{% elif action.type == "select" %}
+    page.locator({{ action.locator | to_locator }}).select_option("{{ action.value }}")
+{% elif action.type == "wait" %}
+    page.wait_for_timeout({{ action.value }})
+{% elif action.type == "assert" %}
+    expect(page.locator({{ action.locator | to_locator }})).to_be_visible()
+{% endif %}
+{% if action.expected_result %}
+    # Expected: {{ action.expected_result }}
+{% endif %}
+
+{% endfor %}
+
+    # Postconditions
+{% for postcondition in contract.postconditions %}
+    # {{ postcondition }}
+{% endfor %}
+'''
+
+# Встроенный шаблон Page Object
+DEFAULT_PAGE_OBJECT_TEMPLATE = '''"""
+{{ page_name }} Page Object
+
+Auto-generated Page Object Model
+"""
+
+from playwright.sync_api import Page
+
+
+class {{ page_name|title }}Page:
+    """{{ page_name }} page"""
+
+    def __init__(self, page: Page):
+        self.page = page
+{% if base_url %}
+        self.url = "{{ base_url }}"
+{% endif %}
+
+        # Locators
+{% for element_name, locator in locators.items() %}
+        self.{{ element_name }} = "{{ locator }}"
+{% endfor %}
+
+{% if base_url %}
+    def navigate(self):
+        """Navigate to {{ page_name }} page"""
+        self.page.goto(self.url)
+{% endif %}
+
+{% for element_name, locator in locators.items() %}
+    def get_{{ element_name }}(self):
+        """Get {{ element_name }} element"""
+        return self.page.locator(self.{{ element_name }})
+{% endfor %}
+'''
+
+# Встроенный шаблон conftest.py
+DEFAULT_CONFTEST_TEMPLATE = '''"""
+Pytest configuration for generated tests
+
+Auto-generated conftest.py
+"""
+
+{% if shared_browser %}
+import os
+
+{% endif %}
+import pytest
+from playwright.sync_api import sync_playwright
+
+
+@pytest.fixture(scope="session")
+def browser_context_args():
+    """Browser context configuration"""
+    return {
+        "base_url": "{{ base_url }}",
+        "viewport": {"width": 1920, "height": 1080},
+        "record_video_dir": "videos/" if not {{ headless }} else None
+    }
+
+
+{% if shared_browser %}
+@pytest.fixture(scope="session")
+def browser(playwright):
+    """One browser per worker, shared by all its tests"""
+    browser = playwright.{{ browser }}.launch(headless={{ headless }})
+    yield browser
+    browser.close()
+
+{% if login_url %}
+
+@pytest.fixture(scope="session")
+def auth_storage_state(browser, browser_context_args, tmp_path_factory):
+    """Log in once per worker and save the storage state"""
+    state_path = tmp_path_factory.getbasetemp() / "auth_storage_state.json"
+    context = browser.new_context(**browser_context_args)
+    page = context.new_page()
+    page.goto("{{ login_url }}")
+    page.fill('{{ login_selectors.username }}', os.getenv("TEST_USERNAME", "{{ username }}"))
+    page.fill('{{ login_selectors.password }}', os.getenv("TEST_PASSWORD", "{{ password }}"))
+    page.click('{{ login_selectors.submit }}')
+    page.wait_for_url("{{ login_success_url }}")
+    context.storage_state(path=str(state_path))
+    context.close()
+    return str(state_path)
+
+
+def pytest_configure(config):
+    """Register markers"""
+    config.addinivalue_line("markers", "authenticated: start the test logged in")
+
+{% endif %}
+
+@pytest.fixture(scope="function")
+def context(browser, browser_context_args, request):
+    """Fresh context for each test on the shared browser"""
+    context_args = dict(browser_context_args)
+{% if login_url %}
+    if request.node.get_closest_marker("authenticated"):
+        context_args["storage_state"] = request.getfixturevalue("auth_storage_state")
+{% endif %}
+    context = browser.new_context(**context_args)
+    yield context
+    context.close()
+
+
+@pytest.fixture(scope="function")
+def page(context):
+    """Create a new page for each test"""
+    page = context.new_page()
+    yield page
+    page.close()
+{% else %}
+@pytest.fixture(scope="function")
+def page(browser):
+    """Create a new page for each test"""
+    page = browser.new_page()
+    yield page
+    page.close()
+{% endif %}
+'''
+
+# Встроенные шаблоны, используемые если в template_dir нет файлового шаблона
+DEFAULT_TEMPLATES = {
+    "default/test.py.j2": DEFAULT_TEST_TEMPLATE,
+    "default/page_object.py.j2": DEFAULT_PAGE_OBJECT_TEMPLATE,
+    "default/conftest.py.j2": DEFAULT_CONFTEST_TEMPLATE,
+}
+
+# Селекторы формы логина по умолчанию (SauceDemo)
+DEFAULT_LOGIN_SELECTORS = {
+    "username": '[data-test="username"]',
+    "password": '[data-test="password"]',
+    "submit": '[data-test="login-button"]',
+}
+
+# Страница после успешного логина (glob для page.wait_for_url)
+DEFAULT_LOGIN_SUCCESS_URL = "**/inventory.html"
+
+# Кеш байткода Jinja2 по умолчанию: персональный каталог пользователя (0700,
+# владелец проверяется), а не общий путь во временном каталоге - кеш исполняется
+# при загрузке, и чужие файлы в нем означали бы выполнение чужого кода
+DEFAULT_BYTECODE_CACHE_DIR = "<user>"
+
+
+@dataclass
+class BatchGenerationReport:
+    """Результат пакетной генерации тестов"""
+    files: List[str] = field(default_factory=list)
+    changed_files: List[str] = field(default_factory=list)
+    skipped_files: List[str] = field(default_factory=list)
+    removed_files: List[str] = field(default_factory=list)
+    render_time: float = 0.0
+    write_time: float = 0.0
+    workers: int = 1
+
+    @property
+    def duration(self) -> float:
+        """Общее время генерации (сек)"""
+        return self.render_time + self.write_time
+
+    @property
+    def files_per_second(self) -> float:
+        """Пропускная способность генерации"""
+        if self.duration == 0:
+            return 0.0
+        return len(self.files) / self.duration
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "files": self.files,
+            "changed_files": self.changed_files,
+            "skipped_files": self.skipped_files,
+            "removed_files": self.removed_files,
+            "render_time": self.render_time,
+            "write_time": self.write_time,
+            "duration": self.duration,
+            "files_per_second": self.files_per_second,
+            "workers": self.workers
+        }
+
+
+# Хеш исходника модуля: фильтры и хелперы генератора тоже влияют на результат,
+# поэтому входят в ключ инкрементальной генерации вместе с шаблоном
+GENERATOR_SOURCE_HASH = hash_text(Path(__file__).read_text(encoding="utf-8"))
+
+
+# Генератор, созданный в процессе-воркере пула (шаблоны компилируются один раз на процесс)
+_worker_generator: Optional['CodeGenerator'] = None
+
+
+def _init_render_worker(
+    framework_value: str,
+    template_dir: str,
+    output_dir: str,
+    bytecode_cache_dir: Optional[str],
+    precompiled_dir: Optional[str]
+):
+    """Инициализация процесса-воркера для пакетного рендеринга"""
+    global _worker_generator
+    _worker_generator = CodeGenerator(
+        framework=TestFramework(framework_value),
+        template_dir=template_dir,
+        output_dir=output_dir,
+        bytecode_cache_dir=bytecode_cache_dir,
+        precompiled_dir=precompiled_dir
+    )
+
+
+def _render_in_worker(contract: TestContract) -> str:
+    """Рендеринг одного контракта в процессе-воркере"""
+    return _worker_generator.render_test(contract)
+
+
 class CodeGenerator:
     """
     Генератор кода автотестов из JSON-контрактов
@@ -33,7 +307,10 @@ class CodeGenerator:
         self,
         framework: TestFramework = TestFramework.PLAYWRIGHT,
         template_dir: Optional[str] = None,
-        output_dir: str = "generated_tests"
+        output_dir: str = "generated_tests",
+        bytecode_cache_dir: Optional[str] = DEFAULT_BYTECODE_CACHE_DIR,
+        precompiled_dir: Optional[str] = None,
+        incremental: bool = False
     ):
         """
         Инициализация генератора
@@ -42,8 +319,15 @@ class CodeGenerator:
             framework: Фреймворк для генерации
             template_dir: Директория с Jinja2 шаблонами
             output_dir: Директория для сохранения сгенерированных тестов
+            bytecode_cache_dir: Директория кеша байткода шаблонов
+                (None - без кеша, DEFAULT_BYTECODE_CACHE_DIR - персональный каталог)
+            precompiled_dir: Директория с предкомпилированными шаблонами
+                (см. precompile_templates), имеет приоритет над исходниками
+            incremental: Пропускать тесты, контракт и шаблон которых не изменились,
+                и удалять тесты удаленных контрактов (см. GenerationManifest)
         """
         self.framework = framework
+        self.incremental = incremental
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
@@ -55,8 +339,28 @@ class CodeGenerator:
             self.template_dir = Path(__file__).parent / "templates"
             self.template_dir.mkdir(exist_ok=True)
 
+        self.bytecode_cache_dir = bytecode_cache_dir
+        self.precompiled_dir = precompiled_dir
+
+        # Исходники шаблонов: файлы из template_dir, затем встроенные
+        self._source_loader = ChoiceLoader([
+            FileSystemLoader(str(self.template_dir)),
+            DictLoader(DEFAULT_TEMPLATES)
+        ])
+        loader = self._source_loader
+        if precompiled_dir and Path(precompiled_dir).is_dir():
+            loader = ChoiceLoader([ModuleLoader(precompiled_dir), self._source_loader])
+
+        bytecode_cache = None
+        if bytecode_cache_dir == DEFAULT_BYTECODE_CACHE_DIR:
+            bytecode_cache = FileSystemBytecodeCache()
+        elif bytecode_cache_dir:
+            Path(bytecode_cache_dir).mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir)
+
         self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.template_dir)),
+            loader=loader,
+            bytecode_cache=bytecode_cache,
             trim_blocks=True,
             lstrip_blocks=True
         )
@@ -65,6 +369,10 @@ class CodeGenerator:
         self.jinja_env.filters['to_python_var'] = self._to_python_var
         self.jinja_env.filters['to_locator'] = self._to_locator
 
+        # Разрешенные шаблоны (файловые или встроенные), компилируются один раз
+        self._templates: Dict[str, Template] = {}
+        self._template_hashes: Dict[str, str] = {}
+
     def generate_test_file(
         self,
         contract: TestContract,
@@ -84,46 +392,152 @@ class CodeGenerator:
         if not filename:
             filename = f"{contract.test_id}.py"
 
-        # Выбор шаблона в зависимости от фреймворка
-        template_name = f"{self.framework.value}_test.py.j2"
+        output_path = self.output_dir / filename
 
-        try:
-            template = self.jinja_env.get_template(template_name)
-        except Exception:
-            # Если шаблон не найден, используем встроенный
-            template = self._get_default_template()
+        # В инкрементальном режиме неизменившийся тест не перезаписывается
+        manifest = None
+        if self.incremental:
+            manifest = GenerationManifest(str(self.output_dir)).load()
+            contract_hash = hash_contract(contract)
+            template_hash = self._test_template_hash()
+            if manifest.is_up_to_date(filename, contract_hash, template_hash):
+                return str(output_path)
 
         # Генерация кода
-        code = template.render(
-            contract=contract,
-            framework=self.framework.value
-        )
+        code = self.render_test(contract)
 
         # Сохранение файла
-        output_path = self.output_dir / filename
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(code)
 
+        if manifest is not None:
+            manifest.record(filename, contract_hash, template_hash)
+            manifest.save()
+
         return str(output_path)
 
+    def render_test(self, contract: TestContract) -> str:
+        """
+        Рендеринг кода теста из контракта без записи на диск
+
+        Args:
+            contract: JSON-контракт теста
+
+        Returns:
+            Код теста
+        """
+        # Выбор шаблона в зависимости от фреймворка
+        template = self._resolve_template(
+            f"{self.framework.value}_test.py.j2",
+            self._get_default_template
+        )
+
+        # Шаблоны сравнивают action.type со строками и передают locator
+        # в фильтр to_locator как словарь, поэтому рендерим JSON-форму контракта
+        return template.render(
+            contract=contract.to_dict(),
+            framework=self.framework.value
+        )
+
     def generate_batch(
         self,
-        contracts: List[TestContract]
+        contracts: List[TestContract],
+        workers: Optional[int] = None
     ) -> List[str]:
         """
         Генерация нескольких тестов
 
         Args:
             contracts: Список контрактов
+            workers: Количество процессов для рендеринга (None - в текущем процессе)
 
         Returns:
             Список путей к сгенерированным файлам
         """
-        generated_files = []
-        for contract in contracts:
-            file_path = self.generate_test_file(contract)
-            generated_files.append(file_path)
-        return generated_files
+        return self.generate_batch_report(contracts, workers).files
+
+    def generate_batch_report(
+        self,
+        contracts: List[TestContract],
+        workers: Optional[int] = None
+    ) -> BatchGenerationReport:
+        """
+        Пакетная генерация тестов с отчетом о пропускной способности
+
+        Шаблон компилируется один раз (на процесс), контракты рендерятся
+        в пуле процессов, затем все файлы записываются за один проход.
+        В инкрементальном режиме рендерятся только измененные контракты.
+
+        Args:
+            contracts: Список контрактов
+            workers: Количество процессов для рендеринга (None - в текущем процессе)
+
+        Returns:
+            Отчет о генерации
+        """
+        report = BatchGenerationReport(workers=workers or 1)
+        filenames = [f"{contract.test_id}.py" for contract in contracts]
+
+        manifest = None
+        to_render = list(zip(contracts, filenames))
+        if self.incremental:
+            manifest = GenerationManifest(str(self.output_dir)).load()
+            template_hash = self._test_template_hash()
+            hashes = {
+                filename: hash_contract(contract)
+                for contract, filename in to_render
+            }
+            to_render = [
+                (contract, filename) for contract, filename in to_render
+                if not manifest.is_up_to_date(filename, hashes[filename], template_hash)
+            ]
+
+        start = time.perf_counter()
+        codes = self._render_batch([contract for contract, _ in to_render], workers)
+        report.render_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for (contract, filename), code in zip(to_render, codes):
+            output_path = self.output_dir / filename
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.write(code)
+            report.changed_files.append(str(output_path))
+            if manifest is not None:
+                manifest.record(filename, hashes[filename], template_hash)
+
+        if manifest is not None:
+            report.removed_files = manifest.remove_orphans(filenames)
+            manifest.save()
+        report.write_time = time.perf_counter() - start
+
+        changed = set(report.changed_files)
+        report.files = [str(self.output_dir / filename) for filename in filenames]
+        report.skipped_files = [path for path in report.files if path not in changed]
+
+        return report
+
+    def _render_batch(
+        self,
+        contracts: List[TestContract],
+        workers: Optional[int]
+    ) -> List[str]:
+        """Рендеринг контрактов в текущем процессе или в пуле процессов"""
+        if not workers or workers <= 1 or len(contracts) < 2:
+            return [self.render_test(contract) for contract in contracts]
+
+        chunksize = max(1, len(contracts) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_render_worker,
+            initargs=(
+                self.framework.value,
+                str(self.template_dir),
+                str(self.output_dir),
+                self.bytecode_cache_dir,
+                self.precompiled_dir
+            )
+        ) as pool:
+            return list(pool.map(_render_in_worker, contracts, chunksize=chunksize))
 
     def generate_page_object(
         self,
@@ -142,12 +556,10 @@ class CodeGenerator:
         Returns:
             Путь к сгенерированному файлу
         """
-        template_name = f"{self.framework.value}_page_object.py.j2"
-
-        try:
-            template = self.jinja_env.get_template(template_name)
-        except Exception:
-            template = self._get_default_page_object_template()
+        template = self._resolve_template(
+            f"{self.framework.value}_page_object.py.j2",
+            self._get_default_page_object_template
+        )
 
         code = template.render(
             page_name=page_name,
@@ -169,7 +581,13 @@ class CodeGenerator:
         self,
         base_url: str,
         browser: str = "chromium",
-        headless: bool = False
+        headless: bool = False,
+        shared_browser: bool = False,
+        login_url: Optional[str] = None,
+        username: str = "",
+        password: str = "",
+        login_selectors: Optional[Dict[str, str]] = None,
+        login_success_url: str = DEFAULT_LOGIN_SUCCESS_URL
     ) -> str:
         """
         Генерация conftest.py для pytest
@@ -178,21 +596,35 @@ class CodeGenerator:
             base_url: Базовый URL приложения
             browser: Браузер (chromium/firefox/webkit)
             headless: Headless режим
+            shared_browser: Один браузер на воркер (session scope)
+                и новый BrowserContext на каждый тест
+            login_url: Страница логина; если задана (вместе с shared_browser),
+                логин выполняется один раз на воркер, а тесты с маркером
+                authenticated получают сохраненный storage state
+            username: Пользователь по умолчанию (переопределяется TEST_USERNAME)
+            password: Пароль по умолчанию (переопределяется TEST_PASSWORD)
+            login_selectors: Селекторы формы логина (username/password/submit)
+            login_success_url: URL (glob) страницы после логина; storage state
+                сохраняется только после перехода на нее
 
         Returns:
             Путь к conftest.py
         """
-        template_name = "conftest.py.j2"
-
-        try:
-            template = self.jinja_env.get_template(template_name)
-        except Exception:
-            template = self._get_default_conftest_template()
+        template = self._resolve_template(
+            "conftest.py.j2",
+            self._get_default_conftest_template
+        )
 
         code = template.render(
             base_url=base_url,
             browser=browser,
             headless=headless,
+            shared_browser=shared_browser,
+            login_url=login_url,
+            username=username,
+            password=password,
+            login_selectors=login_selectors or DEFAULT_LOGIN_SELECTORS,
+            login_success_url=login_success_url,
             framework=self.framework.value
         )
 
@@ -202,6 +634,64 @@ class CodeGenerator:
 
         return str(output_path)
 
+    def precompile_templates(self, target_dir: str) -> List[str]:
+        """
+        Предкомпиляция всех шаблонов (файловых и встроенных) в Python модули
+
+        Каталог затем передается в precompiled_dir, и шаблоны загружаются
+        импортом модулей без парсинга и компиляции. После изменения
+        шаблонов каталог нужно пересобрать.
+
+        Args:
+            target_dir: Каталог для скомпилированных модулей
+
+        Returns:
+            Имена скомпилированных шаблонов
+        """
+        Path(target_dir).mkdir(parents=True, exist_ok=True)
+
+        # ModuleLoader не умеет перечислять шаблоны, компилируем из исходников
+        source_env = self.jinja_env.overlay(loader=self._source_loader)
+        source_env.compile_templates(
+            target_dir,
+            extensions=["j2"],
+            zip=None,
+            ignore_errors=False
+        )
+        return source_env.list_templates(extensions=["j2"])
+
+    def _resolve_template(
+        self,
+        template_name: str,
+        default_factory: Callable[[], Template]
+    ) -> Template:
+        """
+        Получение шаблона по имени с fallback на встроенный
+
+        Результат кешируется, поэтому поиск файла и компиляция
+        встроенного шаблона выполняются один раз.
+        """
+        if template_name not in self._templates:
+            try:
+                self._templates[template_name] = self.jinja_env.get_template(template_name)
+            except TemplateNotFound:
+                # Если шаблон не найден, используем встроенный
+                self._templates[template_name] = default_factory()
+        return self._templates[template_name]
+
+    def _test_template_hash(self) -> str:
+        """Хеш исходника шаблона теста (с учетом фреймворка и кода генератора)"""
+        template = self._resolve_template(
+            f"{self.framework.value}_test.py.j2",
+            self._get_default_template
+        )
+        if template.name not in self._template_hashes:
+            source, _, _ = self._source_loader.get_source(self.jinja_env, template.name)
+            self._template_hashes[template.name] = hash_text(
+                f"{self.framework.value}\n{GENERATOR_SOURCE_HASH}\n{source}"
+            )
+        return self._template_hashes[template.name]
+
     def _to_python_var(self, text: str) -> str:
         """Конвертация текста в валидное Python имя переменной"""
         var_name = text.lower().replace(" ", "_")
@@ -218,7 +708,8 @@ class CodeGenerator:
 
         if self.framework == TestFramework.PLAYWRIGHT:
             if strategy == "css":
-                return f'"{value}"'
+                # repr: CSS селекторы атрибутов содержат двойные кавычки
+                return repr(value)
             elif strategy == "xpath":
                 return f'"xpath={value}"'
             elif strategy == "data-testid":
@@ -232,124 +723,12 @@ class CodeGenerator:
 
     def _get_default_template(self) -> Template:
         """Встроенный шаблон Playwright теста"""
-        template_str = '''"""
-{{ contract.test_name }}
-
-{{ contract.description }}
-"""
-
-import pytest
-from playwright.sync_api import Page, expect
-
-
-@pytest.mark.{{ contract.test_type }}
-@pytest.mark.priority_{{ contract.priority }}
-{% for tag in contract.tags %}
-@pytest.mark.{{ tag }}
-{% endfor %}
-def {{ contract.test_id }}(page: Page):
-    """{{ contract.description }}"""
-
-    # Preconditions
-{% for precondition in contract.preconditions %}
-    # {{ precondition }}
-{% endfor %}
-
-    # Test steps
-{% for action in contract.actions %}
-    # {{ action.description }}
-{% if action.type == "navigate" %}
-    page.goto("{{ action.value }}")
-{% elif action.type == "click" %}
-    page.locator({{ action.locator | to_locator }}).click()
-{% elif action.type == "fill" %}
-    page.locator({{ action.locator | to_locator }}).fill("{{ action.value }}")
-{% elif action.type == "select" %}
-    page.locator({{ action.locator | to_locator }}).select_option("{{ action.value }}")
-{% elif action.type == "wait" %}
-    page.wait_for_timeout({{ action.value }})
-{% elif action.type == "assert" %}
-    expect(page.locator({{ action.locator | to_locator }})).to_be_visible()
-{% endif %}
-{% if action.expected_result %}
-    # Expected: {{ action.expected_result }}
-{% endif %}
-
-{% endfor %}
-
-    # Postconditions
-{% for postcondition in contract.postconditions %}
-    # {{ postcondition }}
-{% endfor %}
-'''
-        return Template(template_str)
+        return self.jinja_env.get_template("default/test.py.j2")
 
     def _get_default_page_object_template(self) -> Template:
         """Встроенный шаблон Page Object"""
-        template_str = '''"""
-{{ page_name }} Page Object
-
-Auto-generated Page Object Model
-"""
-
-from playwright.sync_api import Page
-
-
-class {{ page_name|title }}Page:
-    """{{ page_name }} page"""
-
-    def __init__(self, page: Page):
-        self.page = page
-{% if base_url %}
-        self.url = "{{ base_url }}"
-{% endif %}
-
-        # Locators
-{% for element_name, locator in locators.items() %}
-        self.{{ element_name }} = "{{ locator }}"
-{% endfor %}
-
-{% if base_url %}
-    def navigate(self):
-        """Navigate to {{ page_name }} page"""
-        self.page.goto(self.url)
-{% endif %}
-
-{% for element_name, locator in locators.items() %}
-    def get_{{ element_name }}(self):
-        """Get {{ element_name }} element"""
-        return self.page.locator(self.{{ element_name }})
-{% endfor %}
-'''
-        return Template(template_str)
+        return self.jinja_env.get_template("default/page_object.py.j2")
 
     def _get_default_conftest_template(self) -> Template:
         """Встроенный шаблон conftest.py"""
-        template_str = '''"""
-Pytest configuration for generated tests
-
-Auto-generated conftest.py
-"""
-
-import pytest
-from playwright.sync_api import sync_playwright
-
-
-@pytest.fixture(scope="session")
-def browser_context_args():
-    """Browser context configuration"""
-    return {
-        "base_url": "{{ base_url }}",
-        "viewport": {"width": 1920, "height": 1080},
-        "record_video_dir": "videos/" if not {{ headless }} else None
-    }
-
-
-@pytest.fixture(scope="function")
-def page(browser):
-    """Create a new page for each test"""
-    page = browser.new_page()
-    yield page
-    page.close()
-'''
-        return Template(template_str)
+        return self.jinja_env.get_template("default/conftest.py.j2")
@@ -6,13 +6,17 @@ JSON Contract Generator
 """
 
 import json
-from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from pathlib import Path
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
 from ..test_generation.models import TestScenario, TestStep
 
+if TYPE_CHECKING:
+    from .locator_index import LocatorIndex
+
 
 class ActionType(Enum):
     """Типы действий в тесте"""
@@ -192,6 +196,22 @@ class TestContract:
         )
 
 
+# Генератор процесса-воркера (задается initializer пула)
+_worker_generator: Optional['JSONContractGenerator'] = None
+
+
+def _init_contract_worker(generator: 'JSONContractGenerator'):
+    """Инициализация процесса-воркера: генератор с индексом локаторов передается один раз"""
+    global _worker_generator
+    _worker_generator = generator
+
+
+def _generate_in_worker(task) -> 'TestContract':
+    """Генерация одного контракта в процессе-воркере"""
+    scenario, base_url = task
+    return _worker_generator.generate_contract(scenario, base_url)
+
+
 class JSONContractGenerator:
     """
     Генератор JSON-контрактов из тест-сценариев
@@ -203,7 +223,8 @@ class JSONContractGenerator:
     def __init__(
         self,
         framework: str = "playwright",
-        use_llm_for_locators: bool = True
+        use_llm_for_locators: bool = True,
+        locator_index: Optional['LocatorIndex'] = None
     ):
         """
         Инициализация генератора
@@ -211,9 +232,11 @@ class JSONContractGenerator:
         Args:
             framework: Фреймворк для тестов (playwright/selenium)
             use_llm_for_locators: Использовать LLM для генерации локаторов
+            locator_index: Индекс реальных локаторов приложения (опционально)
         """
         self.framework = framework
         self.use_llm_for_locators = use_llm_for_locators
+        self.locator_index = locator_index
 
     def generate_contract(
         self,
@@ -255,13 +278,39 @@ class JSONContractGenerator:
     def generate_batch_contracts(
         self,
         scenarios: List[TestScenario],
-        base_url: Optional[str] = None
+        base_url: Optional[str] = None,
+        workers: Optional[int] = None
     ) -> List[TestContract]:
-        """Генерация контрактов для нескольких сценариев"""
-        return [
-            self.generate_contract(scenario, base_url)
-            for scenario in scenarios
-        ]
+        """
+        Генерация контрактов для нескольких сценариев
+
+        Args:
+            scenarios: Тест-сценарии
+            base_url: Базовый URL приложения
+            workers: Количество процессов (None - последовательно)
+
+        Returns:
+            Контракты в порядке исходных сценариев
+        """
+        if not workers or workers <= 1 or len(scenarios) < 2:
+            return [
+                self.generate_contract(scenario, base_url)
+                for scenario in scenarios
+            ]
+
+        # Процессы, а не потоки: генерация - чистый Python и упирается в GIL.
+        # Генератор (с индексом локаторов) копируется в каждый воркер один раз
+        chunksize = max(1, len(scenarios) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_contract_worker,
+            initargs=(self,)
+        ) as pool:
+            return list(pool.map(
+                _generate_in_worker,
+                [(scenario, base_url) for scenario in scenarios],
+                chunksize=chunksize
+            ))
 
     def export_to_json(
         self,
@@ -398,6 +447,12 @@ class JSONContractGenerator:
         Returns:
             Locator или None
         """
+        # Сначала ищем реальный селектор в индексе страниц
+        if self.locator_index is not None:
+            element = self.locator_index.lookup(text)
+            if element:
+                return element.to_locator()
+
         # Простые эвристики для определения локатора
         text_lower = text.lower()
 
@@ -0,0 +1,406 @@
+"""
+Locator Index
+=============
+
+Офлайн-индекс локаторов, построенный обходом страниц приложения.
+
+Индекс один раз собирается с помощью Playwright (или из статической копии HTML),
+сохраняется на диск и затем используется при генерации контрактов для
+нечеткого сопоставления текста шага с реально существующим селектором.
+"""
+
+import json
+import re
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable
+
+from .json_contract import Locator, LocatorStrategy
+
+
+# Слова, которые не несут информации об элементе
+STOP_WORDS = {
+    "a", "an", "the", "on", "in", "into", "to", "of", "for", "with", "and",
+    "click", "press", "tap", "enter", "type", "fill", "choose", "verify",
+    "assert", "check", "user", "page", "is", "are", "be", "should", "that",
+}
+
+# Слова-подсказки о типе элемента -> ARIA роль
+ROLE_HINTS = {
+    "button": "button",
+    "btn": "button",
+    "link": "link",
+    "field": "textbox",
+    "input": "textbox",
+    "textbox": "textbox",
+    "dropdown": "combobox",
+    "select": "combobox",
+    "menu": "button",
+}
+
+# Теги, которые попадают в индекс даже без data-test/id
+INTERACTIVE_TAGS = {"a", "button", "input", "select", "textarea"}
+
+# JS для сбора атрибутов элементов в браузере (тот же набор полей, что и у HTML парсера)
+CRAWL_SCRIPT = """
+() => {
+    const implicitRole = (el) => {
+        const tag = el.tagName.toLowerCase();
+        const type = (el.getAttribute('type') || '').toLowerCase();
+        if (tag === 'button') return 'button';
+        if (tag === 'a' && el.hasAttribute('href')) return 'link';
+        if (tag === 'select') return 'combobox';
+        if (tag === 'textarea') return 'textbox';
+        if (tag === 'input') {
+            if (['submit', 'button', 'reset'].includes(type)) return 'button';
+            if (type === 'checkbox') return 'checkbox';
+            return 'textbox';
+        }
+        return null;
+    };
+    const selector = '[data-test], [id], [name], [role], a, button, input, select, textarea';
+    return Array.from(document.querySelectorAll(selector)).map((el) => ({
+        tag: el.tagName.toLowerCase(),
+        data_test: el.getAttribute('data-test'),
+        element_id: el.getAttribute('id'),
+        name: el.getAttribute('name'),
+        role: el.getAttribute('role') || implicitRole(el),
+        text: ((el.innerText || el.value || '') + '').trim().slice(0, 80),
+        placeholder: el.getAttribute('placeholder'),
+    }));
+}
+"""
+
+
+def _split_identifier(value: str) -> List[str]:
+    """Разбиение идентификатора (kebab/snake/camelCase) на слова"""
+    value = re.sub(r"([a-z0-9])([A-Z])", r"\1 \2", value)
+    return [w for w in re.split(r"[^A-Za-z0-9]+", value.lower()) if w]
+
+
+def _implicit_role(tag: str, attrs: Dict[str, Optional[str]]) -> Optional[str]:
+    """Неявная ARIA роль элемента (как в CRAWL_SCRIPT)"""
+    input_type = (attrs.get("type") or "").lower()
+    if tag == "button":
+        return "button"
+    if tag == "a" and "href" in attrs:
+        return "link"
+    if tag == "select":
+        return "combobox"
+    if tag == "textarea":
+        return "textbox"
+    if tag == "input":
+        if input_type in ("submit", "button", "reset"):
+            return "button"
+        if input_type == "checkbox":
+            return "checkbox"
+        return "textbox"
+    return None
+
+
+@dataclass
+class IndexedElement:
+    """
+    Элемент страницы, сохраненный в индексе
+
+    Attributes:
+        page: URL (или имя) страницы, на которой найден элемент
+        tag: HTML тег
+        data_test: Значение атрибута data-test
+        element_id: Значение атрибута id
+        name: Значение атрибута name
+        role: ARIA роль (явная или неявная)
+        text: Видимый текст элемента
+        placeholder: Placeholder поля ввода
+    """
+    page: str
+    tag: str
+    data_test: Optional[str] = None
+    element_id: Optional[str] = None
+    name: Optional[str] = None
+    role: Optional[str] = None
+    text: str = ""
+    placeholder: Optional[str] = None
+
+    def tokens(self) -> Set[str]:
+        """Набор значимых слов, описывающих элемент"""
+        words: List[str] = []
+        for value in (self.data_test, self.element_id, self.name, self.placeholder):
+            if value:
+                words.extend(_split_identifier(value))
+        if self.text:
+            words.extend(_split_identifier(self.text))
+        return {w for w in words if w not in STOP_WORDS and w not in ROLE_HINTS}
+
+    def to_locator(self) -> Locator:
+        """Лучший реальный селектор элемента: data-test > id > name > text"""
+        if self.data_test:
+            return Locator(LocatorStrategy.CSS, f'[data-test="{self.data_test}"]')
+        if self.element_id:
+            return Locator(LocatorStrategy.ID, self.element_id)
+        if self.name:
+            return Locator(LocatorStrategy.CSS, f'[name="{self.name}"]')
+        return Locator(LocatorStrategy.TEXT, self.text)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "page": self.page,
+            "tag": self.tag,
+            "data_test": self.data_test,
+            "element_id": self.element_id,
+            "name": self.name,
+            "role": self.role,
+            "text": self.text,
+            "placeholder": self.placeholder
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'IndexedElement':
+        return cls(
+            page=data["page"],
+            tag=data["tag"],
+            data_test=data.get("data_test"),
+            element_id=data.get("element_id"),
+            name=data.get("name"),
+            role=data.get("role"),
+            text=data.get("text", ""),
+            placeholder=data.get("placeholder")
+        )
+
+
+class _ElementCollector(HTMLParser):
+    """HTML парсер, собирающий те же атрибуты, что и CRAWL_SCRIPT"""
+
+    def __init__(self, page: str):
+        super().__init__(convert_charrefs=True)
+        self.page = page
+        self.elements: List[IndexedElement] = []
+        # Открытые элементы, для которых накапливается текст
+        self._open: List[Tuple[str, IndexedElement, List[str]]] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        attr_map = dict(attrs)
+        indexable = (
+            tag in INTERACTIVE_TAGS
+            or any(attr_map.get(key) for key in ("data-test", "id", "name", "role"))
+        )
+        if not indexable:
+            return
+
+        element = IndexedElement(
+            page=self.page,
+            tag=tag,
+            data_test=attr_map.get("data-test"),
+            element_id=attr_map.get("id"),
+            name=attr_map.get("name"),
+            role=attr_map.get("role") or _implicit_role(tag, attr_map),
+            text=(attr_map.get("value") or "") if tag == "input" else "",
+            placeholder=attr_map.get("placeholder")
+        )
+        self.elements.append(element)
+
+        if tag not in ("input", "img", "br", "hr", "meta", "link"):
+            self._open.append((tag, element, []))
+
+    def handle_data(self, data: str):
+        for _, _, chunks in self._open:
+            chunks.append(data)
+
+    def handle_endtag(self, tag: str):
+        # Закрываем ближайший открытый элемент с этим тегом
+        for i in range(len(self._open) - 1, -1, -1):
+            open_tag, element, chunks = self._open[i]
+            if open_tag == tag:
+                element.text = " ".join("".join(chunks).split())[:80]
+                del self._open[i]
+                break
+
+
+class LocatorIndex:
+    """
+    Индекс реальных локаторов приложения
+
+    Хранит атрибуты data-test/id/name/role/text для элементов каждой
+    страницы и выполняет нечеткий поиск лучшего селектора по тексту шага.
+    Результаты поиска кешируются.
+    """
+
+    def __init__(self, min_score: float = 0.6, fuzzy_threshold: float = 0.8):
+        """
+        Инициализация индекса
+
+        Args:
+            min_score: Минимальная оценка совпадения для возврата элемента
+            fuzzy_threshold: Минимальная схожесть двух слов (0.0-1.0)
+        """
+        self.min_score = min_score
+        self.fuzzy_threshold = fuzzy_threshold
+        self.pages: Dict[str, List[IndexedElement]] = {}
+        self._cache: Dict[Tuple[str, Optional[str]], Optional[IndexedElement]] = {}
+
+    def __len__(self) -> int:
+        return sum(len(elements) for elements in self.pages.values())
+
+    def add_elements(self, page: str, elements: List[IndexedElement]):
+        """
+        Добавление (замена) элементов страницы
+
+        Args:
+            page: URL или имя страницы
+            elements: Элементы страницы
+        """
+        self.pages[page] = [e for e in elements if e.tokens()]
+        self._cache.clear()
+
+    def add_html(self, page: str, html: str):
+        """
+        Индексация статического HTML (например, сохраненной копии страницы)
+
+        Args:
+            page: URL или имя страницы
+            html: HTML разметка
+        """
+        collector = _ElementCollector(page)
+        collector.feed(html)
+        collector.close()
+        self.add_elements(page, collector.elements)
+
+    def crawl(
+        self,
+        urls: List[str],
+        headless: bool = True,
+        setup: Optional[Callable[[Any], None]] = None
+    ):
+        """
+        Обход страниц приложения с помощью Playwright
+
+        Все страницы открываются в одной вкладке, поэтому cookies
+        (например, после авторизации в setup) сохраняются между страницами.
+
+        Args:
+            urls: Список URL для обхода
+            headless: Headless режим браузера
+            setup: Функция подготовки (например, авторизация), получает Page
+        """
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(headless=headless)
+            page = browser.new_page()
+            try:
+                if setup:
+                    setup(page)
+                for url in urls:
+                    page.goto(url)
+                    page.wait_for_load_state("domcontentloaded")
+                    raw_elements = page.evaluate(CRAWL_SCRIPT)
+                    self.add_elements(url, [
+                        IndexedElement.from_dict({**raw, "page": url})
+                        for raw in raw_elements
+                    ])
+            finally:
+                browser.close()
+
+    def lookup(
+        self,
+        text: str,
+        page: Optional[str] = None
+    ) -> Optional[IndexedElement]:
+        """
+        Поиск элемента, лучше всего соответствующего тексту шага
+
+        Args:
+            text: Текст действия (например, "Click Login button")
+            page: Ограничить поиск одной страницей
+
+        Returns:
+            Найденный элемент или None
+        """
+        key = (text, page)
+        if key not in self._cache:
+            self._cache[key] = self._find_best(text, page)
+        return self._cache[key]
+
+    def save(self, path: str):
+        """Сохранение индекса в JSON файл"""
+        data = {
+            "version": "1.0",
+            "pages": {
+                page: [e.to_dict() for e in elements]
+                for page, elements in self.pages.items()
+            }
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str, **kwargs) -> 'LocatorIndex':
+        """Загрузка индекса из JSON файла"""
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        index = cls(**kwargs)
+        for page, elements in data.get("pages", {}).items():
+            index.add_elements(page, [IndexedElement.from_dict(e) for e in elements])
+        return index
+
+    def _find_best(
+        self,
+        text: str,
+        page: Optional[str]
+    ) -> Optional[IndexedElement]:
+        """Перебор элементов и выбор лучшего по оценке"""
+        words = _split_identifier(text)
+        role_hints = {ROLE_HINTS[w] for w in words if w in ROLE_HINTS}
+        step_tokens = {w for w in words if w not in STOP_WORDS and w not in ROLE_HINTS}
+        if not step_tokens:
+            return None
+
+        pages = [page] if page else list(self.pages)
+        best: Optional[IndexedElement] = None
+        best_score = 0.0
+
+        for page_key in pages:
+            for element in self.pages.get(page_key, []):
+                score = self._score(step_tokens, role_hints, element)
+                if score > best_score:
+                    best, best_score = element, score
+
+        return best if best_score >= self.min_score else None
+
+    def _score(
+        self,
+        step_tokens: Set[str],
+        role_hints: Set[str],
+        element: IndexedElement
+    ) -> float:
+        """
+        Оценка совпадения шага и элемента
+
+        Учитывает, какая доля слов элемента найдена в шаге (precision)
+        и какая доля слов шага описывает элемент (recall), плюс бонус
+        за совпадение типа элемента (button/link/field).
+        """
+        element_tokens = element.tokens()
+        matched = 0.0
+        for token in element_tokens:
+            similarity = max(self._similarity(token, s) for s in step_tokens)
+            if similarity >= self.fuzzy_threshold:
+                matched += similarity
+
+        precision = matched / len(element_tokens)
+        recall = min(matched / len(step_tokens), 1.0)
+        score = 0.7 * precision + 0.3 * recall
+
+        if role_hints and element.role in role_hints:
+            score += 0.1
+        return score
+
+    @staticmethod
+    def _similarity(a: str, b: str) -> float:
+        """Схожесть двух слов"""
+        if a == b:
+            return 1.0
+        return SequenceMatcher(None, a, b).ratio()
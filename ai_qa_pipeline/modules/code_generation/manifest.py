@@ -0,0 +1,139 @@
+"""
+Generation Manifest
+===================
+
+Манифест инкрементальной кодогенерации.
+
+Для каждого сгенерированного файла хранит хеш контракта и хеш шаблона,
+из которых он получен. Неизменившиеся файлы не перезаписываются, а файлы
+удаленных контрактов удаляются из output директории.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, List
+
+from .json_contract import TestContract
+
+
+def hash_text(text: str) -> str:
+    """SHA-256 хеш строки"""
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def hash_contract(contract: TestContract) -> str:
+    """Стабильный хеш контракта (не зависит от порядка ключей)"""
+    return hash_text(json.dumps(contract.to_dict(), sort_keys=True, ensure_ascii=False))
+
+
+@dataclass
+class ManifestEntry:
+    """Запись манифеста для одного сгенерированного файла"""
+    contract_hash: str
+    template_hash: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "contract_hash": self.contract_hash,
+            "template_hash": self.template_hash
+        }
+
+
+class GenerationManifest:
+    """
+    Манифест сгенерированных тестов
+
+    Хранится в output директории рядом с тестами
+    и учитывает только файлы, созданные из контрактов.
+    """
+
+    FILENAME = ".codegen_manifest.json"
+
+    def __init__(self, output_dir: str):
+        """
+        Инициализация манифеста
+
+        Args:
+            output_dir: Директория сгенерированных тестов
+        """
+        self.output_dir = Path(output_dir)
+        self.path = self.output_dir / self.FILENAME
+        self.entries: Dict[str, ManifestEntry] = {}
+
+    def load(self) -> 'GenerationManifest':
+        """Загрузка манифеста с диска (если существует)"""
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.entries = {
+                filename: ManifestEntry(**entry)
+                for filename, entry in data.get("files", {}).items()
+            }
+        return self
+
+    def save(self):
+        """Сохранение манифеста"""
+        data = {
+            "version": "1.0",
+            "files": {
+                filename: entry.to_dict()
+                for filename, entry in sorted(self.entries.items())
+            }
+        }
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+    def is_up_to_date(
+        self,
+        filename: str,
+        contract_hash: str,
+        template_hash: str
+    ) -> bool:
+        """
+        Проверка, что файл существует и получен из тех же контракта и шаблона
+
+        Args:
+            filename: Имя файла в output директории
+            contract_hash: Хеш текущего контракта
+            template_hash: Хеш текущего шаблона
+
+        Returns:
+            True если перегенерация не нужна
+        """
+        entry = self.entries.get(filename)
+        return (
+            entry is not None
+            and entry.contract_hash == contract_hash
+            and entry.template_hash == template_hash
+            and (self.output_dir / filename).exists()
+        )
+
+    def record(self, filename: str, contract_hash: str, template_hash: str):
+        """Запись хешей сгенерированного файла"""
+        self.entries[filename] = ManifestEntry(contract_hash, template_hash)
+
+    def remove_orphans(self, current_filenames: List[str]) -> List[str]:
+        """
+        Удаление файлов, контракты которых больше не существуют
+
+        Args:
+            current_filenames: Имена файлов текущего набора контрактов
+
+        Returns:
+            Пути удаленных файлов
+        """
+        current = set(current_filenames)
+        removed = []
+
+        for filename in list(self.entries):
+            if filename in current:
+                continue
+            output_path = self.output_dir / filename
+            if output_path.exists():
+                output_path.unlink()
+                removed.append(str(output_path))
+            del self.entries[filename]
+
+        return removed
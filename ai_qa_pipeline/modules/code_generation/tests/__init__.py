@@ -0,0 +1 @@
+"""Tests for Code Generation Module"""
@@ -0,0 +1,274 @@
+"""
+Tests for Code Generator
+"""
+
+import os
+import pytest
+from jinja2 import DictLoader, FileSystemLoader, ModuleLoader
+from ai_qa_pipeline.modules.code_generation import CodeGenerator
+from ai_qa_pipeline.modules.code_generation import code_generator
+from ai_qa_pipeline.modules.code_generation import json_contract as jc
+
+
+def make_contract(index: int) -> jc.TestContract:
+    """Contract with a navigate + click + assert flow"""
+    return jc.TestContract(
+        test_id=f"test_login_{index}",
+        test_name=f"Login {index}",
+        description="User logs in with valid credentials",
+        priority="high",
+        test_type="smoke",
+        tags=["login"],
+        actions=[
+            jc.TestAction(jc.ActionType.NAVIGATE, "Open login page", value="https://www.saucedemo.com/"),
+            jc.TestAction(
+                jc.ActionType.CLICK,
+                "Click Login button",
+                locator=jc.Locator(jc.LocatorStrategy.CSS, '[data-test="login-button"]')
+            ),
+            jc.TestAction(
+                jc.ActionType.ASSERT,
+                "Verify inventory is shown",
+                locator=jc.Locator(jc.LocatorStrategy.ID, "inventory_container")
+            ),
+        ]
+    )
+
+
+class TestCodeGenerator:
+    """Test suite for CodeGenerator"""
+
+    @pytest.fixture
+    def generator(self, tmp_path):
+        """Fixture for CodeGenerator writing into a temp dir"""
+        return CodeGenerator(output_dir=str(tmp_path / "generated"))
+
+    def test_generated_code_is_valid_python(self, generator):
+        """Test that rendered tests compile, including CSS attribute selectors"""
+        path = generator.generate_test_file(make_contract(0))
+
+        with open(path, encoding="utf-8") as f:
+            code = f.read()
+
+        compile(code, path, "exec")
+        assert 'page.goto("https://www.saucedemo.com/"' in code
+        assert """page.locator('[data-test="login-button"]').click(""" in code
+        assert 'expect(page.locator("#inventory_container")).to_be_visible(' in code
+
+    def test_template_is_resolved_once(self, generator):
+        """Test that the template is cached between contracts"""
+        generator.render_test(make_contract(0))
+        template = generator._templates["playwright_test.py.j2"]
+
+        generator.render_test(make_contract(1))
+
+        assert generator._templates["playwright_test.py.j2"] is template
+
+    def test_batch_report(self, generator):
+        """Test batch generation report and file order"""
+        contracts = [make_contract(i) for i in range(5)]
+
+        report = generator.generate_batch_report(contracts)
+
+        assert [p.split("/")[-1] for p in report.files] == [
+            f"test_login_{i}.py" for i in range(5)
+        ]
+        assert report.files_per_second > 0
+
+    def test_parallel_batch_matches_sequential(self, generator, tmp_path):
+        """Test that rendering in a process pool produces identical files"""
+        contracts = [make_contract(i) for i in range(8)]
+        parallel = CodeGenerator(output_dir=str(tmp_path / "parallel"))
+
+        sequential_files = generator.generate_batch(contracts)
+        parallel_files = parallel.generate_batch(contracts, workers=2)
+
+        for seq_path, par_path in zip(sequential_files, parallel_files):
+            with open(seq_path, encoding="utf-8") as a, open(par_path, encoding="utf-8") as b:
+                assert a.read() == b.read()
+
+    def test_default_templates_use_environment_filters(self, generator):
+        """Test that built-in templates are compiled with custom filters"""
+        code = generator._get_default_template().render(contract=make_contract(0).to_dict())
+
+        assert """page.locator('[data-test="login-button"]').click()""" in code
+
+    def test_precompiled_templates(self, generator, tmp_path, monkeypatch):
+        """Test rendering from precompiled template modules"""
+        precompiled_dir = tmp_path / "precompiled"
+        names = generator.precompile_templates(str(precompiled_dir))
+
+        assert "playwright_test.py.j2" in names
+        assert "default/test.py.j2" in names
+
+        precompiled = CodeGenerator(
+            output_dir=str(tmp_path / "from_modules"),
+            precompiled_dir=str(precompiled_dir)
+        )
+        contract = make_contract(0)
+        expected = generator.render_test(contract)
+
+        def read_source(*args, **kwargs):
+            raise AssertionError("template parsed from source")
+
+        # Шаблоны должны загружаться импортом модулей, без исходников
+        monkeypatch.setattr(FileSystemLoader, "get_source", read_source)
+        monkeypatch.setattr(DictLoader, "get_source", read_source)
+
+        assert isinstance(precompiled.jinja_env.loader.loaders[0], ModuleLoader)
+        assert precompiled.render_test(contract) == expected
+
+    def test_bytecode_cache_is_populated(self, tmp_path):
+        """Test that compiled templates are stored in the bytecode cache"""
+        cache_dir = tmp_path / "bytecode"
+        generator = CodeGenerator(
+            output_dir=str(tmp_path / "generated"),
+            bytecode_cache_dir=str(cache_dir)
+        )
+
+        generator.render_test(make_contract(0))
+
+        assert any(cache_dir.iterdir())
+
+    def test_default_bytecode_cache_is_private(self, tmp_path):
+        """Test that the default bytecode cache is a per-user 0700 directory"""
+        generator = CodeGenerator(output_dir=str(tmp_path / "generated"))
+
+        directory = generator.jinja_env.bytecode_cache.directory
+        info = os.stat(directory)
+
+        assert info.st_uid == os.getuid()
+        assert info.st_mode & 0o077 == 0
+
+
+class TestIncrementalGeneration:
+    """Test suite for manifest-based incremental generation"""
+
+    @pytest.fixture
+    def generator(self, tmp_path):
+        """Fixture for incremental CodeGenerator"""
+        return CodeGenerator(output_dir=str(tmp_path / "generated"), incremental=True)
+
+    def test_unchanged_contracts_are_skipped(self, generator):
+        """Test that a second run does not rewrite unchanged tests"""
+        contracts = [make_contract(i) for i in range(3)]
+
+        first = generator.generate_batch_report(contracts)
+        mtimes = {path: os.stat(path).st_mtime_ns for path in first.files}
+        second = generator.generate_batch_report(contracts)
+
+        assert len(first.changed_files) == 3
+        assert second.changed_files == []
+        assert second.skipped_files == first.files
+        assert {path: os.stat(path).st_mtime_ns for path in second.files} == mtimes
+
+    def test_only_changed_contract_is_regenerated(self, generator):
+        """Test that editing one contract regenerates only its file"""
+        contracts = [make_contract(i) for i in range(3)]
+        generator.generate_batch_report(contracts)
+
+        contracts[1].description = "Updated description"
+        report = generator.generate_batch_report(contracts)
+
+        assert [os.path.basename(p) for p in report.changed_files] == ["test_login_1.py"]
+
+    def test_orphaned_files_are_removed(self, generator):
+        """Test that tests of deleted contracts are removed"""
+        contracts = [make_contract(i) for i in range(3)]
+        first = generator.generate_batch_report(contracts)
+
+        report = generator.generate_batch_report(contracts[:2])
+
+        assert report.removed_files == [first.files[2]]
+        assert not os.path.exists(first.files[2])
+
+    def test_template_change_regenerates_all(self, generator, tmp_path):
+        """Test that a different template invalidates all outputs"""
+        contracts = [make_contract(i) for i in range(2)]
+        generator.generate_batch_report(contracts)
+
+        template_dir = tmp_path / "templates"
+        template_dir.mkdir()
+        (template_dir / "playwright_test.py.j2").write_text("# {{ contract.test_id }}\n")
+        custom = CodeGenerator(
+            template_dir=str(template_dir),
+            output_dir=str(generator.output_dir),
+            incremental=True
+        )
+
+        report = custom.generate_batch_report(contracts)
+
+        assert len(report.changed_files) == 2
+
+    def test_generator_change_regenerates_all(self, generator, monkeypatch):
+        """Test that a change in generator code (filters, helpers) invalidates all outputs"""
+        contracts = [make_contract(i) for i in range(2)]
+        generator.generate_batch_report(contracts)
+
+        monkeypatch.setattr(code_generator, "GENERATOR_SOURCE_HASH", "changed")
+        updated = CodeGenerator(output_dir=str(generator.output_dir), incremental=True)
+
+        report = updated.generate_batch_report(contracts)
+
+        assert len(report.changed_files) == 2
+
+
+class TestConftestGeneration:
+    """Test suite for generated conftest.py"""
+
+    def read_conftest(self, tmp_path, **kwargs):
+        generator = CodeGenerator(output_dir=str(tmp_path / "generated"))
+        path = generator.generate_conftest(base_url="https://www.saucedemo.com", **kwargs)
+        with open(path, encoding="utf-8") as f:
+            code = f.read()
+        compile(code, path, "exec")
+        return code
+
+    def test_default_conftest_builds_context_per_page(self, tmp_path):
+        """Test default conftest keeps the old per-page context fixture"""
+        code = self.read_conftest(tmp_path)
+
+        assert "def page(browser: Browser, browser_context_args: dict)" in code
+        assert "auth_storage_state" not in code
+
+    def test_shared_browser_conftest(self, tmp_path):
+        """Test session-scoped browser with per-test contexts"""
+        code = self.read_conftest(tmp_path, shared_browser=True, browser="firefox")
+
+        assert '@pytest.fixture(scope="session")\ndef browser(' in code
+        assert "def browser(playwright: Playwright," in code
+        assert "playwright.firefox.launch(" in code
+        assert "sync_playwright" not in code
+        assert "def context(" in code
+        assert "auth_storage_state" not in code
+
+    def test_shared_browser_with_login(self, tmp_path):
+        """Test storage-state reuse for authenticated tests"""
+        code = self.read_conftest(
+            tmp_path,
+            shared_browser=True,
+            login_url="https://www.saucedemo.com/",
+            username="standard_user"
+        )
+
+        assert "def auth_storage_state(" in code
+        assert 'page.click(\'[data-test="login-button"]\')' in code
+        assert 'page.wait_for_url("**/inventory.html")' in code
+        assert 'os.getenv("TEST_USERNAME", "standard_user")' in code
+        assert 'get_closest_marker("authenticated")' in code
+
+    def test_builtin_conftest_matches_file_template(self, tmp_path):
+        """Test built-in conftest also waits for login and uses the playwright fixture"""
+        generator = CodeGenerator(output_dir=str(tmp_path / "generated"), template_dir=str(tmp_path / "none"))
+        path = generator.generate_conftest(
+            base_url="https://www.saucedemo.com",
+            shared_browser=True,
+            login_url="https://www.saucedemo.com/"
+        )
+        with open(path, encoding="utf-8") as f:
+            code = f.read()
+        compile(code, path, "exec")
+
+        assert "def browser(playwright):" in code
+        assert 'page.wait_for_url("**/inventory.html")' in code
+        assert "wait_for_load_state" not in code
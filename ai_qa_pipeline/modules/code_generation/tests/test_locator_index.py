@@ -0,0 +1,106 @@
+"""
+Tests for Locator Index
+"""
+
+import pytest
+from pathlib import Path
+from ai_qa_pipeline.modules.code_generation import LocatorIndex, JSONContractGenerator
+from ai_qa_pipeline.modules.code_generation.json_contract import LocatorStrategy
+
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+class TestLocatorIndex:
+    """Test suite for LocatorIndex"""
+
+    @pytest.fixture
+    def index(self):
+        """Fixture with index built from static SauceDemo pages"""
+        index = LocatorIndex()
+        for name in ("saucedemo_login.html", "saucedemo_inventory.html"):
+            index.add_html(name, (FIXTURES_DIR / name).read_text(encoding="utf-8"))
+        return index
+
+    def test_static_html_is_indexed(self, index):
+        """Test that data-test/id/role/text attributes are captured"""
+        login_elements = index.pages["saucedemo_login.html"]
+        login_button = next(e for e in login_elements if e.data_test == "login-button")
+
+        assert login_button.tag == "input"
+        assert login_button.role == "button"
+        assert login_button.text == "Login"
+
+    def test_lookup_login_button(self, index):
+        """Test exact lookup of a button by step text"""
+        element = index.lookup("Click Login button")
+
+        assert element is not None
+        assert element.to_locator().strategy == LocatorStrategy.CSS
+        assert element.to_locator().value == '[data-test="login-button"]'
+
+    def test_lookup_prefers_full_match(self, index):
+        """Test that the most specific element wins among similar ones"""
+        element = index.lookup("Add Sauce Labs Backpack to cart")
+
+        assert element.data_test == "add-to-cart-sauce-labs-backpack"
+
+    def test_lookup_is_fuzzy(self, index):
+        """Test that typos in step text still resolve"""
+        element = index.lookup("Press Logn button")
+
+        assert element.data_test == "login-button"
+
+    def test_lookup_unknown_element(self, index):
+        """Test that unrelated text does not resolve to a random element"""
+        assert index.lookup("Click Checkout button") is None
+
+    def test_lookup_is_cached(self, index):
+        """Test that repeated lookups are served from cache"""
+        first = index.lookup("Enter username in the username field")
+        index.pages.clear()
+
+        assert index.lookup("Enter username in the username field") is first
+
+    def test_save_and_load(self, index, tmp_path):
+        """Test persistence of the index to disk"""
+        path = tmp_path / "locator_index.json"
+        index.save(str(path))
+
+        loaded = LocatorIndex.load(str(path))
+
+        assert len(loaded) == len(index)
+        assert loaded.lookup("Click Login button").data_test == "login-button"
+
+    def test_contract_generator_uses_index(self, index):
+        """Test that contract generation resolves locators via the index"""
+        generator = JSONContractGenerator(locator_index=index)
+
+        locator = generator._infer_locator_from_text("Enter password in the password field")
+
+        assert locator.value == '[data-test="password"]'
+
+    def test_batch_contracts_in_worker_processes(self, index):
+        """Test that process-parallel generation matches sequential, index included"""
+        from ai_qa_pipeline.modules.test_generation.models import TestScenario, TestStep, TestPriority, TestType
+
+        scenarios = [
+            TestScenario(
+                title=f"Login scenario {n}",
+                description="Login with valid credentials",
+                priority=TestPriority.HIGH,
+                test_type=TestType.FUNCTIONAL,
+                steps=[
+                    TestStep("Enter password in the password field", "Password entered"),
+                    TestStep("Click Login button", "Inventory opened"),
+                ]
+            )
+            for n in range(4)
+        ]
+        generator = JSONContractGenerator(locator_index=index)
+
+        sequential = generator.generate_batch_contracts(scenarios)
+        parallel = generator.generate_batch_contracts(scenarios, workers=2)
+
+        assert [c.to_dict() for c in parallel] == [c.to_dict() for c in sequential]
+        assert parallel[0].actions[0].locator.value == '[data-test="password"]'
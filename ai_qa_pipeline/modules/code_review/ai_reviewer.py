@@ -189,15 +189,40 @@ class AICodeReviewer:
         dir_path = Path(directory)
         files = list(dir_path.rglob(pattern))
 
+        return self.review_files([str(file_path) for file_path in files])
+
+    def review_files(self, files: List[str]) -> AIReviewResult:
+        """
+        Review списка файлов (например, только измененных при кодогенерации)
+
+        Args:
+            files: Пути к файлам
+
+        Returns:
+            Агрегированный результат
+        """
+        if not files:
+            # Инкрементальная генерация ничего не изменила: проверять нечего
+            return AIReviewResult(
+                overall_score=100.0,
+                total_comments=0,
+                critical=0,
+                major=0,
+                minor=0,
+                suggestions=0,
+                summary="No changed files to review",
+                approved=True
+            )
+
         all_comments = []
         total_score = 0.0
 
         for file_path in files:
-            result = self.review_file(str(file_path))
+            result = self.review_file(file_path)
             all_comments.extend(result.comments)
             total_score += result.overall_score
 
-        avg_score = total_score / len(files) if files else 0.0
+        avg_score = total_score / len(files)
 
         # Подсчет комментариев по severity
         critical = sum(1 for c in all_comments if c.severity == ReviewSeverity.CRITICAL)
@@ -25,7 +25,8 @@ def main():
 
     # Command: lint (static analysis)
     lint_parser = subparsers.add_parser("lint", help="Run static code analysis")
-    lint_parser.add_argument("path", help="File or directory to lint")
+    lint_parser.add_argument("path", nargs="?", default=".", help="File or directory to lint")
+    lint_parser.add_argument("--files-from", help="Only process files listed in this file (e.g. codegen --changed-list)")
     lint_parser.add_argument("--pylint", action="store_true", default=True)
     lint_parser.add_argument("--flake8", action="store_true", default=True)
     lint_parser.add_argument("--mypy", action="store_true", default=True)
@@ -35,7 +36,8 @@ def main():
 
     # Command: ai-review
     ai_parser = subparsers.add_parser("ai-review", help="AI-powered code review")
-    ai_parser.add_argument("path", help="File or directory to review")
+    ai_parser.add_argument("path", nargs="?", default=".", help="File or directory to review")
+    ai_parser.add_argument("--files-from", help="Only process files listed in this file (e.g. codegen --changed-list)")
     ai_parser.add_argument("--llm", choices=["openai", "anthropic", "ollama"], default="openai")
     ai_parser.add_argument("--api-key", help="LLM API key")
     ai_parser.add_argument("--context", help="Additional context for review")
@@ -44,7 +46,8 @@ def main():
 
     # Command: full (lint + ai-review)
     full_parser = subparsers.add_parser("full", help="Full review: lint + AI")
-    full_parser.add_argument("path", help="File or directory to review")
+    full_parser.add_argument("path", nargs="?", default=".", help="File or directory to review")
+    full_parser.add_argument("--files-from", help="Only process files listed in this file (e.g. codegen --changed-list)")
     full_parser.add_argument("--llm", choices=["openai", "anthropic", "ollama"], default="openai")
     full_parser.add_argument("--api-key", help="LLM API key")
     full_parser.add_argument("-o", "--output", help="Save combined report")
@@ -68,9 +71,11 @@ def main():
                 fail_on_error=args.fail_on_error
             )
 
-            # Lint file or directory
+            # Lint file, directory or list of changed files
             path = Path(args.path)
-            if path.is_file():
+            if args.files_from:
+                result = linter.lint_files(_read_files_list(args.files_from))
+            elif path.is_file():
                 result = linter.lint_file(args.path)
             else:
                 result = linter.lint_directory(args.path)
@@ -97,9 +102,11 @@ def main():
                 api_key=args.api_key
             )
 
-            # Review file or directory
+            # Review file, directory or list of changed files
             path = Path(args.path)
-            if path.is_file():
+            if args.files_from:
+                result = reviewer.review_files(_read_files_list(args.files_from))
+            elif path.is_file():
                 result = reviewer.review_file(args.path, context=args.context)
             else:
                 result = reviewer.review_directory(args.path)
@@ -126,7 +133,10 @@ def main():
             linter = CodeLinter()
 
             path = Path(args.path)
-            if path.is_file():
+            changed_files = _read_files_list(args.files_from) if args.files_from else None
+            if changed_files is not None:
+                lint_result = linter.lint_files(changed_files)
+            elif path.is_file():
                 lint_result = linter.lint_file(args.path)
             else:
                 lint_result = linter.lint_directory(args.path)
@@ -141,7 +151,9 @@ def main():
                 api_key=args.api_key
             )
 
-            if path.is_file():
+            if changed_files is not None:
+                ai_result = reviewer.review_files(changed_files)
+            elif path.is_file():
                 ai_result = reviewer.review_file(args.path)
             else:
                 ai_result = reviewer.review_directory(args.path)
@@ -184,5 +196,11 @@ Issues: {lint_result.total_issues}
         sys.exit(1)
 
 
+def _read_files_list(path):
+    """Чтение списка файлов (по одному пути в строке)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
 if __name__ == "__main__":
     main()
@@ -145,13 +145,26 @@ class CodeLinter:
             Агрегированный результат
         """
         dir_path = Path(directory)
-        all_issues = []
 
         # Найти все Python файлы
         python_files = list(dir_path.rglob("*.py"))
 
-        for file_path in python_files:
-            result = self.lint_file(str(file_path))
+        return self.lint_files([str(file_path) for file_path in python_files])
+
+    def lint_files(self, file_paths: List[str]) -> LintResult:
+        """
+        Анализ списка файлов (например, только измененных при кодогенерации)
+
+        Args:
+            file_paths: Пути к Python файлам
+
+        Returns:
+            Агрегированный результат
+        """
+        all_issues = []
+
+        for file_path in file_paths:
+            result = self.lint_file(file_path)
             all_issues.extend(result.issues)
 
         return self._aggregate_results(all_issues)
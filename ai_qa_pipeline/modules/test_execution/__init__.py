@@ -5,6 +5,6 @@ Test Execution Module
 Модуль для выполнения автотестов с расширенным логированием.
 """
 
-from .executor import TestExecutor, ExecutionResult
+from .executor import TestExecutor, ExecutionResult, TestResult
 
-__all__ = ['TestExecutor', 'ExecutionResult']
+__all__ = ['TestExecutor', 'ExecutionResult', 'TestResult']
@@ -0,0 +1,239 @@
+"""
+Test Execution CLI
+==================
+
+Command-line интерфейс для запуска тестов, оценки расписаний и просмотра истории результатов.
+"""
+
+import argparse
+import os
+import random
+import signal
+import sys
+import time
+
+from .daemon import DEFAULT_SOCKET_PATH, TestDaemon
+from .executor import TestExecutor
+from .results_store import DEFAULT_RESULTS_DB, ResultsStore
+from .scheduling import DurationStore, DEFAULT_DURATIONS_FILE, SIMULATED_STRATEGIES, benchmark_strategies
+
+
+def main():
+    """CLI entry point"""
+    parser = argparse.ArgumentParser(
+        description="Test Execution with duration-based scheduling"
+    )
+
+    subparsers = parser.add_subparsers(dest="command", help="Available commands")
+
+    # Command: run (pytest + xdist)
+    run_parser = subparsers.add_parser("run", help="Run tests with pytest-xdist")
+    run_parser.add_argument("tests_dir", help="Directory with tests")
+    run_parser.add_argument("pattern", nargs="?", default="test_*.py", help="Test file pattern")
+    run_parser.add_argument("-n", "--workers", type=_workers, default="auto",
+                            help="Parallel xdist workers or 'auto' (by CPU count and free memory)")
+    run_parser.add_argument("--adaptive", type=int, metavar="BATCHES",
+                            help="Run in N batches, rescaling workers by CPU/memory between them")
+    run_parser.add_argument("-m", "--marker", action="append", help="Pytest marker filter (repeatable)")
+    run_parser.add_argument("--headed", action="store_true", help="Show browser")
+    run_parser.add_argument("--stream", action="store_true", help="Print results as tests finish")
+    run_parser.add_argument("--duration-schedule", action="store_true",
+                            help="Balance workers by historical durations (LPT)")
+    run_parser.add_argument("--durations-file", help=f"Durations JSON (default: <tests_dir>/{DEFAULT_DURATIONS_FILE})")
+    run_parser.add_argument("--shard", help="Run only shard i/N (for splitting between CI machines)")
+    run_parser.add_argument("--record-impact", action="store_true",
+                            help="Record which project files each test touches")
+    run_parser.add_argument("--impact-diff", metavar="REF",
+                            help="Run only tests impacted by changes since git REF")
+    run_parser.add_argument("--run-rest", action="store_true",
+                            help="With --impact-diff: run remaining tests after impacted ones")
+    run_parser.add_argument("--prioritize", action="store_true",
+                            help="Run recently failed, changed and fast high-signal tests first")
+    run_parser.add_argument("--maxfail", type=int, help="Stop after N failures")
+    run_parser.add_argument("--reruns", type=int, default=0,
+                            help="Rerun each failure up to N times in isolation to detect flaky tests")
+    run_parser.add_argument("--skip-quarantined", action="store_true",
+                            help="Do not run quarantined (chronically flaky) tests")
+    run_parser.add_argument("--daemon", metavar="SOCKET", help="Run in a warm test daemon (see 'daemon')")
+    run_parser.add_argument("--trace", action="store_true", help="Keep Playwright traces of failed tests")
+    run_parser.add_argument("--video", action="store_true", help="Keep videos of failed tests")
+
+    # Command: daemon (warm pytest/Playwright process serving runs over a local socket)
+    daemon_parser = subparsers.add_parser("daemon", help="Start a warm test daemon for repeated runs")
+    daemon_parser.add_argument("--socket", default=DEFAULT_SOCKET_PATH,
+                               help=f"Unix socket path, owner-only access (default: {DEFAULT_SOCKET_PATH})")
+    daemon_parser.add_argument("--no-browser", action="store_true", help="Do not start a shared Chromium")
+    daemon_parser.add_argument("--headed", action="store_true", help="Show the shared browser")
+    daemon_parser.add_argument("--address-file", help="Write the socket path to this file when ready")
+
+    # Command: history (queries over the SQLite results database)
+    history_parser = subparsers.add_parser("history", help="Show duration percentiles, pass-rate trend, slowest tests")
+    history_parser.add_argument("tests_dir", help="Directory with tests")
+    history_parser.add_argument("--db", help=f"Results database (default: <tests_dir>/{DEFAULT_RESULTS_DB})")
+    history_parser.add_argument("--runs", type=int, default=20, help="Number of recent runs to analyze")
+    history_parser.add_argument("--limit", type=int, default=10, help="Number of slowest tests to show")
+    history_parser.add_argument("--test", help="Show trend and percentiles of a single test")
+
+    # Command: benchmark (simulated makespan of distribution strategies)
+    bench_parser = subparsers.add_parser("benchmark", help="Compare makespan of naive and LPT distribution")
+    source = bench_parser.add_mutually_exclusive_group()
+    source.add_argument("--durations-file", default=DEFAULT_DURATIONS_FILE,
+                        help="Historical durations JSON")
+    source.add_argument("--synthetic", type=int, help="Generate N synthetic tests instead")
+    bench_parser.add_argument("-w", "--workers", type=int, nargs="+", default=[2, 4, 8],
+                              help="Worker / machine counts to simulate")
+    bench_parser.add_argument("--seed", type=int, default=42, help="Seed for --synthetic")
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    try:
+        if args.command == "run":
+            executor = TestExecutor(
+                args.tests_dir,
+                workers=args.workers,
+                headless=not args.headed,
+                duration_schedule=args.duration_schedule,
+                durations_file=args.durations_file,
+                shard=args.shard,
+                record_impact=args.record_impact,
+                prioritize=args.prioritize,
+                max_failures=args.maxfail,
+                reruns=args.reruns,
+                skip_quarantined=args.skip_quarantined,
+                daemon_address=args.daemon,
+                capture_video=args.video,
+                capture_trace=args.trace
+            )
+
+            on_result = None
+            if args.stream:
+                def on_result(test):
+                    print(f"  {test.status.upper():7} {test.duration:6.2f}s  {test.test_id}")
+
+            if args.impact_diff:
+                result = executor.run_impacted(
+                    diff_base=args.impact_diff,
+                    run_rest=args.run_rest,
+                    test_pattern=args.pattern,
+                    markers=args.marker,
+                    on_result=on_result
+                )
+            elif args.adaptive:
+                result = executor.run_adaptive(
+                    args.pattern,
+                    markers=args.marker,
+                    batches=args.adaptive,
+                    on_result=on_result
+                )
+            else:
+                result = executor.run_tests(args.pattern, markers=args.marker, on_result=on_result)
+
+            print(f"\n✓ {result.total} tests in {result.duration:.1f}s: "
+                  f"{result.passed} passed, {result.failed} failed, "
+                  f"{result.skipped} skipped, {result.errors} errors, {result.flaky} flaky")
+            if result.failed or result.errors:
+                sys.exit(1)
+
+        elif args.command == "history":
+            db_path = args.db or os.path.join(args.tests_dir, DEFAULT_RESULTS_DB)
+            if not os.path.exists(db_path):
+                print(f"✗ No results database at {db_path}: run tests first")
+                sys.exit(1)
+            store = ResultsStore(db_path)
+
+            trend = store.pass_rate_trend(args.test, last_runs=args.runs)
+            print(f"\n✓ Pass-rate trend ({args.test or 'all tests'}, last {len(trend)} runs):")
+            for run in trend:
+                started = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["started_at"]))
+                print(f"  {started}  {run['pass_rate']:7.1%}  {run['passed']:>5}/{run['total']:<5}"
+                      f" flaky {run['flaky']}  {run['run_id'][:8]}")
+
+            if args.test:
+                stats = store.duration_percentiles([args.test], last_runs=args.runs).get(args.test)
+                if stats:
+                    print(f"\n✓ Duration percentiles ({stats['samples']} samples): "
+                          + ", ".join(f"{name} {value:.2f}s" for name, value in stats.items() if name != "samples"))
+            else:
+                print(f"\n✓ Slowest tests (median of last {args.runs} runs):")
+                print(f"  {'p50':>8} {'p95':>8} {'max':>8} {'runs':>5}  test")
+                for test in store.slowest_tests(args.limit, last_runs=args.runs):
+                    print(f"  {test['p50']:>7.2f}s {test['p95']:>7.2f}s {test['max']:>7.2f}s "
+                          f"{test['samples']:>5}  {test['test_id']}")
+
+        elif args.command == "daemon":
+            daemon = TestDaemon(
+                socket_path=args.socket,
+                browser=not args.no_browser,
+                headless=not args.headed
+            )
+            address = daemon.start()
+            print(f"✓ Test daemon listening on {address} ({len(daemon.preloaded)} modules preloaded)")
+            if daemon.browser_host is not None:
+                print(f"  Shared browser: {daemon.browser_host.endpoint}")
+            print(f"\nRun: python -m ai_qa_pipeline.modules.test_execution.cli run <tests_dir> --daemon {address}")
+            if args.address_file:
+                with open(args.address_file, 'w', encoding='utf-8') as f:
+                    f.write(address)
+
+            # SIGTERM (остановка сервисом) - как Ctrl+C: закрыть браузер демона
+            signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+            try:
+                daemon.serve_forever()
+            except KeyboardInterrupt:
+                print("\nStopping daemon...")
+            finally:
+                daemon.stop()
+
+        elif args.command == "benchmark":
+            if args.synthetic:
+                costs = synthetic_durations(args.synthetic, args.seed)
+                print(f"Synthetic suite: {len(costs)} tests (seed {args.seed})")
+            else:
+                costs = DurationStore(args.durations_file).load().durations
+                print(f"Loaded {len(costs)} test durations from: {args.durations_file}")
+
+            if not costs:
+                print("No durations to simulate (run tests first or use --synthetic)", file=sys.stderr)
+                sys.exit(1)
+
+            print(f"Total duration: {sum(costs.values()):.1f}s\n")
+            columns = (*SIMULATED_STRATEGIES, "lower_bound")
+            print(f"{'workers':>8}" + "".join(f"{name:>13}" for name in columns) + f"{'lpt gain':>10}")
+            for workers in args.workers:
+                results = benchmark_strategies(costs, workers)
+                naive = min(results["round_robin"], results["loadfile"])
+                gain = (1 - results["lpt"] / naive) * 100 if naive else 0.0
+                print(f"{workers:>8}" + "".join(f"{results[name]:>12.1f}s" for name in columns)
+                      + f"{gain:>9.1f}%")
+
+    except Exception as e:
+        print(f"Error: {str(e)}", file=sys.stderr)
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+def synthetic_durations(count, seed=42):
+    """
+    Синтетический набор: длительности с тяжелым хвостом (lognormal),
+    сгруппированные в файлы по 10 тестов, медленные тесты в конце файлов
+    """
+    rng = random.Random(seed)
+    costs = {}
+    for index in range(count):
+        path = f"tests/test_module_{index // 10}.py"
+        costs[f"{path}::test_{index}"] = round(rng.lognormvariate(0, 1.2), 3)
+    return dict(sorted(costs.items(), key=lambda item: (item[0].split("::")[0], item[1])))
+
+
+def _workers(value):
+    """Аргумент --workers: число или 'auto'"""
+    return value if value == "auto" else int(value)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Adaptive Concurrency
+====================
+
+Подбор числа xdist воркеров по ресурсам машины.
+
+xdist не умеет менять число воркеров во время сессии, поэтому
+адаптивный прогон делится на последовательные пакеты (``--batch j/M``
+плагина scheduling). Во время каждого пакета фоново снимаются загрузка
+CPU, свободная память и память процессов браузеров; перед следующим
+пакетом контроллер уменьшает число воркеров при нехватке памяти или
+перегрузке CPU и увеличивает при простое.
+
+Метрики берутся из psutil, если он установлен, иначе из /proc (Linux).
+"""
+
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+
+# Имена процессов браузеров Playwright
+BROWSER_PROCESS_NAMES = ("chrome", "chromium", "headless_shell", "firefox", "WebKitWebProcess", "MiniBrowser")
+
+
+@dataclass
+class ResourceSample:
+    """Снимок ресурсов машины"""
+    cpu: float  # загрузка CPU 0..1 с прошлого снимка
+    available_mb: float
+    used_mb: float
+    browser_mb: float
+
+
+class ResourceSampler:
+    """Снятие метрик CPU, памяти и процессов браузеров (psutil или /proc)"""
+
+    def __init__(self):
+        self._cpu_times = None
+        if psutil is not None:
+            psutil.cpu_percent(interval=None)
+        else:
+            self._cpu_times = self._read_cpu_times()
+
+    def sample(self) -> ResourceSample:
+        if psutil is not None:
+            memory = psutil.virtual_memory()
+            return ResourceSample(
+                cpu=psutil.cpu_percent(interval=None) / 100,
+                available_mb=memory.available / 2**20,
+                used_mb=(memory.total - memory.available) / 2**20,
+                browser_mb=self._browser_rss_psutil()
+            )
+
+        total, available = self._read_meminfo()
+        return ResourceSample(
+            cpu=self._cpu_since_last(),
+            available_mb=available,
+            used_mb=total - available,
+            browser_mb=self._browser_rss_proc()
+        )
+
+    def _cpu_since_last(self) -> float:
+        previous, current = self._cpu_times, self._read_cpu_times()
+        self._cpu_times = current
+        if previous is None or current is None:
+            return 0.0
+        busy = current[0] - previous[0]
+        total = current[1] - previous[1]
+        return busy / total if total > 0 else 0.0
+
+    @staticmethod
+    def _read_cpu_times():
+        """(busy, total) тики CPU из /proc/stat"""
+        try:
+            with open("/proc/stat", 'r') as f:
+                values = [int(v) for v in f.readline().split()[1:]]
+        except (OSError, ValueError):
+            return None
+        idle = values[3] + (values[4] if len(values) > 4 else 0)  # idle + iowait
+        return sum(values) - idle, sum(values)
+
+    @staticmethod
+    def _read_meminfo():
+        """(MemTotal, MemAvailable) в МБ из /proc/meminfo"""
+        info = {}
+        try:
+            with open("/proc/meminfo", 'r') as f:
+                for line in f:
+                    name, value = line.split(":", 1)
+                    info[name] = int(value.split()[0]) / 1024
+        except (OSError, ValueError):
+            return 0.0, 0.0
+        return info.get("MemTotal", 0.0), info.get("MemAvailable", info.get("MemFree", 0.0))
+
+    @staticmethod
+    def _browser_rss_psutil() -> float:
+        total = 0
+        for process in psutil.process_iter(["name", "memory_info"]):
+            name = process.info.get("name") or ""
+            memory = process.info.get("memory_info")
+            if memory is not None and name.startswith(BROWSER_PROCESS_NAMES):
+                total += memory.rss
+        return total / 2**20
+
+    @staticmethod
+    def _browser_rss_proc() -> float:
+        page_mb = os.sysconf("SC_PAGE_SIZE") / 2**20 if hasattr(os, "sysconf") else 0.0
+        total = 0.0
+        try:
+            pids = [entry for entry in os.listdir("/proc") if entry.isdigit()]
+        except OSError:
+            return 0.0
+        for pid in pids:
+            try:
+                with open(f"/proc/{pid}/comm", 'r') as f:
+                    name = f.read().strip()
+                if not name.startswith(BROWSER_PROCESS_NAMES):
+                    continue
+                with open(f"/proc/{pid}/statm", 'r') as f:
+                    total += int(f.read().split()[1]) * page_mb
+            except (OSError, ValueError, IndexError):
+                continue
+        return total
+
+
+@dataclass
+class ResourceStats:
+    """Агрегированные метрики за пакет"""
+    baseline: ResourceSample
+    samples: List[ResourceSample] = field(default_factory=list)
+
+    @property
+    def avg_cpu(self) -> float:
+        return sum(s.cpu for s in self.samples) / len(self.samples) if self.samples else 0.0
+
+    @property
+    def min_available_mb(self) -> float:
+        return min((s.available_mb for s in self.samples), default=self.baseline.available_mb)
+
+    @property
+    def memory_delta_mb(self) -> float:
+        """Пиковый прирост занятой памяти относительно начала пакета"""
+        return max((s.used_mb for s in self.samples), default=self.baseline.used_mb) - self.baseline.used_mb
+
+    @property
+    def peak_browser_mb(self) -> float:
+        return max((s.browser_mb for s in self.samples), default=0.0)
+
+
+class ResourceMonitor:
+    """Фоновое снятие метрик на время пакета (контекстный менеджер)"""
+
+    def __init__(self, sampler: ResourceSampler, interval: float = 1.0):
+        self.sampler = sampler
+        self.interval = interval
+        self.stats: Optional[ResourceStats] = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self) -> 'ResourceMonitor':
+        self.stats = ResourceStats(self.sampler.sample())
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="resource-monitor", daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.stats.samples.append(self.sampler.sample())
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.stats.samples.append(self.sampler.sample())
+
+
+class AdaptiveConcurrencyController:
+    """
+    Выбор числа воркеров по CPU и памяти
+
+    Память на воркер (браузер + процесс pytest) сначала берется из
+    оценки worker_memory_mb, затем уточняется по фактическому приросту
+    занятой памяти и памяти браузеров в каждом пакете.
+    """
+
+    def __init__(
+        self,
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        worker_memory_mb: float = 600.0,
+        memory_reserve_mb: float = 1024.0,
+        target_cpu: float = 0.85,
+        sampler: Optional[ResourceSampler] = None
+    ):
+        """
+        Инициализация контроллера
+
+        Args:
+            min_workers: Нижняя граница числа воркеров
+            max_workers: Верхняя граница (по умолчанию - число CPU)
+            worker_memory_mb: Начальная оценка памяти на воркер
+            memory_reserve_mb: Память, которую нужно оставлять свободной
+            target_cpu: Целевая загрузка CPU (0..1)
+            sampler: Источник метрик
+        """
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.worker_memory_mb = worker_memory_mb
+        self.memory_reserve_mb = memory_reserve_mb
+        self.target_cpu = target_cpu
+        self.sampler = sampler or ResourceSampler()
+
+    def _clamp(self, workers: int) -> int:
+        return max(self.min_workers, min(self.max_workers, workers))
+
+    def memory_limit(self, available_mb: float, running: int = 0) -> int:
+        """Сколько воркеров помещается в память (running уже запущены)"""
+        free_mb = available_mb - self.memory_reserve_mb + running * self.worker_memory_mb
+        return int(free_mb // self.worker_memory_mb)
+
+    def initial_workers(self) -> int:
+        """Число воркеров для первого пакета"""
+        return self._clamp(self.memory_limit(self.sampler.sample().available_mb))
+
+    def adjust(self, workers: int, stats: ResourceStats) -> int:
+        """
+        Число воркеров для следующего пакета по метрикам прошедшего
+
+        Args:
+            workers: Воркеров в прошедшем пакете
+            stats: Метрики пакета
+
+        Returns:
+            Новое число воркеров
+        """
+        observed = max(stats.memory_delta_mb, stats.peak_browser_mb) / max(workers, 1)
+        if observed > 0:
+            self.worker_memory_mb = 0.5 * self.worker_memory_mb + 0.5 * observed
+
+        memory_limit = self.memory_limit(stats.baseline.available_mb)
+
+        if stats.min_available_mb < self.memory_reserve_mb or stats.avg_cpu > self.target_cpu + 0.1:
+            # Нехватка памяти или перегрузка CPU: уменьшение на четверть (минимум на 1)
+            proposed = workers - max(1, workers // 4)
+        elif stats.avg_cpu < self.target_cpu - 0.25:
+            proposed = workers + max(1, workers // 4)
+        else:
+            proposed = workers
+
+        return self._clamp(min(proposed, memory_limit))
@@ -0,0 +1,357 @@
+"""
+Test Daemon
+===========
+
+Демон для повторных прогонов тестов без затрат на старт.
+
+Демон один раз импортирует тяжелые зависимости (pytest и его плагины,
+Playwright, Applitools, NumPy) и, по желанию, запускает Chromium с
+открытым CDP портом. Каждый запрос на прогон обслуживается процессом,
+порожденным через fork от прогретого демона: импорты уже в памяти
+(copy-on-write), а тесты подключаются к запущенному браузеру через
+BROWSER_CDP_ENDPOINT (см. BrowserPool) вместо запуска своего.
+Тестовые модули и conftest импортируются заново в каждом прогоне,
+поэтому перегенерированные тесты подхватываются без перезапуска демона.
+
+Прогон выполняет любые argv/env/cwd из запроса, поэтому демон слушает
+Unix сокет с правами 0600: подключиться может только его владелец.
+
+Протокол (JSON строки через Unix сокет)::
+
+    -> {"argv": [...], "cwd": "...", "env": {...}, "output": "pytest-output.log", "append": false}
+    <- {"pid": 12345}
+    <- {"exitcode": 0}
+
+Запуск::
+
+    python -m ai_qa_pipeline.modules.test_execution.cli daemon --socket ~/.cache/ai_qa_pipeline/test-daemon.sock
+
+Модуль импортируется пакетом test_execution раньше регистрации плагинов,
+поэтому assert rewriting для него отключен: PYTEST_DONT_REWRITE
+"""
+
+import importlib
+import json
+import os
+import select
+import shutil
+import signal
+import socket
+import socketserver
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+from typing import Dict, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+# Модули, импортируемые демоном заранее (отсутствующие пропускаются)
+DEFAULT_PRELOAD = (
+    "pytest",
+    "_pytest.python",
+    "_pytest.fixtures",
+    "xdist",
+    "allure_pytest",
+    "pytest_html",
+    "playwright.sync_api",
+    "applitools.playwright",
+    "numpy",
+    "structlog",
+)
+
+
+# Сокет по умолчанию (в каталоге пользователя, а не в общем /tmp)
+DEFAULT_SOCKET_PATH = os.path.join(os.path.expanduser("~"), ".cache", "ai_qa_pipeline", "test-daemon.sock")
+
+
+class BrowserHost:
+    """
+    Chromium с открытым CDP портом, общий для всех прогонов демона
+
+    Браузер запускается напрямую (исполняемый файл Playwright), чтобы
+    в процессе демона не оставалось соединения Playwright, которое
+    не переживает fork.
+    """
+
+    def __init__(self, headless: bool = True, startup_timeout: float = 30.0):
+        self.headless = headless
+        self.startup_timeout = startup_timeout
+        self.endpoint: Optional[str] = None
+        self._process = None
+        self._profile_dir = None
+
+    def start(self) -> str:
+        """
+        Запуск браузера
+
+        Returns:
+            CDP endpoint (http://127.0.0.1:<port>)
+        """
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as playwright:
+            executable = playwright.chromium.executable_path
+
+        port = _free_port()
+        self._profile_dir = tempfile.mkdtemp(prefix="test-daemon-chromium-")
+        args = [
+            executable,
+            f"--remote-debugging-port={port}",
+            f"--user-data-dir={self._profile_dir}",
+            "--no-first-run",
+            "--no-default-browser-check",
+        ]
+        if self.headless:
+            args.append("--headless=new")
+        args.append("about:blank")
+
+        self._process = subprocess.Popen(args, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.endpoint = f"http://127.0.0.1:{port}"
+
+        deadline = time.time() + self.startup_timeout
+        while time.time() < deadline:
+            try:
+                with urllib.request.urlopen(f"{self.endpoint}/json/version", timeout=1):
+                    logger.info("daemon_browser_started", endpoint=self.endpoint, pid=self._process.pid)
+                    return self.endpoint
+            except OSError:
+                if self._process.poll() is not None:
+                    break
+                time.sleep(0.1)
+
+        self.stop()
+        raise RuntimeError("Chromium не открыл CDP порт")
+
+    def stop(self):
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+        self._process = None
+        if self._profile_dir:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _RunHandler(socketserver.StreamRequestHandler):
+    """Обработка запроса на прогон (выполняется в процессе, порожденном fork)"""
+
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        self._send({"pid": os.getpid()})
+        exitcode = self.server.daemon.run_pytest(request)
+        self._send({"exitcode": exitcode})
+
+    def _send(self, message: dict):
+        self.wfile.write((json.dumps(message) + "\n").encode("utf-8"))
+        self.wfile.flush()
+
+
+class _ForkingServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+
+    def server_bind(self):
+        # Права 0600 с момента создания файла сокета (umask), а не после chmod
+        previous = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(previous)
+
+
+def _remove_stale_socket(path: str):
+    """Удаление файла сокета, оставшегося от завершенного демона"""
+    if not os.path.exists(path):
+        return
+    with socket.socket(socket.AF_UNIX) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            os.remove(path)
+            return
+    raise RuntimeError(f"Демон уже запущен: {path}")
+
+
+class TestDaemon:
+    """Прогретый процесс, выполняющий прогоны pytest в порожденных процессах"""
+
+    __test__ = False  # не тестовый класс для pytest
+
+    def __init__(
+        self,
+        socket_path: str = DEFAULT_SOCKET_PATH,
+        browser: bool = True,
+        headless: bool = True,
+        preload: Tuple[str, ...] = DEFAULT_PRELOAD
+    ):
+        """
+        Инициализация демона
+
+        Args:
+            socket_path: Путь Unix сокета (доступен только владельцу)
+            browser: Запустить общий Chromium для прогонов
+            headless: Headless режим общего браузера
+            preload: Модули для предварительного импорта
+        """
+        self.socket_path = socket_path
+        self.preload = preload
+        self.browser_host = BrowserHost(headless) if browser else None
+        self.preloaded: List[str] = []
+        self._server = None
+
+    @property
+    def address(self) -> str:
+        return self._server.server_address
+
+    def start(self) -> str:
+        """
+        Прогрев и открытие сокета
+
+        Returns:
+            Путь сокета демона
+        """
+        started = time.time()
+        for name in self.preload:
+            try:
+                importlib.import_module(name)
+                self.preloaded.append(name)
+            except Exception:
+                continue
+
+        if self.browser_host is not None:
+            self.browser_host.start()
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.socket_path)), mode=0o700, exist_ok=True)
+        _remove_stale_socket(self.socket_path)
+        self._server = _ForkingServer(self.socket_path, _RunHandler)
+        self._server.daemon = self
+        logger.info("daemon_started",
+                   address=self.address,
+                   preloaded=len(self.preloaded),
+                   warmup=round(time.time() - started, 2))
+        return self.address
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+        if self.browser_host is not None:
+            self.browser_host.stop()
+
+    def run_pytest(self, request: Dict) -> int:
+        """Прогон pytest в текущем (порожденном) процессе"""
+        import pytest
+
+        os.environ.clear()
+        os.environ.update(request.get("env") or {})
+        if self.browser_host is not None and self.browser_host.endpoint:
+            os.environ.setdefault("BROWSER_CDP_ENDPOINT", self.browser_host.endpoint)
+
+        cwd = request.get("cwd") or os.getcwd()
+        os.chdir(cwd)
+        for path in reversed(os.environ.get("PYTHONPATH", "").split(os.pathsep)):
+            if path and path not in sys.path:
+                sys.path.insert(0, path)
+
+        mode = "a" if request.get("append") else "w"
+        with open(os.path.join(cwd, request.get("output") or "pytest-output.log"), mode) as output:
+            os.dup2(output.fileno(), 1)
+            os.dup2(output.fileno(), 2)
+            # Модули, импортированные демоном, уже нельзя переписать для assert
+            argv = list(request["argv"]) + ["-W", "ignore::pytest.PytestAssertRewriteWarning"]
+            try:
+                exitcode = int(pytest.main(argv))
+            except BaseException:
+                exitcode = 3
+            sys.stdout.flush()
+            sys.stderr.flush()
+        return exitcode
+
+
+class DaemonRun:
+    """Прогон в демоне с интерфейсом subprocess.Popen (poll / wait / terminate)"""
+
+    def __init__(self, sock: socket.socket):
+        self._sock = sock
+        self._file = sock.makefile("r", encoding="utf-8")
+        self.pid = json.loads(self._file.readline())["pid"]
+        self.returncode: Optional[int] = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None and select.select([self._sock], [], [], 0)[0]:
+            self._read_exitcode()
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if self.returncode is None:
+            self._sock.settimeout(timeout)
+            self._read_exitcode()
+        return self.returncode
+
+    def terminate(self):
+        try:
+            os.kill(self.pid, signal.SIGTERM)
+        except ProcessLookupError:
+            pass
+
+    def _read_exitcode(self):
+        line = self._file.readline()
+        # Соединение закрыто без ответа - процесс прогона убит
+        self.returncode = json.loads(line)["exitcode"] if line else -signal.SIGTERM
+        self._file.close()
+        self._sock.close()
+
+
+class DaemonClient:
+    """Клиент демона"""
+
+    def __init__(self, address: str, connect_timeout: float = 5.0):
+        """
+        Args:
+            address: Путь Unix сокета демона
+            connect_timeout: Таймаут подключения (секунды)
+        """
+        self.address = address
+        self.connect_timeout = connect_timeout
+
+    def start(self, argv: List[str], cwd: str, env: Dict[str, str], output: str, append: bool = False) -> DaemonRun:
+        """
+        Запуск прогона pytest в демоне
+
+        Args:
+            argv: Аргументы pytest (без "python -m pytest")
+            cwd: Рабочая директория прогона
+            env: Окружение прогона
+            output: Файл вывода pytest
+            append: Дописывать вывод в файл
+
+        Returns:
+            DaemonRun
+        """
+        sock = socket.socket(socket.AF_UNIX)
+        sock.settimeout(self.connect_timeout)
+        try:
+            sock.connect(self.address)
+        except OSError:
+            sock.close()
+            raise
+        sock.settimeout(None)
+        request = {"argv": argv, "cwd": cwd, "env": env, "output": output, "append": append}
+        sock.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        return DaemonRun(sock)
@@ -7,14 +7,41 @@ Test Executor
 
 import subprocess
 import json
+import sqlite3
+import os
+import sys
 import time
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator, Callable, Union
 from dataclasses import dataclass, field
 import structlog
 
+from .scheduling import DEFAULT_DURATIONS_FILE, parse_shard, strip_group_suffix
+from .impact import DEFAULT_IMPACT_FILE, changed_files_from_git
+from .history import DEFAULT_HISTORY_FILE
+from .flaky import DEFAULT_QUARANTINE_FILE, FlakeStore
+from .pytest_plugin import read_events
+from .daemon import DaemonClient
+from .concurrency import AdaptiveConcurrencyController, ResourceMonitor
+from .results_store import DEFAULT_RESULTS_DB, ResultsStore
+
 logger = structlog.get_logger()
 
+# Корень репозитория: нужен в PYTHONPATH, чтобы pytest в tests_dir
+# мог загрузить плагины ai_qa_pipeline
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+EVENTS_PLUGIN = "ai_qa_pipeline.modules.test_execution.pytest_plugin"
+SCHEDULING_PLUGIN = "ai_qa_pipeline.modules.test_execution.scheduling"
+IMPACT_PLUGIN = "ai_qa_pipeline.modules.test_execution.impact"
+HISTORY_PLUGIN = "ai_qa_pipeline.modules.test_execution.history"
+QUARANTINE_PLUGIN = "ai_qa_pipeline.modules.test_execution.flaky"
+
+FAILED_STATUSES = ("failed", "error")
+
+SCREENSHOT_EXTENSIONS = (".png", ".jpg", ".jpeg", ".webp")
+VIDEO_EXTENSIONS = (".webm", ".mp4")
+
 
 @dataclass
 class TestResult:
@@ -26,6 +53,29 @@ class TestResult:
     error_traceback: Optional[str] = None
     screenshots: List[str] = field(default_factory=list)
     video: Optional[str] = None
+    worker: Optional[str] = None
+    attempts: int = 1
+    flaky: bool = False  # упал, но прошел при изолированном перезапуске
+    phases: Dict[str, float] = field(default_factory=dict)  # setup/call/teardown (сек)
+    attachments: List[str] = field(default_factory=list)
+
+    @classmethod
+    def from_event(cls, event: Dict[str, Any]) -> 'TestResult':
+        """Создание из JSONL события плагина pytest_plugin"""
+        attachments = event.get("attachments") or []
+        failed = event["outcome"] in FAILED_STATUSES
+        return cls(
+            test_id=strip_group_suffix(event["nodeid"]),
+            status=event["outcome"],
+            duration=event.get("duration", 0.0),
+            error_message=event.get("message") or event.get("longrepr"),
+            error_traceback=event.get("longrepr") if failed else None,
+            screenshots=[path for path in attachments if path.lower().endswith(SCREENSHOT_EXTENSIONS)],
+            video=next((path for path in attachments if path.lower().endswith(VIDEO_EXTENSIONS)), None),
+            worker=event.get("worker"),
+            phases=event.get("phases") or {},
+            attachments=attachments
+        )
 
 
 @dataclass
@@ -41,6 +91,33 @@ class ExecutionResult:
     allure_report_path: Optional[str] = None
     html_report_path: Optional[str] = None
 
+    @classmethod
+    def from_tests(
+        cls,
+        tests: List[TestResult],
+        duration: float,
+        allure_report_path: Optional[str] = None
+    ) -> 'ExecutionResult':
+        """Агрегация результатов отдельных тестов"""
+        def count(status):
+            return sum(1 for t in tests if t.status == status)
+
+        return cls(
+            total=len(tests),
+            passed=count("passed"),
+            failed=count("failed"),
+            skipped=count("skipped"),
+            errors=count("error"),
+            duration=duration,
+            tests=tests,
+            allure_report_path=allure_report_path
+        )
+
+    @property
+    def flaky(self) -> int:
+        """Количество тестов, прошедших только при перезапуске"""
+        return sum(1 for t in self.tests if t.flaky)
+
     @property
     def success_rate(self) -> float:
         """Процент успешных тестов"""
@@ -57,12 +134,17 @@ class ExecutionResult:
             "errors": self.errors,
             "duration": self.duration,
             "success_rate": self.success_rate,
+            "flaky": self.flaky,
             "tests": [
                 {
                     "test_id": t.test_id,
                     "status": t.status,
                     "duration": t.duration,
-                    "error": t.error_message
+                    "error": t.error_message,
+                    "attempts": t.attempts,
+                    "flaky": t.flaky,
+                    "phases": t.phases,
+                    "attachments": t.attachments
                 }
                 for t in self.tests
             ]
@@ -75,6 +157,13 @@ class TestExecutor:
 
     Выполнение Pytest тестов с:
     - Parallel execution (pytest-xdist)
+    - Duration-based scheduling and CI sharding
+    - Test impact analysis (only tests affected by changes)
+    - Failure-first ordering from results history, fail fast
+    - Isolated reruns of failures, flaky detection and quarantine
+    - Warm daemon mode (no interpreter/browser startup per run)
+    - Resource-aware adaptive worker count
+    - SQLite results history (duration percentiles, pass-rate trends)
     - Allure reporting
     - Structured logging
     - Screenshot/video capture
@@ -84,34 +173,98 @@ class TestExecutor:
     def __init__(
         self,
         tests_dir: str,
-        workers: int = 4,
+        workers: Union[int, str] = "auto",
         headless: bool = True,
         capture_screenshots: bool = True,
         capture_video: bool = False,
-        allure_results_dir: str = "allure-results"
+        allure_results_dir: str = "allure-results",
+        poll_interval: float = 0.2,
+        duration_schedule: bool = False,
+        durations_file: Optional[str] = None,
+        shard: Optional[str] = None,
+        record_impact: bool = False,
+        impact_map: Optional[str] = None,
+        prioritize: bool = False,
+        history_file: Optional[str] = None,
+        max_failures: Optional[int] = None,
+        reruns: int = 0,
+        quarantine_file: Optional[str] = None,
+        skip_quarantined: bool = False,
+        daemon_address: Optional[str] = None,
+        capture_trace: bool = False,
+        results_db: Optional[str] = None
     ):
         """
         Инициализация executor
 
         Args:
             tests_dir: Директория с тестами
-            workers: Количество parallel workers
+            workers: Количество parallel workers или "auto" - по числу CPU и
+                свободной памяти (см. concurrency.py и run_adaptive)
             headless: Headless режим браузера
             capture_screenshots: Делать скриншоты при failure
-            capture_video: Записывать видео
+            capture_video: Записывать видео (сохраняется только при failure)
             allure_results_dir: Директория для Allure результатов
+            poll_interval: Период опроса файла событий в потоковом режиме (сек)
+            duration_schedule: Раскладывать тесты по воркерам LPT расписанием
+                по историческим длительностям (--dist loadgroup)
+            durations_file: JSON файл длительностей (по умолчанию в tests_dir),
+                обновляется после каждого прогона
+            shard: Запускать только шард "i/N" для деления прогона между CI машинами
+            record_impact: Записывать зависимости тестов от файлов в карту влияния
+            impact_map: JSON файл карты влияния (по умолчанию в tests_dir)
+            prioritize: Запускать первыми недавно упавшие, измененные и
+                быстрые информативные тесты (по истории результатов)
+            history_file: JSON файл истории результатов (по умолчанию в tests_dir),
+                обновляется после каждого прогона
+            max_failures: Остановить прогон после N падений (pre-merge проверки)
+            reruns: Сколько раз перезапускать упавший тест в отдельном процессе;
+                прошедший при перезапуске тест помечается flaky
+            quarantine_file: JSON файл частоты нестабильности и карантина
+                (по умолчанию в tests_dir), обновляется при reruns > 0
+            skip_quarantined: Не запускать тесты в карантине (критичные прогоны)
+            daemon_address: Путь Unix сокета демона (см. daemon.py): прогоны
+                выполняются прогретым процессом демона вместо нового python
+            capture_trace: Записывать Playwright трейс (сохраняется только при failure)
+            results_db: SQLite база результатов (по умолчанию в tests_dir),
+                пополняется после каждого прогона
         """
+        if shard:
+            parse_shard(shard)
+
         self.tests_dir = Path(tests_dir)
-        self.workers = workers
+        self.concurrency: Optional[AdaptiveConcurrencyController] = None
+        if workers == "auto":
+            self.concurrency = AdaptiveConcurrencyController()
+            workers = self.concurrency.initial_workers()
+        self.workers = int(workers)
         self.headless = headless
         self.capture_screenshots = capture_screenshots
         self.capture_video = capture_video
         self.allure_results_dir = Path(allure_results_dir)
+        self.poll_interval = poll_interval
+        self.duration_schedule = duration_schedule
+        self.durations_file = Path(durations_file) if durations_file else self.tests_dir / DEFAULT_DURATIONS_FILE
+        self.shard = shard
+        self.record_impact = record_impact
+        self.impact_map = Path(impact_map) if impact_map else self.tests_dir / DEFAULT_IMPACT_FILE
+        self.prioritize = prioritize
+        self.history_file = Path(history_file) if history_file else self.tests_dir / DEFAULT_HISTORY_FILE
+        self.max_failures = max_failures
+        self.reruns = reruns
+        self.quarantine_file = Path(quarantine_file) if quarantine_file else self.tests_dir / DEFAULT_QUARANTINE_FILE
+        self.skip_quarantined = skip_quarantined
+        self.daemon_address = daemon_address
+        self.capture_trace = capture_trace
+        self.results_db = Path(results_db) if results_db else self.tests_dir / DEFAULT_RESULTS_DB
 
     def run_tests(
         self,
         test_pattern: str = "test_*.py",
-        markers: Optional[List[str]] = None
+        markers: Optional[List[str]] = None,
+        stream: bool = False,
+        on_result: Optional[Callable[[TestResult], None]] = None,
+        extra_args: Optional[List[str]] = None
     ) -> ExecutionResult:
         """
         Запуск тестов
@@ -119,58 +272,442 @@ class TestExecutor:
         Args:
             test_pattern: Паттерн для поиска тестов
             markers: Pytest markers для фильтрации
+            stream: Потоковый режим (результаты по мере выполнения, см. stream_tests)
+            on_result: Callback на каждый завершенный тест (включает потоковый режим);
+                вызывается с исходом первой попытки, до перезапусков
+            extra_args: Дополнительные аргументы pytest
 
         Returns:
             Результат выполнения
         """
+        result = self._execute(test_pattern, markers, stream, on_result, extra_args)
+        self._record_run(result, test_pattern, markers)
+        return result
+
+    def _execute(
+        self,
+        test_pattern: str,
+        markers: Optional[List[str]],
+        stream: bool = False,
+        on_result: Optional[Callable[[TestResult], None]] = None,
+        extra_args: Optional[List[str]] = None
+    ) -> ExecutionResult:
+        """Один запуск pytest (с перезапусками упавших) без записи в базу результатов"""
         logger.info("starting_test_execution",
                    tests_dir=str(self.tests_dir),
-                   workers=self.workers)
+                   workers=self.workers,
+                   shard=self.shard)
 
         start_time = time.time()
 
-        # Построение команды pytest
-        cmd = self._build_pytest_command(test_pattern, markers)
+        if stream or on_result is not None:
+            tests = []
+            for test_result in self.stream_tests(test_pattern, markers, extra_args):
+                tests.append(test_result)
+                if on_result is not None:
+                    on_result(test_result)
 
-        # Выполнение
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            cwd=str(self.tests_dir)
-        )
+            execution_result = ExecutionResult.from_tests(
+                tests, time.time() - start_time, str(self.allure_results_dir)
+            )
+        else:
+            # Построение команды pytest
+            events_path = self.tests_dir / "test-events.jsonl"
+            events_path.write_text("", encoding="utf-8")
+            cmd = self._build_pytest_command(test_pattern, markers, events_path, extra_args=extra_args)
 
-        duration = time.time() - start_time
+            # Выполнение: вывод pytest пишется в файл, а не накапливается в памяти
+            returncode = self._launch(cmd, "pytest-output.log").wait()
+            logger.info("pytest_process_finished", returncode=returncode)
 
-        # Парсинг результатов
-        execution_result = self._parse_results(result, duration)
+            # Парсинг результатов
+            execution_result = self._parse_results(events_path, time.time() - start_time)
+
+        if self.reruns and execution_result.tests:
+            execution_result = self._rerun_failures(execution_result, start_time)
 
         logger.info("test_execution_completed",
                    total=execution_result.total,
                    passed=execution_result.passed,
                    failed=execution_result.failed,
-                   duration=duration)
+                   flaky=execution_result.flaky,
+                   duration=execution_result.duration)
 
         return execution_result
 
+    def _record_run(self, result: ExecutionResult, test_pattern: str, markers: Optional[List[str]], **metadata):
+        """Запись прогона в базу результатов (ошибка записи не роняет прогон)"""
+        try:
+            run_id = ResultsStore(str(self.results_db)).record_run(result, {
+                "test_pattern": test_pattern,
+                "markers": markers or [],
+                "workers": self.workers,
+                "shard": self.shard,
+                **metadata
+            })
+        except sqlite3.Error as e:
+            logger.warning("results_store_write_failed", db=str(self.results_db), error=str(e))
+            return
+        logger.info("run_recorded", run_id=run_id, db=str(self.results_db))
+
+    def _rerun_failures(self, execution_result: ExecutionResult, start_time: float) -> ExecutionResult:
+        """
+        Изолированные перезапуски упавших тестов и учет нестабильности
+
+        Каждый упавший тест перезапускается отдельно в новом процессе
+        pytest (без xdist), до reruns раз или до первого успеха.
+        Прошедший тест получает статус passed и флаг flaky, падающий
+        каждый раз остается упавшим (детерминированное падение).
+        """
+        store = FlakeStore(str(self.quarantine_file)).load()
+
+        for test in execution_result.tests:
+            if test.status in FAILED_STATUSES:
+                for _ in range(self.reruns):
+                    retry = self._run_isolated(test.test_id)
+                    test.attempts += 1
+                    if retry is not None and retry.status == "passed":
+                        test.status, test.flaky = "passed", True
+                        break
+
+                logger.info("test_rerun_classified",
+                           test_id=test.test_id,
+                           attempts=test.attempts,
+                           classification="flaky" if test.flaky else "deterministic")
+
+            if test.status in ("passed", *FAILED_STATUSES):
+                change = store.record(test.test_id, test.flaky)
+                if change:
+                    logger.warning(f"test_{change}",
+                                   test_id=test.test_id,
+                                   flake_rate=store.flake_rate(test.test_id))
+
+        store.save()
+
+        return ExecutionResult.from_tests(
+            execution_result.tests,
+            time.time() - start_time,
+            execution_result.allure_report_path
+        )
+
+    def _run_isolated(self, test_id: str) -> Optional[TestResult]:
+        """Запуск одного теста в отдельном процессе pytest (результат или None)"""
+        events_path = self.tests_dir / "rerun-events.jsonl"
+        events_path.write_text("", encoding="utf-8")
+
+        cmd = self._build_pytest_command(self._isolated_target(test_id), None, events_path, isolated=True)
+
+        self._launch(cmd, "pytest-rerun.log", append=True).wait()
+
+        for event in read_events(str(events_path)):
+            if event.get("event") == "test":
+                return TestResult.from_event(event)
+        return None
+
+    def _isolated_target(self, test_id: str) -> str:
+        """
+        Аргумент pytest для одного теста при запуске из tests_dir
+
+        nodeid считается относительно rootdir pytest (ближайший pytest.ini
+        и т.п.), который может быть выше tests_dir, поэтому файл теста
+        ищется от tests_dir вверх и передается абсолютным путем.
+        """
+        path, separator, rest = test_id.partition("::")
+        tests_dir = self.tests_dir.resolve()
+        for base in (tests_dir, *tests_dir.parents):
+            if (base / path).is_file():
+                return f"{base / path}{separator}{rest}"
+        return test_id
+
+    def stream_tests(
+        self,
+        test_pattern: str = "test_*.py",
+        markers: Optional[List[str]] = None,
+        extra_args: Optional[List[str]] = None
+    ) -> Iterator[TestResult]:
+        """
+        Потоковый запуск тестов
+
+        pytest запускается через Popen (или в демоне) с плагином JSONL событий; результаты
+        отдаются по мере завершения тестов. Вывод pytest пишется в
+        pytest-output.log в tests_dir, а не накапливается в памяти.
+
+        Args:
+            test_pattern: Паттерн для поиска тестов
+            markers: Pytest markers для фильтрации
+            extra_args: Дополнительные аргументы pytest
+
+        Yields:
+            TestResult каждого завершенного теста
+        """
+        events_path = self.tests_dir / "test-events.jsonl"
+        events_path.write_text("", encoding="utf-8")
+
+        cmd = self._build_pytest_command(test_pattern, markers, events_path, extra_args=extra_args)
+
+        with open(events_path, "r", encoding="utf-8") as events:
+            process = self._launch(cmd, "pytest-output.log")
+            try:
+                for event in self._follow_events(events, process):
+                    if event.get("event") == "test":
+                        yield TestResult.from_event(event)
+            finally:
+                if process.poll() is None:
+                    process.terminate()
+                process.wait()
+
+        logger.info("pytest_process_finished", returncode=process.returncode)
+
+    def run_impacted(
+        self,
+        changed_files: Optional[List[str]] = None,
+        diff_base: str = "HEAD",
+        run_rest: bool = False,
+        test_pattern: str = "test_*.py",
+        markers: Optional[List[str]] = None,
+        on_result: Optional[Callable[[TestResult], None]] = None
+    ) -> ExecutionResult:
+        """
+        Запуск тестов, затронутых изменениями, по карте влияния
+
+        Args:
+            changed_files: Измененные файлы относительно tests_dir
+                (по умолчанию - git diff относительно diff_base)
+            diff_base: Git ревизия для сравнения
+            run_rest: После затронутых тестов запустить остальные
+            test_pattern: Паттерн для поиска тестов
+            markers: Pytest markers для фильтрации
+            on_result: Callback на каждый завершенный тест
+
+        Returns:
+            Результат выполнения (затронутые тесты, затем остальные)
+        """
+        if changed_files is None:
+            changed_files = changed_files_from_git(diff_base, cwd=str(self.tests_dir))
+
+        changed_path = self.tests_dir / "impact-changed.txt"
+        changed_path.write_text("".join(f"{path}\n" for path in changed_files), encoding="utf-8")
+
+        logger.info("impact_analysis", changed_files=len(changed_files), run_rest=run_rest)
+
+        start_time = time.time()
+        tests = []
+        phases = ["only", "rest"] if run_rest else ["only"]
+        for mode in phases:
+            result = self._execute(
+                test_pattern,
+                markers,
+                stream=True,
+                on_result=on_result,
+                extra_args=[f"--impact-changed={changed_path.resolve()}", f"--impact-mode={mode}"]
+            )
+            logger.info("impact_phase_completed", phase=mode, total=result.total, failed=result.failed)
+            tests.extend(result.tests)
+
+        result = ExecutionResult.from_tests(tests, time.time() - start_time, str(self.allure_results_dir))
+        self._record_run(result, test_pattern, markers, impact_changed=len(changed_files))
+        return result
+
+    def run_adaptive(
+        self,
+        test_pattern: str = "test_*.py",
+        markers: Optional[List[str]] = None,
+        batches: int = 4,
+        on_result: Optional[Callable[[TestResult], None]] = None
+    ) -> ExecutionResult:
+        """
+        Запуск тестов с подстройкой числа воркеров под ресурсы машины
+
+        xdist не меняет число воркеров во время сессии, поэтому тесты
+        делятся на последовательные пакеты (--batch j/M, LPT по длительностям).
+        Во время пакета снимаются загрузка CPU, свободная память и память
+        браузеров; перед следующим пакетом число воркеров уменьшается при
+        нехватке памяти или перегрузке CPU и увеличивается при простое.
+
+        Args:
+            test_pattern: Паттерн для поиска тестов
+            markers: Pytest markers для фильтрации
+            batches: Количество пакетов
+            on_result: Callback на каждый завершенный тест
+
+        Returns:
+            Результат выполнения всех пакетов
+        """
+        if self.concurrency is None:
+            self.concurrency = AdaptiveConcurrencyController()
+            self.workers = self.concurrency.initial_workers()
+
+        start_time = time.time()
+        tests = []
+        for index in range(1, batches + 1):
+            with ResourceMonitor(self.concurrency.sampler, interval=self.poll_interval) as monitor:
+                result = self._execute(
+                    test_pattern,
+                    markers,
+                    on_result=on_result,
+                    extra_args=[f"--batch={index}/{batches}"]
+                )
+            tests.extend(result.tests)
+
+            stats = monitor.stats
+            workers = self.concurrency.adjust(self.workers, stats)
+            logger.info("adaptive_batch_completed",
+                       batch=f"{index}/{batches}",
+                       total=result.total,
+                       workers=self.workers,
+                       next_workers=workers,
+                       avg_cpu=round(stats.avg_cpu, 2),
+                       min_available_mb=round(stats.min_available_mb),
+                       peak_browser_mb=round(stats.peak_browser_mb),
+                       worker_memory_mb=round(self.concurrency.worker_memory_mb))
+            self.workers = workers
+
+            failed = sum(1 for test in tests if test.status in FAILED_STATUSES)
+            if self.max_failures and failed >= self.max_failures:
+                break
+
+        result = ExecutionResult.from_tests(tests, time.time() - start_time, str(self.allure_results_dir))
+        self._record_run(result, test_pattern, markers, batches=batches)
+        return result
+
+    def _follow_events(self, events, process) -> Iterator[Dict[str, Any]]:
+        """Чтение JSONL событий, пока pytest пишет файл"""
+        buffer = ""
+        while True:
+            chunk = events.readline()
+            if chunk:
+                buffer += chunk
+                if buffer.endswith("\n"):
+                    line, buffer = buffer.strip(), ""
+                    event = self._decode_event(line) if line else None
+                    if event is not None:
+                        yield event
+                continue
+
+            if process.poll() is not None:
+                # Процесс завершен: дочитываем остаток файла
+                rest = buffer + events.read()
+                for line in rest.splitlines():
+                    event = self._decode_event(line) if line.strip() else None
+                    if event is not None:
+                        yield event
+                return
+
+            time.sleep(self.poll_interval)
+
+    @staticmethod
+    def _decode_event(line: str) -> Optional[Dict[str, Any]]:
+        """
+        Событие из строки JSONL
+
+        Прерванный процесс (terminate, SIGTERM демона) может оставить
+        недописанную последнюю строку: она пропускается, а уже
+        прочитанные результаты сохраняются (как в read_events).
+        """
+        try:
+            return json.loads(line)
+        except ValueError:
+            logger.warning("events_line_skipped", line=line[:200])
+            return None
+
+    def _launch(self, cmd: List[str], output_name: str, append: bool = False):
+        """
+        Запуск pytest в новом процессе или в демоне
+
+        Args:
+            cmd: Команда из _build_pytest_command
+            output_name: Файл вывода pytest в tests_dir
+            append: Дописывать вывод в файл
+
+        Returns:
+            subprocess.Popen или DaemonRun (poll / wait / terminate)
+        """
+        if self.daemon_address:
+            return DaemonClient(self.daemon_address).start(
+                cmd[3:],  # без "python -m pytest"
+                str(self.tests_dir),
+                self._build_env(),
+                output_name,
+                append
+            )
+
+        # Дочерний процесс получает свою копию дескриптора файла вывода
+        with open(self.tests_dir / output_name, "a" if append else "w", encoding="utf-8") as output:
+            return subprocess.Popen(
+                cmd,
+                stdout=output,
+                stderr=subprocess.STDOUT,
+                cwd=str(self.tests_dir),
+                env=self._build_env()
+            )
+
+    def _build_env(self) -> Dict[str, str]:
+        """Окружение pytest: режим браузера, артефакты и путь к плагинам пайплайна"""
+        env = dict(os.environ)
+        env["HEADLESS"] = "true" if self.headless else "false"
+        env["CAPTURE_SCREENSHOTS"] = "true" if self.capture_screenshots else "false"
+        env["CAPTURE_VIDEO"] = "true" if self.capture_video else "false"
+        env["CAPTURE_TRACE"] = "true" if self.capture_trace else "false"
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [str(REPO_ROOT), env.get("PYTHONPATH")])
+        )
+        return env
+
     def _build_pytest_command(
         self,
         test_pattern: str,
-        markers: Optional[List[str]]
+        markers: Optional[List[str]],
+        events_path: Optional[Path] = None,
+        extra_args: Optional[List[str]] = None,
+        isolated: bool = False
     ) -> List[str]:
-        """Построение команды pytest"""
+        """
+        Построение команды pytest
+
+        events_path - файл JSONL событий тестов (плагин pytest_plugin);
+        isolated - перезапуск одного теста: без xdist, шардирования,
+        приоритизации и карантина, а также без записи длительностей,
+        истории и карты влияния (итог перезапусков учитывает сам executor)
+        """
         cmd = [
+            sys.executable,
+            "-m",
             "pytest",
             "-v",
             "--tb=short",
-            f"-n{self.workers}",  # parallel execution
-            f"--alluredir={self.allure_results_dir}",
-            "--json-report",
-            "--json-report-file=test-results.json"
+            "-n0" if isolated else f"-n{self.workers}",  # parallel execution
+            f"--alluredir={self.allure_results_dir}"
         ]
 
-        if self.headless:
-            cmd.append("--headed=false")
+        if events_path is not None:
+            cmd.extend(["-p", EVENTS_PLUGIN, f"--jsonl-events={events_path.resolve()}"])
+
+        # Длительности записываются в каждом прогоне и используются
+        # для LPT расписания воркеров и деления на шарды
+        if not isolated:
+            cmd.extend(["-p", SCHEDULING_PLUGIN, f"--durations-file={self.durations_file.resolve()}"])
+        if self.duration_schedule and not isolated:
+            cmd.extend(["--dist", "loadgroup", "--duration-schedule"])
+        if self.shard and not isolated:
+            cmd.append(f"--shard={self.shard}")
+
+        cmd.extend(["-p", IMPACT_PLUGIN, f"--impact-map={self.impact_map.resolve()}"])
+        if self.record_impact and not isolated:
+            cmd.append("--impact-record")
+
+        if not isolated:
+            cmd.extend(["-p", HISTORY_PLUGIN, f"--history-file={self.history_file.resolve()}"])
+        if self.prioritize and not isolated:
+            cmd.append("--prioritize")
+        if self.max_failures and not isolated:
+            cmd.append(f"--maxfail={self.max_failures}")
+
+        cmd.extend(["-p", QUARANTINE_PLUGIN, f"--quarantine-file={self.quarantine_file.resolve()}"])
+        if self.skip_quarantined and not isolated:
+            cmd.append("--skip-quarantined")
+
+        if extra_args:
+            cmd.extend(extra_args)
 
         if markers:
             for marker in markers:
@@ -180,75 +717,29 @@ class TestExecutor:
 
         return cmd
 
-    def _parse_results(
-        self,
-        result: subprocess.CompletedProcess,
-        duration: float
-    ) -> ExecutionResult:
-        """Парсинг результатов pytest"""
-        # Попытка парсинга JSON отчета
-        json_report_path = self.tests_dir / "test-results.json"
-
-        if json_report_path.exists():
-            with open(json_report_path, 'r') as f:
-                report_data = json.load(f)
-
-            summary = report_data.get("summary", {})
-            tests = []
-
-            for test_data in report_data.get("tests", []):
-                tests.append(TestResult(
-                    test_id=test_data.get("nodeid", ""),
-                    status=test_data.get("outcome", "unknown"),
-                    duration=test_data.get("duration", 0.0),
-                    error_message=test_data.get("call", {}).get("longrepr"),
-                    screenshots=[],
-                    video=None
-                ))
-
-            return ExecutionResult(
-                total=summary.get("total", 0),
-                passed=summary.get("passed", 0),
-                failed=summary.get("failed", 0),
-                skipped=summary.get("skipped", 0),
-                errors=summary.get("error", 0),
-                duration=duration,
-                tests=tests,
-                allure_report_path=str(self.allure_results_dir)
-            )
+    def _parse_results(self, events_path: Path, duration: float) -> ExecutionResult:
+        """
+        Разбор JSONL событий плагина pytest_plugin
 
-        # Fallback: парсинг из stdout
-        return self._parse_stdout(result.stdout, duration)
-
-    def _parse_stdout(self, stdout: str, duration: float) -> ExecutionResult:
-        """Парсинг результатов из stdout"""
-        lines = stdout.split("\n")
-
-        passed = failed = skipped = errors = 0
-
-        for line in lines:
-            if " passed" in line:
-                try:
-                    passed = int(line.split()[0])
-                except:
-                    pass
-            if " failed" in line:
-                try:
-                    failed = int(line.split()[0])
-                except:
-                    pass
-
-        total = passed + failed + skipped + errors
-
-        return ExecutionResult(
-            total=total,
-            passed=passed,
-            failed=failed,
-            skipped=skipped,
-            errors=errors,
-            duration=duration,
-            tests=[]
-        )
+        Файл читается построчно, поэтому память не зависит от объема
+        вывода pytest; незавершенный прогон (нет session_finish)
+        логируется, результаты завершенных тестов сохраняются.
+        """
+        tests = []
+        finished = False
+        if events_path.exists():
+            for event in read_events(str(events_path)):
+                if event.get("event") == "test":
+                    tests.append(TestResult.from_event(event))
+                elif event.get("event") == "session_finish":
+                    finished = True
+
+        if not finished:
+            logger.warning("pytest_run_incomplete",
+                           events=str(events_path),
+                           output=str(self.tests_dir / "pytest-output.log"))
+
+        return ExecutionResult.from_tests(tests, duration, str(self.allure_results_dir))
 
     def generate_allure_report(self) -> str:
         """Генерация Allure HTML отчета"""
@@ -0,0 +1,140 @@
+"""
+Flaky Test Quarantine
+=====================
+
+Учет нестабильных тестов и карантин хронически нестабильных.
+
+TestExecutor перезапускает упавшие тесты по одному в отдельном
+процессе: если повтор проходит, тест нестабилен (flaky), если
+падает каждый раз - падение детерминированное. Для каждого теста
+хранится окно последних прогонов (был ли тест нестабилен), по нему
+считается частота нестабильности. Тест попадает в карантин, когда
+нестабилен в quarantine_after прогонах окна, и выходит из него
+после release_after подряд стабильных прогонов.
+
+На критичных прогонах (``--skip-quarantined``) тесты в карантине
+не собираются и не занимают воркеры.
+
+Модуль импортируется пакетом test_execution раньше регистрации плагина,
+поэтому assert rewriting для него отключен: PYTEST_DONT_REWRITE
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+
+DEFAULT_QUARANTINE_FILE = ".test_quarantine.json"
+
+
+class FlakeStore:
+    """
+    Частота нестабильности тестов и карантин
+
+    Формат файла::
+
+        {"tests": {nodeid: {"runs": [0, 1, 0, ...], "quarantined_at": <timestamp> | null}}}
+    """
+
+    def __init__(
+        self,
+        path: str = DEFAULT_QUARANTINE_FILE,
+        window: int = 20,
+        quarantine_after: int = 3,
+        release_after: int = 10
+    ):
+        """
+        Инициализация
+
+        Args:
+            path: Путь к JSON файлу
+            window: Сколько последних прогонов учитывать
+            quarantine_after: Нестабильных прогонов в окне для карантина
+            release_after: Стабильных прогонов подряд для выхода из карантина
+        """
+        self.path = Path(path)
+        self.window = window
+        self.quarantine_after = quarantine_after
+        self.release_after = release_after
+        self.tests: Dict[str, Dict] = {}
+
+    def load(self) -> 'FlakeStore':
+        """Загрузка (пустое хранилище, если файла нет или он поврежден)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.tests = dict(json.load(f).get("tests", {}))
+        except (OSError, ValueError, AttributeError):
+            self.tests = {}
+        return self
+
+    def save(self):
+        """Атомарная запись"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"tests": self.tests}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def record(self, nodeid: str, flaky: bool) -> Optional[str]:
+        """
+        Учет прогона теста
+
+        Returns:
+            "quarantined" / "released" при изменении статуса карантина, иначе None
+        """
+        entry = self.tests.setdefault(nodeid, {"runs": [], "quarantined_at": None})
+        entry["runs"] = (entry["runs"] + [int(flaky)])[-self.window:]
+
+        if entry["quarantined_at"] is None:
+            if sum(entry["runs"]) >= self.quarantine_after:
+                entry["quarantined_at"] = time.time()
+                return "quarantined"
+        elif len(entry["runs"]) >= self.release_after and not any(entry["runs"][-self.release_after:]):
+            entry["quarantined_at"] = None
+            return "released"
+        return None
+
+    def flake_rate(self, nodeid: str) -> float:
+        """Доля нестабильных прогонов в окне"""
+        runs = self.tests.get(nodeid, {}).get("runs", [])
+        return sum(runs) / len(runs) if runs else 0.0
+
+    def is_quarantined(self, nodeid: str) -> bool:
+        return self.tests.get(nodeid, {}).get("quarantined_at") is not None
+
+    @property
+    def quarantined(self) -> List[str]:
+        return sorted(nodeid for nodeid in self.tests if self.is_quarantined(nodeid))
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("quarantine", "карантин нестабильных тестов")
+    group.addoption(
+        "--skip-quarantined",
+        action="store_true",
+        default=False,
+        help="Не запускать тесты в карантине (критичные прогоны)"
+    )
+    group.addoption(
+        "--quarantine-file",
+        default=DEFAULT_QUARANTINE_FILE,
+        help="JSON файл частоты нестабильности и карантина"
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Исключение тестов в карантине (до шардирования и приоритизации)"""
+    if not config.getoption("skip_quarantined"):
+        return
+
+    store = FlakeStore(config.getoption("quarantine_file")).load()
+    deselected = [item for item in items if store.is_quarantined(item.nodeid)]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if not store.is_quarantined(item.nodeid)]
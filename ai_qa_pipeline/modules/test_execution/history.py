@@ -0,0 +1,254 @@
+"""
+Results History & Test Prioritization
+=====================================
+
+Локальная история результатов тестов и порядок запуска "падения первыми".
+
+История хранит последние исходы каждого теста. Перед запуском
+(``--prioritize``) тесты упорядочиваются так, чтобы первое падение
+проявилось как можно раньше:
+
+1. тесты, упавшие в прошлом прогоне (кроме нестабильных);
+2. новые тесты и тесты, затронутые изменениями (файл теста изменен
+   после прошлого прогона или тест затронут ``--impact-diff``);
+3. остальные.
+
+Внутри группы тесты сортируются по отношению вероятности падения к
+длительности (правило Смита): быстрые тесты с высоким сигналом идут
+раньше. Нестабильные тесты (чередование падений и успехов) получают
+пониженный вес. Вместе с ``--maxfail N`` прогон останавливается после
+первых N падений.
+
+Подключение плагина::
+
+    pytest -p ai_qa_pipeline.modules.test_execution.history \\
+        --prioritize --maxfail 1
+
+Модуль импортируется пакетом test_execution раньше регистрации плагина,
+поэтому assert rewriting для него отключен: PYTEST_DONT_REWRITE
+"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+import pytest
+
+from .scheduling import DurationStore, durations_path, strip_group_suffix
+
+
+DEFAULT_HISTORY_FILE = ".test_history.json"
+
+FAILED_OUTCOMES = ("failed", "error")
+
+
+class ResultsHistory:
+    """
+    История исходов тестов
+
+    Формат файла::
+
+        {"last_run": <timestamp>,
+         "tests": {nodeid: {"outcomes": ["passed", "failed", ...], "last_failed": <timestamp>}}}
+
+    Исходы хранятся от старых к новым, не более max_runs на тест.
+    """
+
+    def __init__(self, path: str = DEFAULT_HISTORY_FILE, max_runs: int = 20):
+        """
+        Инициализация истории
+
+        Args:
+            path: Путь к JSON файлу истории
+            max_runs: Сколько последних исходов хранить для каждого теста
+        """
+        self.path = Path(path)
+        self.max_runs = max_runs
+        self.last_run: Optional[float] = None
+        self.tests: Dict[str, Dict] = {}
+
+    def load(self) -> 'ResultsHistory':
+        """Загрузка истории (пустая история, если файла нет или он поврежден)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.last_run = data.get("last_run")
+            self.tests = dict(data.get("tests", {}))
+        except (OSError, ValueError, AttributeError):
+            self.last_run, self.tests = None, {}
+        return self
+
+    def save(self):
+        """Атомарная запись истории"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"last_run": self.last_run, "tests": self.tests}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def record(self, nodeid: str, outcome: str, timestamp: Optional[float] = None):
+        """Добавление исхода теста (passed, failed, error)"""
+        timestamp = timestamp or time.time()
+        entry = self.tests.setdefault(nodeid, {"outcomes": [], "last_failed": None})
+        entry["outcomes"] = (entry["outcomes"] + [outcome])[-self.max_runs:]
+        if outcome in FAILED_OUTCOMES:
+            entry["last_failed"] = timestamp
+
+    def outcomes(self, nodeid: str) -> List[str]:
+        return self.tests.get(nodeid, {}).get("outcomes", [])
+
+    def failed_last_run(self, nodeid: str) -> bool:
+        outcomes = self.outcomes(nodeid)
+        return bool(outcomes) and outcomes[-1] in FAILED_OUTCOMES
+
+    def failure_probability(self, nodeid: str, decay: float = 0.7) -> float:
+        """
+        Оценка вероятности падения: доля падений с экспоненциально
+        убывающим весом старых прогонов и сглаживанием (для тестов
+        без истории - априорные 0.1)
+        """
+        weight = total = failures = 0.0
+        for age, outcome in enumerate(reversed(self.outcomes(nodeid))):
+            weight = decay ** age
+            total += weight
+            failures += weight * (outcome in FAILED_OUTCOMES)
+        return (failures + 0.1) / (total + 1.0)
+
+    def is_flaky(self, nodeid: str, window: int = 10, min_flips: int = 2) -> bool:
+        """Нестабильный тест: исход менялся хотя бы min_flips раз за последние window прогонов"""
+        outcomes = [outcome in FAILED_OUTCOMES for outcome in self.outcomes(nodeid)[-window:]]
+        flips = sum(1 for previous, current in zip(outcomes, outcomes[1:]) if previous != current)
+        return flips >= min_flips
+
+
+def prioritize(
+    nodeids: Iterable[str],
+    history: ResultsHistory,
+    durations: Dict[str, float],
+    changed: Optional[Set[str]] = None,
+    flaky_weight: float = 0.5
+) -> List[str]:
+    """
+    Порядок запуска "падения первыми"
+
+    Args:
+        nodeids: Тесты в порядке сбора
+        history: История результатов
+        durations: Ожидаемые длительности тестов (сек)
+        changed: Тесты, затронутые изменениями с прошлого прогона
+        flaky_weight: Множитель вероятности падения нестабильных тестов
+
+    Returns:
+        nodeids в порядке запуска (при равенстве - порядок сбора)
+    """
+    changed = changed or set()
+    nodeids = list(nodeids)
+
+    def key(indexed):
+        index, nodeid = indexed
+        flaky = history.is_flaky(nodeid)
+        if history.failed_last_run(nodeid) and not flaky:
+            tier = 0
+        elif nodeid in changed or nodeid not in history.tests:
+            tier = 1
+        else:
+            tier = 2
+        probability = history.failure_probability(nodeid) * (flaky_weight if flaky else 1.0)
+        return tier, -probability / max(durations.get(nodeid, 1.0), 0.01), index
+
+    return [nodeid for _, nodeid in sorted(enumerate(nodeids), key=key)]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("history", "история результатов и приоритизация")
+    group.addoption(
+        "--prioritize",
+        action="store_true",
+        default=False,
+        help="Запускать первыми недавно упавшие, измененные и быстрые информативные тесты"
+    )
+    group.addoption(
+        "--history-file",
+        default=None,
+        help=f"JSON файл истории результатов тестов (по умолчанию {DEFAULT_HISTORY_FILE}); "
+             "исходы записываются только при явном файле или --prioritize"
+    )
+
+
+def history_path(config) -> str:
+    """Файл истории (явно указанный или по умолчанию)"""
+    return config.getoption("history_file") or DEFAULT_HISTORY_FILE
+
+
+def _changed_tests(config, items, history: ResultsHistory) -> Set[str]:
+    """Тесты, чей файл изменен после прошлого прогона или затронутые --impact-diff"""
+    changed = set()
+    if history.last_run is not None:
+        for item in items:
+            try:
+                if item.path.stat().st_mtime > history.last_run:
+                    changed.add(item.nodeid)
+            except OSError:
+                continue
+
+    if config.pluginmanager.has_plugin("ai_qa_pipeline.modules.test_execution.impact"):
+        from .impact import ImpactMap, changed_files_from_options
+        files = changed_files_from_options(config)
+        if files is not None:
+            impact_map = ImpactMap(config.getoption("impact_map")).load()
+            changed |= impact_map.impacted([item.nodeid for item in items], files)
+    return changed
+
+
+def pytest_collection_modifyitems(config, items):
+    """Переупорядочивание тестов (после отбора по шардам и влиянию)"""
+    if not config.getoption("prioritize"):
+        return
+
+    history = ResultsHistory(history_path(config)).load()
+    nodeids = [item.nodeid for item in items]
+    durations = DurationStore(durations_path(config)).load().estimate(nodeids)
+
+    order = prioritize(nodeids, history, durations, _changed_tests(config, items, history))
+    position = {nodeid: index for index, nodeid in enumerate(order)}
+    items.sort(key=lambda item: position[item.nodeid])
+
+
+class HistoryRecorder:
+    """Плагин, записывающий исходы завершенных тестов в ResultsHistory"""
+
+    def __init__(self, history: ResultsHistory):
+        self.history = history
+        self.started = time.time()
+        self._outcomes: Dict[str, str] = {}
+
+    def pytest_runtest_logreport(self, report):
+        nodeid = strip_group_suffix(report.nodeid)
+        outcome = self._outcomes.setdefault(nodeid, "passed")
+        if report.failed and outcome not in FAILED_OUTCOMES:
+            self._outcomes[nodeid] = "failed" if report.when == "call" else "error"
+        elif report.skipped and outcome == "passed":
+            self._outcomes[nodeid] = "skipped"
+
+    def pytest_sessionfinish(self, session):
+        recorded = False
+        for nodeid, outcome in self._outcomes.items():
+            if outcome != "skipped":
+                self.history.record(nodeid, outcome, self.started)
+                recorded = True
+        if recorded:
+            self.history.last_run = self.started
+            self.history.save()
+
+
+def pytest_configure(config):
+    # Исходы записывает только контроллер: отчеты воркеров xdist пересылаются ему.
+    # Обычный локальный прогон историю не переписывает: запись только при
+    # явном --history-file (TestExecutor передает его всегда) или --prioritize
+    explicit = config.getoption("history_file") or config.getoption("prioritize")
+    if not hasattr(config, "workerinput") and explicit:
+        history = ResultsHistory(history_path(config)).load()
+        config.pluginmanager.register(HistoryRecorder(history), "history_recorder")
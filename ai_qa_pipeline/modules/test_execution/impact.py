@@ -0,0 +1,408 @@
+"""
+Test Impact Analysis
+====================
+
+Запуск только тестов, затронутых изменениями.
+
+При записи (``--impact-record``) для каждого теста собираются файлы
+проекта, код которых выполнялся во время setup/call/teardown
+(page objects, утилиты, фикстуры), и файлы классов и констант,
+импортированных тестовым модулем (чтение конфигурации не выполняет
+код, поэтому трассировка вызовов его не видит). Карта тест -> файлы
+сохраняется в JSON.
+
+При выборе (``--impact-diff REF`` или ``--impact-changed FILE``)
+тест считается затронутым, если изменился его файл или один из
+его зависимых файлов. Тесты, которых еще нет в карте, и изменения
+глобальных файлов (conftest.py, pytest.ini, requirements.txt)
+затрагивают все тесты.
+
+Подключение плагина::
+
+    pytest -p ai_qa_pipeline.modules.test_execution.impact \\
+        --impact-record --impact-diff origin/main --impact-mode only
+
+Модуль импортируется пакетом test_execution раньше регистрации плагина,
+поэтому assert rewriting для него отключен: PYTEST_DONT_REWRITE
+"""
+
+import ast
+import importlib.util
+import inspect
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import types
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+import pytest
+
+from .scheduling import strip_group_suffix
+
+
+DEFAULT_IMPACT_FILE = ".test_impact.json"
+
+# Изменение этих файлов может повлиять на любой тест
+GLOBAL_FILES = ("conftest.py", "pytest.ini", "setup.cfg", "pyproject.toml", "requirements.txt")
+
+IMPACT_MODES = ("only", "first", "rest")
+
+# Ключ user_properties, в котором воркер передает зависимости теста контроллеру
+IMPACT_PROPERTY = "impact_files"
+
+
+class ImpactMap:
+    """
+    Карта зависимостей тестов
+
+    Формат файла: {"tests": {nodeid: [путь файла относительно rootdir, ...]}}
+    """
+
+    def __init__(self, path: str = DEFAULT_IMPACT_FILE):
+        self.path = Path(path)
+        self.tests: Dict[str, List[str]] = {}
+
+    def load(self) -> 'ImpactMap':
+        """Загрузка карты (пустая карта, если файла нет или он поврежден)"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            self.tests = {nodeid: list(files) for nodeid, files in data.get("tests", {}).items()}
+        except (OSError, ValueError, AttributeError):
+            self.tests = {}
+        return self
+
+    def save(self):
+        """Атомарная запись карты"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({"tests": self.tests}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def record(self, nodeid: str, files: Iterable[str]):
+        """Замена зависимостей теста результатом последнего прогона"""
+        self.tests[nodeid] = sorted(set(files))
+
+    def impacted(self, nodeids: Iterable[str], changed_files: Iterable[str]) -> Set[str]:
+        """
+        Тесты, затронутые изменениями
+
+        Args:
+            nodeids: Кандидаты (собранные тесты)
+            changed_files: Измененные файлы относительно rootdir
+
+        Returns:
+            Множество затронутых nodeid
+        """
+        nodeids = list(nodeids)
+        changed = {_normalize(path) for path in changed_files}
+
+        if any(Path(path).name in GLOBAL_FILES for path in changed):
+            return set(nodeids)
+
+        impacted = set()
+        for nodeid in nodeids:
+            dependencies = self.tests.get(nodeid)
+            if dependencies is None or nodeid.split("::", 1)[0] in changed or changed.intersection(dependencies):
+                impacted.add(nodeid)
+        return impacted
+
+
+def _normalize(path: str) -> str:
+    return os.path.normpath(path).replace(os.sep, "/")
+
+
+def changed_files_from_git(base: str = "HEAD", cwd: Optional[str] = None) -> List[str]:
+    """
+    Файлы, измененные относительно ревизии base (включая неотслеживаемые),
+    пути относительно cwd
+
+    Raises:
+        RuntimeError: git недоступен или ревизия не найдена
+    """
+    commands = [
+        ["git", "diff", "--name-only", "--relative", base],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    ]
+    files = []
+    for cmd in commands:
+        result = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(f"{' '.join(cmd)}: {result.stderr.strip()}")
+        files.extend(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return files
+
+
+def read_changed_files(path: str) -> List[str]:
+    """Список измененных файлов (по одному пути на строку)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+
+class CallTracer:
+    """
+    Сбор файлов, код которых выполнялся (sys.setprofile)
+
+    Профилировщик реагирует только на события "call" Python функций,
+    поэтому накладные расходы заметно меньше, чем у построчного trace.
+    Потоки, запущенные во время трассировки, тоже отслеживаются.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+        self._filenames: Set[str] = set()
+        self._previous = None
+        self._relative: Dict[str, Optional[str]] = {}
+
+    def _profile(self, frame, event, arg):
+        if event == "call":
+            self._filenames.add(frame.f_code.co_filename)
+
+    def start(self):
+        self._filenames = set()
+        self._previous = sys.getprofile()
+        sys.setprofile(self._profile)
+        threading.setprofile(self._profile)
+
+    def stop(self) -> Set[str]:
+        """Остановка трассировки; файлы проекта относительно root"""
+        sys.setprofile(self._previous)
+        threading.setprofile(None)
+        return {path for path in map(self.relative, self._filenames) if path}
+
+    @contextmanager
+    def section(self):
+        """
+        Отдельный учет файлов блока внутри текущей трассировки
+
+        Yields:
+            Множество, заполняемое файлами проекта блока при выходе
+            (они же остаются и в общей трассировке)
+        """
+        outer, self._filenames = self._filenames, set()
+        files: Set[str] = set()
+        try:
+            yield files
+        finally:
+            # Профилировщик продолжает добавлять файлы - сначала вернуть общий набор
+            section, self._filenames = self._filenames, outer
+            outer |= section
+            files.update(path for path in map(self.relative, section) if path)
+
+    def relative(self, filename: str) -> Optional[str]:
+        """Путь относительно root для файлов проекта (None для stdlib и site-packages)"""
+        if filename not in self._relative:
+            self._relative[filename] = self._resolve(filename)
+        return self._relative[filename]
+
+    def _resolve(self, filename: str) -> Optional[str]:
+        if not filename or filename.startswith("<"):
+            return None
+        try:
+            path = Path(filename).resolve().relative_to(self.root)
+        except ValueError:
+            return None
+        if any(part in ("site-packages", ".venv", "venv") for part in path.parts):
+            return None
+        return path.as_posix()
+
+
+def module_dependencies(module, tracer: CallTracer) -> Set[str]:
+    """
+    Файлы, от которых тестовый модуль зависит через from-импорты данных
+
+    Вызовы функций и методов видны трассировке, а чтение констант
+    и атрибутов классов (Config.BASE_URL, READY_SELECTORS) - нет,
+    поэтому импортированные классы и константы считаются зависимостями
+    всех тестов модуля, а функции и модули - нет.
+    """
+    source = getattr(module, "__file__", None)
+    try:
+        with open(source, 'r', encoding='utf-8') as f:
+            tree = ast.parse(f.read())
+    except (OSError, TypeError, SyntaxError, ValueError):
+        return set()
+
+    files = set()
+    namespace = vars(module)
+    for node in tree.body:
+        if not isinstance(node, ast.ImportFrom):
+            continue
+        try:
+            origin = importlib.util.resolve_name("." * node.level + (node.module or ""), module.__package__)
+        except (ImportError, ValueError):
+            continue
+        for alias in node.names:
+            value = namespace.get(alias.asname or alias.name)
+            if value is None or isinstance(value, (types.FunctionType, types.ModuleType)):
+                continue
+            defined_in = getattr(value, "__module__", None) if isinstance(value, type) else origin
+            path = tracer.relative(getattr(sys.modules.get(defined_in or ""), "__file__", None) or "")
+            if path:
+                files.add(path)
+    return files
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("impact", "анализ влияния изменений на тесты")
+    group.addoption(
+        "--impact-record",
+        action="store_true",
+        default=False,
+        help="Записывать зависимости тестов от файлов проекта в карту влияния"
+    )
+    group.addoption(
+        "--impact-map",
+        default=DEFAULT_IMPACT_FILE,
+        help="JSON файл карты влияния"
+    )
+    group.addoption(
+        "--impact-diff",
+        default=None,
+        help="Выбирать тесты, затронутые изменениями относительно git ревизии"
+    )
+    group.addoption(
+        "--impact-changed",
+        default=None,
+        help="Файл со списком измененных файлов (вместо --impact-diff)"
+    )
+    group.addoption(
+        "--impact-mode",
+        choices=IMPACT_MODES,
+        default="only",
+        help="only - только затронутые тесты, first - затронутые первыми, "
+             "rest - только незатронутые (догоняющий прогон)"
+    )
+
+
+def changed_files_from_options(config) -> Optional[List[str]]:
+    """
+    Измененные файлы из опций относительно rootdir
+    (None - отбор по влиянию выключен)
+
+    Пути в файле списка и вывод git - относительно каталога запуска pytest.
+    """
+    invocation_dir = config.invocation_params.dir
+    if config.getoption("impact_changed"):
+        files = read_changed_files(config.getoption("impact_changed"))
+    elif config.getoption("impact_diff"):
+        files = changed_files_from_git(config.getoption("impact_diff"), cwd=str(invocation_dir))
+    else:
+        return None
+    return [os.path.relpath(invocation_dir / path, config.rootpath) for path in files]
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Отбор или переупорядочивание тестов по затронутости изменениями"""
+    changed = changed_files_from_options(config)
+    if changed is None:
+        return
+
+    impact_map = ImpactMap(config.getoption("impact_map")).load()
+    impacted = impact_map.impacted([item.nodeid for item in items], changed)
+    mode = config.getoption("impact_mode")
+
+    if mode == "first":
+        # Стабильная сортировка: порядок внутри групп сохраняется
+        items.sort(key=lambda item: item.nodeid not in impacted)
+        return
+
+    keep = [item for item in items if (item.nodeid in impacted) == (mode == "only")]
+    deselected = [item for item in items if (item.nodeid in impacted) != (mode == "only")]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = keep
+
+
+class ImpactTracer:
+    """
+    Плагин трассировки зависимостей теста (в процессе, выполняющем тесты)
+
+    Фикстуры session/module scope создаются один раз, поэтому код,
+    выполненный при их создании, запоминается отдельно и добавляется
+    каждому тесту, использующему фикстуру, вместе с файлом ее определения.
+    """
+
+    def __init__(self, root: Path):
+        self.tracer = CallTracer(root)
+        self._modules: Dict[str, Set[str]] = {}
+        self._fixtures: Dict[int, Set[str]] = {}  # id(FixtureDef) -> файлы
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        self.tracer.start()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        if fixturedef.scope == "function":
+            yield
+            return
+        with self.tracer.section() as files:
+            yield
+        self._fixtures[id(fixturedef)] = files
+
+    def fixture_dependencies(self, item) -> Set[str]:
+        """Файлы определений фикстур теста и код, выполненный при создании общих фикстур"""
+        files = set()
+        fixtureinfo = getattr(item, "_fixtureinfo", None)
+        for fixturedefs in (fixtureinfo.name2fixturedefs.values() if fixtureinfo else ()):
+            for fixturedef in fixturedefs:
+                try:
+                    source = inspect.getsourcefile(fixturedef.func)
+                except TypeError:
+                    source = None
+                path = self.tracer.relative(source or "")
+                if path:
+                    files.add(path)
+                files |= self._fixtures.get(id(fixturedef), set())
+        return files
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        if call.when == "teardown":
+            files = self.tracer.stop() | self.fixture_dependencies(item)
+            module = getattr(item, "module", None)
+            if module is not None:
+                if module.__name__ not in self._modules:
+                    self._modules[module.__name__] = module_dependencies(module, self.tracer)
+                files |= self._modules[module.__name__]
+            item.user_properties.append((IMPACT_PROPERTY, sorted(files)))
+        yield
+
+
+class ImpactRecorder:
+    """Плагин, сохраняющий зависимости завершенных тестов в ImpactMap (контроллер)"""
+
+    def __init__(self, impact_map: ImpactMap):
+        self.impact_map = impact_map
+        self.recorded = 0
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == IMPACT_PROPERTY:
+                self.impact_map.record(strip_group_suffix(report.nodeid), value)
+                self.recorded += 1
+
+    def pytest_sessionfinish(self, session):
+        if self.recorded:
+            self.impact_map.save()
+
+
+def pytest_configure(config):
+    if not config.getoption("impact_record"):
+        return
+    # Трассирует процесс, выполняющий тесты (на контроллере xdist хуки
+    # выполнения не вызываются); карту пишет только контроллер
+    config.pluginmanager.register(ImpactTracer(config.rootpath.resolve()), "impact_tracer")
+    if not hasattr(config, "workerinput"):
+        impact_map = ImpactMap(config.getoption("impact_map")).load()
+        config.pluginmanager.register(ImpactRecorder(impact_map), "impact_recorder")
@@ -0,0 +1,160 @@
+"""
+JSONL Events Plugin
+===================
+
+Pytest плагин, записывающий событие на каждый завершенный тест
+в JSONL файл сразу по мере выполнения. TestExecutor читает этот файл
+во время прогона и отдает результаты потребителю без ожидания
+завершения pytest, а после прогона разбирает его построчно
+(read_events), не загружая отчет целиком.
+
+Запись теста::
+
+    {"event": "test", "nodeid": ..., "outcome": "failed", "duration": 1.2,
+     "phases": {"setup": 0.1, "call": 1.0, "teardown": 0.1},
+     "when": "call", "message": "assert 1 == 2", "longrepr": "...",
+     "worker": "gw0", "attachments": ["screenshots/test.png"]}
+
+Вложения тест добавляет через user_properties::
+
+    request.node.user_properties.append(("attachment", path))
+
+Подключение::
+
+    pytest -p ai_qa_pipeline.modules.test_execution.pytest_plugin \\
+        --jsonl-events events.jsonl
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, Iterator
+
+
+# Имя user_properties для путей вложений теста (скриншоты, видео, трейсы)
+ATTACHMENT_PROPERTY = "attachment"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("jsonl-events", "потоковые события тестов")
+    group.addoption(
+        "--jsonl-events",
+        default=None,
+        help="Файл для JSONL событий завершенных тестов"
+    )
+
+
+class JSONLEventWriter:
+    """
+    Сборка отчетов фаз setup/call/teardown в одно событие на тест
+
+    Событие пишется после teardown (или после упавшего setup/call,
+    если teardown не наступит), одной строкой с flush.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+        self._tests = {}
+
+    def write(self, event: dict):
+        self._file.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def pytest_sessionstart(self, session):
+        self.write({"event": "session_start", "timestamp": time.time(), "pid": os.getpid()})
+
+    def pytest_collection_finish(self, session):
+        self.write({"event": "collected", "count": len(session.items)})
+
+    def pytest_runtest_logreport(self, report):
+        test = self._tests.setdefault(report.nodeid, {
+            "event": "test",
+            "nodeid": report.nodeid,
+            "outcome": "passed",
+            "duration": 0.0,
+            "phases": {},
+            "when": None,
+            "message": None,
+            "longrepr": None,
+            "worker": _worker_id(report),
+            "attachments": []
+        })
+        test["duration"] += report.duration
+        test["phases"][report.when] = round(report.duration, 6)
+
+        if report.failed and test["outcome"] not in ("failed", "error"):
+            # Падение в setup/teardown - ошибка окружения, в call - падение теста;
+            # сохраняется первая причина
+            test["outcome"] = "failed" if report.when == "call" else "error"
+            test["when"] = report.when
+            test["message"] = _crash_message(report)
+            test["longrepr"] = str(report.longrepr)
+        elif report.skipped and test["outcome"] == "passed":
+            test["outcome"] = "skipped"
+            test["when"] = report.when
+            test["message"] = test["longrepr"] = _skip_reason(report)
+
+        for name, value in report.user_properties:
+            if name == ATTACHMENT_PROPERTY and value not in test["attachments"]:
+                test["attachments"].append(value)
+
+        if report.when == "teardown":
+            self.write(self._tests.pop(report.nodeid))
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        # Тесты без teardown отчета (прерванный прогон)
+        for test in self._tests.values():
+            self.write(test)
+        self._tests.clear()
+        self.write({"event": "session_finish", "timestamp": time.time(), "exitstatus": int(exitstatus)})
+        self._file.close()
+
+
+def _worker_id(report):
+    """Идентификатор xdist воркера (gw0, gw1...) или None без xdist"""
+    gateway = getattr(getattr(report, "node", None), "gateway", None)
+    return getattr(gateway, "id", None)
+
+
+def _crash_message(report) -> str:
+    """Короткое сообщение об ошибке (строка assert / исключения)"""
+    crash = getattr(report.longrepr, "reprcrash", None)
+    if crash is not None:
+        return crash.message
+    lines = str(report.longrepr).strip().splitlines()
+    return lines[-1] if lines else ""
+
+
+def _skip_reason(report) -> str:
+    """Причина пропуска теста: причина xfail или longrepr (path, lineno, reason)"""
+    wasxfail = getattr(report, "wasxfail", None)
+    if wasxfail is not None:
+        # pytest.xfail("...") добавляет префикс "reason: "
+        return wasxfail.replace("reason: ", "", 1)
+    if isinstance(report.longrepr, tuple) and len(report.longrepr) == 3:
+        return report.longrepr[2].replace("Skipped: ", "", 1)
+    return str(report.longrepr)
+
+
+def read_events(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Построчное чтение JSONL событий (память не зависит от размера прогона)
+
+    Недописанная последняя строка (прерванный процесс) пропускается.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def pytest_configure(config):
+    path = config.getoption("jsonl_events")
+    # Под xdist события пишет только контроллер: отчеты воркеров пересылаются ему
+    if path and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(JSONLEventWriter(path), "jsonl_event_writer")
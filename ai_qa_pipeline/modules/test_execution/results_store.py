@@ -0,0 +1,256 @@
+"""
+Results Store
+=============
+
+Локальная база результатов прогонов (SQLite) и запросы по истории.
+
+TestExecutor записывает в базу каждый прогон: сводку (таблица runs)
+и результат каждого теста (таблица results). По накопленной истории
+строятся перцентили длительностей, тренд доли успешных тестов и список
+самых медленных тестов. JSON файлы history/scheduling хранят только
+сглаженные значения для планирования; база хранит исходные данные.
+
+Просмотр::
+
+    python -m ai_qa_pipeline.modules.test_execution.cli history <tests_dir>
+"""
+
+import json
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+DEFAULT_RESULTS_DB = ".test_results.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    started_at REAL NOT NULL,
+    duration REAL NOT NULL,
+    total INTEGER NOT NULL,
+    passed INTEGER NOT NULL,
+    failed INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    errors INTEGER NOT NULL,
+    flaky INTEGER NOT NULL,
+    metadata TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id TEXT NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    test_id TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    status TEXT NOT NULL,
+    duration REAL NOT NULL,
+    worker TEXT,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    flaky INTEGER NOT NULL DEFAULT 0,
+    error_message TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started ON runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+CREATE INDEX IF NOT EXISTS idx_results_test_time ON results(test_id, timestamp);
+"""
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Перцентиль q (0-100) с линейной интерполяцией"""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+class ResultsStore:
+    """SQLite база прогонов и результатов тестов"""
+
+    def __init__(self, path: str = DEFAULT_RESULTS_DB):
+        """
+        Инициализация (база и схема создаются при первом обращении)
+
+        Args:
+            path: Путь к файлу базы
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.executescript(SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        # WAL: чтение истории не блокирует запись параллельного прогона
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
+
+    def record_run(self, result, metadata: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Запись прогона
+
+        Args:
+            result: ExecutionResult
+            metadata: Параметры прогона (воркеры, шард, маркеры...)
+
+        Returns:
+            run_id записанного прогона
+        """
+        run_id = uuid.uuid4().hex
+        finished_at = time.time()
+        started_at = finished_at - result.duration
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT INTO runs VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run_id, started_at, result.duration, result.total, result.passed,
+                 result.failed, result.skipped, result.errors, result.flaky,
+                 json.dumps(metadata or {}, sort_keys=True))
+            )
+            conn.executemany(
+                "INSERT INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, t.test_id, started_at, t.status, t.duration, t.worker,
+                     t.attempts, int(t.flaky), t.error_message)
+                    for t in result.tests
+                ]
+            )
+        return run_id
+
+    def _recent_runs_clause(self, last_runs: Optional[int]) -> str:
+        """Условие отбора результатов последних N прогонов"""
+        if not last_runs:
+            return "1"
+        return ("run_id IN (SELECT run_id FROM runs ORDER BY started_at DESC "
+                f"LIMIT {int(last_runs)})")
+
+    def run_count(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+
+    def runs(self, last_runs: int = 20) -> List[Dict[str, Any]]:
+        """Сводки последних прогонов (от старых к новым)"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT * FROM runs ORDER BY started_at DESC LIMIT ?", (last_runs,)
+            ).fetchall()
+        runs = []
+        for row in reversed(rows):
+            run = dict(row)
+            run["metadata"] = json.loads(run["metadata"] or "{}")
+            runs.append(run)
+        return runs
+
+    def duration_percentiles(
+        self,
+        test_ids: Optional[Sequence[str]] = None,
+        percentiles: Sequence[float] = (50, 90, 95, 99),
+        last_runs: Optional[int] = None
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Перцентили длительностей тестов (пропущенные тесты не учитываются)
+
+        Args:
+            test_ids: Тесты (по умолчанию - все)
+            percentiles: Перцентили 0-100
+            last_runs: Учитывать только последние N прогонов
+
+        Returns:
+            {test_id: {"p50": ..., "p95": ..., "samples": N}}
+        """
+        query = ("SELECT test_id, duration FROM results WHERE status != 'skipped' AND "
+                 + self._recent_runs_clause(last_runs))
+        params: List[Any] = []
+        if test_ids:
+            query += f" AND test_id IN ({','.join('?' * len(test_ids))})"
+            params.extend(test_ids)
+
+        durations: Dict[str, List[float]] = {}
+        with closing(self._connect()) as conn:
+            for test_id, duration in conn.execute(query, params):
+                durations.setdefault(test_id, []).append(duration)
+
+        return {
+            test_id: {
+                **{f"p{q:g}": round(percentile(values, q), 3) for q in percentiles},
+                "samples": len(values)
+            }
+            for test_id, values in durations.items()
+        }
+
+    def pass_rate_trend(self, test_id: Optional[str] = None, last_runs: int = 20) -> List[Dict[str, Any]]:
+        """
+        Доля успешных тестов по прогонам (от старых к новым)
+
+        Args:
+            test_id: Тренд одного теста (по умолчанию - всего набора)
+            last_runs: Количество последних прогонов
+
+        Returns:
+            [{"run_id", "started_at", "total", "passed", "pass_rate"}]
+        """
+        query = """
+            SELECT r.run_id, r.started_at,
+                   COUNT(res.test_id) AS total,
+                   SUM(res.status = 'passed') AS passed,
+                   SUM(res.flaky) AS flaky
+            FROM (SELECT run_id, started_at FROM runs ORDER BY started_at DESC LIMIT ?) AS r
+            JOIN results AS res ON res.run_id = r.run_id AND res.status != 'skipped'
+        """
+        params: List[Any] = [last_runs]
+        if test_id:
+            query += " AND res.test_id = ?"
+            params.append(test_id)
+        query += " GROUP BY r.run_id ORDER BY r.started_at"
+
+        with closing(self._connect()) as conn:
+            rows = conn.execute(query, params).fetchall()
+        return [
+            {
+                "run_id": row["run_id"],
+                "started_at": row["started_at"],
+                "total": row["total"],
+                "passed": row["passed"],
+                "flaky": row["flaky"],
+                "pass_rate": row["passed"] / row["total"] if row["total"] else 0.0
+            }
+            for row in rows
+        ]
+
+    def slowest_tests(self, limit: int = 10, last_runs: Optional[int] = 20) -> List[Dict[str, Any]]:
+        """
+        Самые медленные тесты по медиане длительности
+
+        Args:
+            limit: Количество тестов
+            last_runs: Учитывать только последние N прогонов
+
+        Returns:
+            [{"test_id", "samples", "p50", "p95", "max"}] по убыванию p50
+        """
+        stats = self.duration_percentiles(percentiles=(50, 95, 100), last_runs=last_runs)
+        ranked = sorted(stats.items(), key=lambda item: item[1]["p50"], reverse=True)[:limit]
+        return [
+            {"test_id": test_id, "samples": values["samples"],
+             "p50": values["p50"], "p95": values["p95"], "max": values["p100"]}
+            for test_id, values in ranked
+        ]
+
+    def prune(self, keep_runs: int) -> int:
+        """
+        Удаление старых прогонов
+
+        Returns:
+            Количество удаленных прогонов
+        """
+        with closing(self._connect()) as conn, conn:
+            cursor = conn.execute(
+                "DELETE FROM runs WHERE run_id NOT IN "
+                "(SELECT run_id FROM runs ORDER BY started_at DESC LIMIT ?)",
+                (keep_runs,)
+            )
+            return cursor.rowcount
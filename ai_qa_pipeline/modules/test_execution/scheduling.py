@@ -0,0 +1,345 @@
+"""
+Duration-Based Scheduling
+=========================
+
+Распределение тестов по xdist воркерам с учетом исторических длительностей.
+
+Длительности тестов сохраняются между запусками (экспоненциальное
+сглаживание), а перед запуском тесты раскладываются по воркерам
+жадным алгоритмом LPT (Longest Processing Time first): самый долгий
+тест отправляется на наименее загруженный воркер. Группы назначаются
+маркером xdist_group, поэтому запуск нужен с ``--dist loadgroup``.
+
+Тот же алгоритм делит прогон между несколькими CI машинами:
+``--shard i/N`` оставляет только тесты i-го из N сбалансированных шардов,
+а ``--batch j/M`` дополнительно делит тесты шарда на M последовательных
+пакетов (адаптивный запуск меняет число воркеров между пакетами).
+
+Подключение плагина::
+
+    pytest -p ai_qa_pipeline.modules.test_execution.scheduling \\
+        -n 4 --dist loadgroup --duration-schedule --shard 1/3
+
+Модуль импортируется пакетом test_execution раньше регистрации плагина,
+поэтому assert rewriting для него отключен: PYTEST_DONT_REWRITE
+"""
+
+import heapq
+import json
+import os
+import re
+import statistics
+import tempfile
+from pathlib import Path
+from typing import Dict, List, Set, Tuple
+
+import pytest
+
+
+DEFAULT_DURATIONS_FILE = ".test_durations.json"
+
+
+class DurationStore:
+    """
+    Хранилище длительностей тестов
+
+    Для каждого nodeid хранится сглаженная длительность, чтобы один
+    медленный прогон не перекашивал расписание.
+    """
+
+    def __init__(self, path: str = DEFAULT_DURATIONS_FILE, alpha: float = 0.5):
+        """
+        Инициализация хранилища
+
+        Args:
+            path: Путь к JSON файлу длительностей
+            alpha: Вес нового измерения при сглаживании (0..1]
+        """
+        self.path = Path(path)
+        self.alpha = alpha
+        self.durations: Dict[str, float] = {}
+
+    def load(self) -> 'DurationStore':
+        """Загрузка длительностей с диска (если файл существует)"""
+        if self.path.exists():
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self.durations = {k: float(v) for k, v in json.load(f).items()}
+            except (OSError, ValueError):
+                self.durations = {}
+        return self
+
+    def save(self):
+        """Атомарное сохранение длительностей"""
+        directory = self.path.parent if str(self.path.parent) else Path(".")
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=str(directory), suffix=".tmp")
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(self.durations.items())), f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def record(self, nodeid: str, duration: float):
+        """Учет нового измерения длительности теста"""
+        previous = self.durations.get(nodeid)
+        if previous is None:
+            self.durations[nodeid] = duration
+        else:
+            self.durations[nodeid] = self.alpha * duration + (1 - self.alpha) * previous
+
+    def estimate(self, nodeids: List[str], default: float = 1.0) -> Dict[str, float]:
+        """
+        Оценка длительностей для набора тестов
+
+        Тесты без истории получают медиану известных длительностей
+        (или default, если истории нет совсем).
+
+        Args:
+            nodeids: Идентификаторы тестов
+            default: Оценка при полном отсутствии истории
+
+        Returns:
+            Словарь nodeid -> ожидаемая длительность
+        """
+        known = [self.durations[n] for n in nodeids if n in self.durations]
+        fallback = statistics.median(known) if known else default
+        return {n: self.durations.get(n, fallback) for n in nodeids}
+
+
+def lpt_partition(costs: Dict[str, float], bins: int) -> Dict[str, int]:
+    """
+    Распределение задач по bins корзинам (LPT)
+
+    Args:
+        costs: Словарь задача -> стоимость (длительность)
+        bins: Количество корзин (воркеров)
+
+    Returns:
+        Словарь задача -> номер корзины
+    """
+    bins = max(1, bins)
+    heap = [(0.0, index) for index in range(bins)]
+    assignment = {}
+
+    # Сортировка по убыванию стоимости, при равенстве - по имени для детерминизма
+    for task, cost in sorted(costs.items(), key=lambda item: (-item[1], item[0])):
+        load, index = heapq.heappop(heap)
+        assignment[task] = index
+        heapq.heappush(heap, (load + cost, index))
+
+    return assignment
+
+
+def bin_loads(costs: Dict[str, float], assignment: Dict[str, int]) -> List[float]:
+    """Суммарная стоимость каждой корзины (для отчета о расписании)"""
+    loads = [0.0] * (max(assignment.values(), default=-1) + 1)
+    for task, index in assignment.items():
+        loads[index] += costs[task]
+    return loads
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """
+    Разбор спецификации шарда "i/N" (i от 1 до N)
+
+    Raises:
+        ValueError: Некорректная спецификация
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*/\s*(\d+)\s*", value or "")
+    if not match:
+        raise ValueError(f"Некорректный шард '{value}': ожидается формат i/N")
+    index, total = int(match.group(1)), int(match.group(2))
+    if not 1 <= index <= total:
+        raise ValueError(f"Некорректный шард '{value}': i должен быть от 1 до N")
+    return index, total
+
+
+# ==================== Симуляция расписаний ====================
+
+SIMULATED_STRATEGIES = ("round_robin", "loadfile", "load", "lpt")
+
+
+def simulate_makespan(costs: Dict[str, float], workers: int, strategy: str) -> float:
+    """
+    Время завершения прогона (makespan) при заданной стратегии распределения
+
+    Стратегии:
+        round_robin - статическое деление по индексу теста (наивный шардинг CI)
+        loadfile - файлы целиком на наименее загруженный воркер в порядке сбора
+        load - каждый тест на освободившийся воркер в порядке сбора (xdist --dist load)
+        lpt - статическое LPT расписание по историческим длительностям
+
+    Args:
+        costs: nodeid -> длительность, в порядке сбора тестов
+        workers: Количество воркеров/машин
+        strategy: Имя стратегии из SIMULATED_STRATEGIES
+
+    Returns:
+        Максимальная загрузка воркера
+    """
+    workers = max(1, workers)
+
+    if strategy == "lpt":
+        return max(bin_loads(costs, lpt_partition(costs, workers)), default=0.0)
+
+    if strategy == "round_robin":
+        loads = [0.0] * workers
+        for index, cost in enumerate(costs.values()):
+            loads[index % workers] += cost
+        return max(loads)
+
+    if strategy == "loadfile":
+        files: Dict[str, float] = {}
+        for nodeid, cost in costs.items():
+            path = nodeid.split("::", 1)[0]
+            files[path] = files.get(path, 0.0) + cost
+        units = files.values()
+    elif strategy == "load":
+        units = costs.values()
+    else:
+        raise ValueError(f"Неизвестная стратегия '{strategy}'")
+
+    heap = [0.0] * workers
+    for cost in units:
+        heapq.heappush(heap, heapq.heappop(heap) + cost)
+    return max(heap)
+
+
+def benchmark_strategies(costs: Dict[str, float], workers: int) -> Dict[str, float]:
+    """
+    Makespan всех стратегий и нижняя граница (идеальный баланс)
+
+    Returns:
+        Словарь стратегия -> makespan, плюс "lower_bound"
+    """
+    results = {strategy: simulate_makespan(costs, workers, strategy)
+               for strategy in SIMULATED_STRATEGIES}
+    results["lower_bound"] = max(sum(costs.values()) / max(1, workers), max(costs.values(), default=0.0))
+    return results
+
+
+# ==================== Pytest plugin ====================
+
+def pytest_addoption(parser):
+    group = parser.getgroup("duration-schedule", "распределение тестов по длительностям")
+    group.addoption(
+        "--duration-schedule",
+        action="store_true",
+        default=False,
+        help="Раскладывать тесты по xdist воркерам по историческим длительностям "
+             "(требует --dist loadgroup)"
+    )
+    group.addoption(
+        "--shard",
+        default=None,
+        help="Запускать только шард i/N (шарды сбалансированы по длительностям)"
+    )
+    group.addoption(
+        "--batch",
+        default=None,
+        help="Запускать только пакет j/M тестов (после отбора шарда)"
+    )
+    group.addoption(
+        "--durations-file",
+        default=None,
+        help=f"JSON файл с историческими длительностями тестов (по умолчанию {DEFAULT_DURATIONS_FILE}); "
+             "длительности прогона записываются только в явно указанный файл"
+    )
+
+
+def durations_path(config) -> str:
+    """Файл длительностей для чтения (явно указанный или по умолчанию)"""
+    return config.getoption("durations_file", default=None) or DEFAULT_DURATIONS_FILE
+
+
+def _worker_count(config) -> int:
+    """Количество xdist воркеров (0 если xdist не используется)"""
+    workerinput = getattr(config, "workerinput", None)
+    if workerinput is not None:
+        return int(workerinput.get("workercount", 1))
+    numprocesses = config.getoption("numprocesses", default=None)
+    return numprocesses if isinstance(numprocesses, int) else 0
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Отбор тестов шарда и назначение xdist_group по LPT расписанию
+    (до хука xdist loadgroup)
+    """
+    shard = config.getoption("shard")
+    batch = config.getoption("batch")
+    schedule = config.getoption("duration_schedule")
+    if not shard and not batch and not schedule:
+        return
+
+    store = DurationStore(durations_path(config)).load()
+
+    for spec in (shard, batch):
+        if not spec:
+            continue
+        index, total = parse_shard(spec)
+        assignment = lpt_partition(store.estimate([item.nodeid for item in items]), total)
+        selected = [item for item in items if assignment[item.nodeid] == index - 1]
+        deselected = [item for item in items if assignment[item.nodeid] != index - 1]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+
+    workers = _worker_count(config)
+    if not schedule or workers < 2:
+        return
+
+    costs = store.estimate([item.nodeid for item in items])
+    assignment = lpt_partition(costs, workers)
+
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(name=f"duration_bin_{assignment[item.nodeid]}"))
+
+
+class DurationRecorder:
+    """
+    Плагин, записывающий длительности завершенных тестов в DurationStore
+
+    Длительность теста - сумма setup, call и teardown: основная цена
+    браузерных тестов часто в фикстурах (логин, контекст браузера).
+    Записывается по отчету teardown; пропущенные тесты не учитываются.
+    """
+
+    def __init__(self, store: DurationStore):
+        self.store = store
+        self.recorded = 0
+        self._elapsed: Dict[str, float] = {}
+        self._skipped: Set[str] = set()
+
+    def pytest_runtest_logreport(self, report):
+        nodeid = strip_group_suffix(report.nodeid)
+        elapsed = self._elapsed.pop(nodeid, 0.0) + report.duration
+        if report.skipped:
+            self._skipped.add(nodeid)
+        if report.when != "teardown":
+            self._elapsed[nodeid] = elapsed
+            return
+        if nodeid in self._skipped:
+            self._skipped.discard(nodeid)
+            return
+        self.store.record(nodeid, elapsed)
+        self.recorded += 1
+
+    def pytest_sessionfinish(self, session):
+        if self.recorded:
+            self.store.save()
+
+
+def strip_group_suffix(nodeid: str) -> str:
+    """Удаление суффикса @group, который xdist loadgroup добавляет к nodeid"""
+    return re.sub(r"@[^\[\]/]*$", "", nodeid)
+
+
+def pytest_configure(config):
+    # Длительности собирает только контроллер (или единственный процесс):
+    # отчеты воркеров xdist пересылаются ему. Обычный локальный прогон
+    # файл не переписывает: запись только при явном --durations-file
+    # (TestExecutor передает его всегда)
+    if not hasattr(config, "workerinput") and config.getoption("durations_file"):
+        store = DurationStore(config.getoption("durations_file")).load()
+        config.pluginmanager.register(DurationRecorder(store), "duration_recorder")
@@ -0,0 +1,115 @@
+"""
+Tests for adaptive worker count
+"""
+
+import subprocess
+import sys
+import textwrap
+
+from ai_qa_pipeline.modules.test_execution import executor as ex
+from ai_qa_pipeline.modules.test_execution.concurrency import (
+    AdaptiveConcurrencyController, ResourceSample, ResourceSampler, ResourceStats
+)
+
+
+class FakeSampler:
+    def __init__(self, available_mb):
+        self.available_mb = available_mb
+
+    def sample(self):
+        return ResourceSample(cpu=0.0, available_mb=self.available_mb, used_mb=1000.0, browser_mb=0.0)
+
+
+def make_stats(cpu, available_mb, used_delta_mb=0.0, browser_mb=0.0):
+    baseline = ResourceSample(cpu=0.0, available_mb=available_mb, used_mb=1000.0, browser_mb=0.0)
+    sample = ResourceSample(cpu=cpu, available_mb=available_mb - used_delta_mb,
+                            used_mb=1000.0 + used_delta_mb, browser_mb=browser_mb)
+    return ResourceStats(baseline, [sample])
+
+
+def test_initial_workers_limited_by_cpu_and_memory():
+    big_box = AdaptiveConcurrencyController(max_workers=16, sampler=FakeSampler(64000))
+    small_runner = AdaptiveConcurrencyController(max_workers=16, sampler=FakeSampler(2500))
+    no_memory = AdaptiveConcurrencyController(max_workers=16, sampler=FakeSampler(500))
+
+    assert big_box.initial_workers() == 16
+    assert small_runner.initial_workers() == 2  # (2500 - 1024) // 600
+    assert no_memory.initial_workers() == 1
+
+
+def test_scales_up_when_idle_and_down_under_pressure():
+    controller = AdaptiveConcurrencyController(max_workers=16, sampler=FakeSampler(64000))
+
+    assert controller.adjust(4, make_stats(cpu=0.3, available_mb=64000)) == 5
+    assert controller.adjust(8, make_stats(cpu=0.99, available_mb=64000)) == 6
+    assert controller.adjust(8, make_stats(cpu=0.8, available_mb=64000)) == 8
+
+
+def test_observed_browser_memory_caps_workers():
+    controller = AdaptiveConcurrencyController(max_workers=16, sampler=FakeSampler(5000))
+
+    # 4 воркера с браузерами заняли 4 ГБ из 5: свободной памяти меньше резерва
+    workers = controller.adjust(4, make_stats(cpu=0.3, available_mb=5000,
+                                              used_delta_mb=4000, browser_mb=3000))
+
+    assert controller.worker_memory_mb == 800  # (600 + 1000) / 2
+    assert workers == 3
+
+    # На просторной машине прирост памяти не доходит до резерва: рост по простою CPU
+    roomy = AdaptiveConcurrencyController(max_workers=16, sampler=FakeSampler(8000))
+    assert roomy.adjust(4, make_stats(cpu=0.1, available_mb=8000, used_delta_mb=3000)) == 5
+
+
+def test_proc_sampler_reports_machine_resources():
+    sampler = ResourceSampler()
+    sample = sampler.sample()
+
+    assert 0.0 <= sample.cpu <= 1.0
+    assert sample.available_mb > 0
+    assert sample.used_mb > 0
+    assert sample.browser_mb >= 0
+
+
+SAMPLE_TESTS = textwrap.dedent('''
+    import pytest
+
+    @pytest.mark.parametrize("n", range(8))
+    def test_case(n):
+        pass
+''')
+
+
+def test_batches_cover_all_tests_once(tmp_path):
+    (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+
+    selected = []
+    for index in (1, 2, 3):
+        output = subprocess.run(
+            [sys.executable, "-m", "pytest", "-q", "--collect-only", "-p", "no:cacheprovider",
+             "-p", ex.SCHEDULING_PLUGIN, f"--batch={index}/3", "test_sample.py"],
+            cwd=str(tmp_path), env=ex.TestExecutor(str(tmp_path), workers=1)._build_env(),
+            capture_output=True, text=True
+        ).stdout
+        batch = [line for line in output.splitlines() if "::" in line]
+        assert batch
+        selected.extend(batch)
+
+    assert sorted(selected) == sorted(f"test_sample.py::test_case[{n}]" for n in range(8))
+
+
+def test_run_adaptive_runs_every_batch(tmp_path):
+    (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+    executor = ex.TestExecutor(
+        str(tmp_path),
+        workers="auto",
+        allure_results_dir=str(tmp_path / "allure-results"),
+        poll_interval=0.05
+    )
+    executor.concurrency.max_workers = 2
+    executor.workers = min(executor.workers, 2)
+
+    result = executor.run_adaptive("test_sample.py", batches=2)
+
+    assert result.total == 8
+    assert result.passed == 8
+    assert 1 <= executor.workers <= 2
@@ -0,0 +1,71 @@
+"""
+Tests for the warm test daemon (real daemon process, no browser)
+"""
+
+import os
+import stat
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+from ai_qa_pipeline.modules.test_execution import executor as ex
+
+
+SAMPLE_TESTS = textwrap.dedent('''
+    import sys
+
+    def test_runs_in_warm_process():
+        # Playwright импортирован демоном до запуска прогона
+        assert "playwright.sync_api" in sys.modules
+
+    def test_fail():
+        assert 1 == 2
+''')
+
+
+@pytest.fixture
+def daemon_address(tmp_path):
+    address_file = tmp_path / "daemon.address"
+    process = subprocess.Popen(
+        [sys.executable, "-m", "ai_qa_pipeline.modules.test_execution.cli", "daemon",
+         "--socket", str(tmp_path / "daemon.sock"), "--no-browser", "--address-file", str(address_file)],
+        cwd=str(ex.REPO_ROOT),
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    deadline = time.time() + 60
+    while not address_file.exists() and time.time() < deadline:
+        time.sleep(0.1)
+    try:
+        yield address_file.read_text(encoding="utf-8")
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def test_runs_served_by_warm_daemon(tmp_path, daemon_address):
+    (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+    executor = ex.TestExecutor(
+        str(tmp_path),
+        workers=0,
+        allure_results_dir=str(tmp_path / "allure-results"),
+        poll_interval=0.05,
+        daemon_address=daemon_address
+    )
+
+    batch = executor.run_tests("test_sample.py")
+    streamed = {r.test_id.split("::")[-1]: r.status for r in executor.stream_tests("test_sample.py")}
+
+    assert (batch.total, batch.passed, batch.failed) == (2, 1, 1)
+    assert streamed == {"test_runs_in_warm_process": "passed", "test_fail": "failed"}
+    assert "1 passed" in (tmp_path / "pytest-output.log").read_text(encoding="utf-8")
+
+
+def test_daemon_socket_is_owner_only(daemon_address):
+    info = os.stat(daemon_address)
+
+    assert stat.S_ISSOCK(info.st_mode)
+    assert stat.S_IMODE(info.st_mode) == 0o600
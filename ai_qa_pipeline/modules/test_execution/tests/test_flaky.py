@@ -0,0 +1,100 @@
+"""
+Tests for isolated reruns, flaky classification and quarantine
+"""
+
+import textwrap
+
+from ai_qa_pipeline.modules.test_execution import executor as ex
+from ai_qa_pipeline.modules.test_execution.flaky import FlakeStore
+from ai_qa_pipeline.modules.test_execution.history import ResultsHistory
+
+
+def test_chronically_flaky_test_quarantined_and_released(tmp_path):
+    store = FlakeStore(str(tmp_path / "quarantine.json"), quarantine_after=2, release_after=3)
+
+    assert store.record("t", True) is None
+    assert store.record("t", False) is None
+    assert store.record("t", True) == "quarantined"
+    assert store.flake_rate("t") == 2 / 3
+
+    store.save()
+    reloaded = FlakeStore(str(tmp_path / "quarantine.json"), quarantine_after=2, release_after=3).load()
+    assert reloaded.quarantined == ["t"]
+
+    assert [reloaded.record("t", False) for _ in range(3)] == [None, None, "released"]
+    assert not reloaded.is_quarantined("t")
+
+
+SAMPLE_TESTS = textwrap.dedent('''
+    from pathlib import Path
+
+    def test_stable():
+        pass
+
+    def test_flaky():
+        # Падает на нечетных запусках
+        counter = Path(__file__).with_name("attempts.txt")
+        attempt = int(counter.read_text()) + 1 if counter.exists() else 1
+        counter.write_text(str(attempt))
+        assert attempt % 2 == 0
+
+    def test_broken():
+        assert False
+''')
+
+
+def make_executor(tmp_path, **kwargs):
+    (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+    return ex.TestExecutor(
+        str(tmp_path),
+        workers=2,
+        allure_results_dir=str(tmp_path / "allure-results"),
+        poll_interval=0.05,
+        **kwargs
+    )
+
+
+def test_failures_rerun_in_isolation_and_classified(tmp_path):
+    executor = make_executor(tmp_path, reruns=2)
+
+    result = executor.run_tests("test_sample.py", stream=True)
+
+    tests = {t.test_id.split("::")[-1]: t for t in result.tests}
+    assert (tests["test_flaky"].status, tests["test_flaky"].flaky, tests["test_flaky"].attempts) == ("passed", True, 2)
+    assert (tests["test_broken"].status, tests["test_broken"].flaky, tests["test_broken"].attempts) == ("failed", False, 3)
+    assert (tests["test_stable"].attempts, tests["test_stable"].flaky) == (1, False)
+    assert (result.passed, result.failed, result.flaky) == (2, 1, 1)
+
+    store = FlakeStore(str(tmp_path / ".test_quarantine.json")).load()
+    assert store.flake_rate("test_sample.py::test_flaky") == 1.0
+    assert store.flake_rate("test_sample.py::test_broken") == 0.0
+
+    # Перезапуски не добавляют исходов в историю прогонов
+    history = ResultsHistory(str(tmp_path / ".test_history.json")).load()
+    assert history.outcomes("test_sample.py::test_flaky") == ["failed"]
+    assert history.outcomes("test_sample.py::test_broken") == ["failed"]
+
+
+def test_quarantined_tests_not_run_on_critical_runs(tmp_path):
+    store = FlakeStore(str(tmp_path / ".test_quarantine.json"), quarantine_after=1)
+    store.record("test_sample.py::test_flaky", True)
+    store.save()
+    executor = make_executor(tmp_path, skip_quarantined=True)
+
+    result = executor.run_tests("test_sample.py", stream=True)
+
+    assert sorted(t.test_id for t in result.tests) == ["test_sample.py::test_broken", "test_sample.py::test_stable"]
+
+
+def test_reruns_work_when_rootdir_is_above_tests_dir(tmp_path):
+    # pytest.ini выше tests_dir: nodeid вида suite/test_sample.py::test_flaky
+    (tmp_path / "pytest.ini").write_text("[pytest]\n", encoding="utf-8")
+    tests_dir = tmp_path / "suite"
+    tests_dir.mkdir()
+    executor = make_executor(tests_dir, reruns=2)
+
+    result = executor.run_tests("test_sample.py", stream=True)
+
+    tests = {t.test_id: t for t in result.tests}
+    assert tests["suite/test_sample.py::test_flaky"].flaky
+    assert (result.passed, result.failed, result.flaky) == (2, 1, 1)
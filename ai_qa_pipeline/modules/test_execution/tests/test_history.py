@@ -0,0 +1,119 @@
+"""
+Tests for results history and failure-first ordering
+"""
+
+import subprocess
+import sys
+import textwrap
+
+from ai_qa_pipeline.modules.test_execution import executor as ex
+from ai_qa_pipeline.modules.test_execution.history import ResultsHistory, prioritize
+
+
+def make_history(**outcomes):
+    history = ResultsHistory()
+    for nodeid, sequence in outcomes.items():
+        for outcome in sequence.split():
+            history.record(nodeid, outcome)
+    return history
+
+
+def test_flaky_tests_detected_by_flips():
+    history = make_history(
+        stable="passed passed passed",
+        broken="passed passed failed failed",
+        flaky="passed failed passed failed"
+    )
+
+    assert not history.is_flaky("stable")
+    assert not history.is_flaky("broken")
+    assert history.is_flaky("flaky")
+
+
+def test_recent_failures_weigh_more():
+    history = make_history(recent="passed passed failed", old="failed passed passed")
+
+    assert history.failure_probability("recent") > history.failure_probability("old")
+
+
+def test_failed_then_changed_then_fast_high_signal():
+    history = make_history(
+        slow_risky="passed failed passed",
+        fast_risky="passed failed passed",
+        fast_stable="passed passed passed",
+        broken="passed passed failed",
+        flaky="failed passed failed",
+        changed="passed passed passed"
+    )
+    durations = {"slow_risky": 30.0, "fast_risky": 1.0, "fast_stable": 1.0,
+                 "broken": 5.0, "flaky": 1.0, "changed": 10.0, "new": 2.0}
+
+    order = prioritize(durations, history, durations, changed={"changed"})
+
+    assert order[0] == "broken"
+    assert set(order[1:3]) == {"changed", "new"}
+    assert order.index("fast_risky") < order.index("slow_risky")
+    assert order.index("fast_risky") < order.index("fast_stable")
+    # Нестабильный тест, упавший в прошлый раз, не считается "недавно упавшим"
+    assert order.index("flaky") > order.index("changed")
+
+
+SAMPLE_TESTS = textwrap.dedent('''
+    import time
+
+    def test_a():
+        time.sleep(0.2)
+
+    def test_b():
+        time.sleep(0.2)
+
+    def test_c():
+        time.sleep(0.2)
+
+    def test_regression():
+        assert False
+''')
+
+
+def test_failed_test_runs_first_and_stops_run(tmp_path):
+    (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+    executor = ex.TestExecutor(
+        str(tmp_path),
+        workers=1,
+        allure_results_dir=str(tmp_path / "allure-results"),
+        poll_interval=0.05,
+        prioritize=True,
+        max_failures=1
+    )
+
+    first = [t.test_id for t in executor.stream_tests("test_sample.py")]
+    assert first[-1] == "test_sample.py::test_regression"
+
+    second = [(t.test_id, t.status) for t in executor.stream_tests("test_sample.py")]
+    assert second[0] == ("test_sample.py::test_regression", "failed")
+    assert len(second) < 4
+
+    history = ResultsHistory(str(tmp_path / ".test_history.json")).load()
+    assert history.outcomes("test_sample.py::test_regression") == ["failed", "failed"]
+
+
+def _run_plain_pytest(tmp_path, *options):
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+         "-p", "ai_qa_pipeline.modules.test_execution.scheduling",
+         "-p", "ai_qa_pipeline.modules.test_execution.history", *options],
+        cwd=str(tmp_path), capture_output=True, text=True,
+        env={"PYTHONPATH": str(ex.REPO_ROOT), "PATH": ""}
+    )
+
+
+def test_plain_run_does_not_write_history_or_durations(tmp_path):
+    (tmp_path / "test_sample.py").write_text("def test_ok():\n    pass\n", encoding="utf-8")
+
+    assert _run_plain_pytest(tmp_path).returncode == 0
+    assert not (tmp_path / ".test_history.json").exists()
+    assert not (tmp_path / ".test_durations.json").exists()
+
+    _run_plain_pytest(tmp_path, "--history-file=.test_history.json", "--durations-file=.test_durations.json")
+    assert (tmp_path / ".test_history.json").exists()
+    assert (tmp_path / ".test_durations.json").exists()
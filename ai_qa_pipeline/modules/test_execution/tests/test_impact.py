@@ -0,0 +1,127 @@
+"""
+Tests for test impact analysis
+"""
+
+import json
+import textwrap
+
+from ai_qa_pipeline.modules.test_execution import executor as ex
+from ai_qa_pipeline.modules.test_execution.impact import ImpactMap
+
+
+def test_impacted_by_dependency_and_own_file():
+    impact_map = ImpactMap()
+    impact_map.record("tests/test_a.py::test_login", ["pages/login_page.py", "utils/helpers.py"])
+    impact_map.record("tests/test_b.py::test_cart", ["pages/cart_page.py"])
+    impact_map.record("tests/test_c.py::test_other", [])
+    nodeids = list(impact_map.tests)
+
+    assert impact_map.impacted(nodeids, ["./pages/login_page.py"]) == {"tests/test_a.py::test_login"}
+    assert impact_map.impacted(nodeids, ["tests/test_c.py"]) == {"tests/test_c.py::test_other"}
+    assert impact_map.impacted(nodeids, ["README.md"]) == set()
+
+
+def test_unknown_tests_and_global_files_always_impacted():
+    impact_map = ImpactMap()
+    impact_map.record("tests/test_a.py::test_login", ["pages/login_page.py"])
+
+    assert impact_map.impacted(["tests/test_a.py::test_login", "tests/test_new.py::test_x"],
+                               ["pages/cart_page.py"]) == {"tests/test_new.py::test_x"}
+    assert impact_map.impacted(["tests/test_a.py::test_login"], ["conftest.py"]) == {"tests/test_a.py::test_login"}
+
+
+SAMPLE_PROJECT = {
+    "cart.py": "def add(items, item):\n    return items + [item]\n",
+    "login.py": "def login(user):\n    return user == 'standard_user'\n",
+    "settings.py": "TIMEOUT = 5\n",
+    "test_app.py": textwrap.dedent('''
+        import cart
+        from login import login
+        from settings import TIMEOUT
+
+        def test_cart():
+            assert cart.add([], "x") == ["x"]
+
+        def test_login():
+            assert login("standard_user")
+
+        def test_timeout():
+            assert TIMEOUT == 5
+    '''),
+}
+
+
+def test_record_then_run_only_impacted(tmp_path):
+    for name, source in SAMPLE_PROJECT.items():
+        (tmp_path / name).write_text(source, encoding="utf-8")
+    executor = ex.TestExecutor(
+        str(tmp_path),
+        workers=1,
+        allure_results_dir=str(tmp_path / "allure-results"),
+        poll_interval=0.05,
+        record_impact=True
+    )
+
+    executor.run_tests("test_app.py", stream=True)
+
+    recorded = json.loads((tmp_path / ".test_impact.json").read_text(encoding="utf-8"))["tests"]
+    assert "login.py" in recorded["test_app.py::test_login"]
+    assert "cart.py" not in recorded["test_app.py::test_timeout"]
+    # Модуль с константами виден по импорту тестового модуля
+    assert "settings.py" in recorded["test_app.py::test_timeout"]
+    assert "login.py" not in recorded["test_app.py::test_cart"]
+
+    impacted = executor.run_impacted(changed_files=["login.py"], test_pattern="test_app.py")
+    assert [t.test_id for t in impacted.tests] == ["test_app.py::test_login"]
+
+    everything = executor.run_impacted(changed_files=["login.py"], run_rest=True, test_pattern="test_app.py")
+    assert [t.test_id for t in everything.tests][0] == "test_app.py::test_login"
+    assert everything.total == 3
+
+
+SESSION_FIXTURE_PROJECT = {
+    "server.py": "def start():\n    return 'http://localhost'\n",
+    "server_fixtures.py": textwrap.dedent('''
+        import pytest
+        import server
+
+        @pytest.fixture(scope="session")
+        def app_url():
+            return server.start()
+    '''),
+    "conftest.py": 'pytest_plugins = ["server_fixtures"]\n',
+    "test_app.py": textwrap.dedent('''
+        def test_first(app_url):
+            assert app_url
+
+        def test_second(app_url):
+            assert app_url
+
+        def test_unrelated():
+            pass
+    '''),
+}
+
+
+def test_session_fixture_code_charged_to_every_test(tmp_path):
+    for name, source in SESSION_FIXTURE_PROJECT.items():
+        (tmp_path / name).write_text(source, encoding="utf-8")
+    executor = ex.TestExecutor(
+        str(tmp_path),
+        workers=1,
+        allure_results_dir=str(tmp_path / "allure-results"),
+        poll_interval=0.05,
+        record_impact=True
+    )
+
+    result = executor.run_tests("test_app.py", stream=True)
+    assert result.passed == 3
+
+    recorded = json.loads((tmp_path / ".test_impact.json").read_text(encoding="utf-8"))["tests"]
+    # Фикстура создается один раз (в первом тесте), но нужна обоим
+    for test in ("test_first", "test_second"):
+        assert {"server.py", "server_fixtures.py"} <= set(recorded[f"test_app.py::{test}"])
+    assert "server.py" not in recorded["test_app.py::test_unrelated"]
+
+    impacted = executor.run_impacted(changed_files=["server.py"], test_pattern="test_app.py")
+    assert sorted(t.test_id for t in impacted.tests) == ["test_app.py::test_first", "test_app.py::test_second"]
@@ -0,0 +1,85 @@
+"""
+Tests for the SQLite results store
+"""
+
+import subprocess
+import sys
+import textwrap
+
+from ai_qa_pipeline.modules.test_execution import executor as ex
+from ai_qa_pipeline.modules.test_execution.results_store import ResultsStore, percentile
+
+
+def make_run(outcomes):
+    tests = [ex.TestResult(test_id, status, duration) for test_id, status, duration in outcomes]
+    return ex.ExecutionResult.from_tests(tests, 10.0)
+
+
+def test_percentiles_interpolate():
+    assert percentile([1, 2, 3, 4], 50) == 2.5
+    assert percentile([5], 95) == 5
+    assert percentile([], 50) == 0.0
+
+
+def test_trend_percentiles_and_slowest(tmp_path):
+    store = ResultsStore(str(tmp_path / "results.db"))
+    for index in range(5):
+        store.record_run(make_run([
+            ("fast", "passed", 0.1),
+            ("slow", "passed", 2.0 + index),
+            ("unstable", "failed" if index % 2 else "passed", 1.0),
+            ("skipped", "skipped", 0.0),
+        ]))
+
+    assert store.run_count() == 5
+
+    trend = store.pass_rate_trend(last_runs=3)
+    assert [run["pass_rate"] for run in trend] == [1.0, 2 / 3, 1.0]
+    assert [run["passed"] for run in store.pass_rate_trend("unstable")] == [1, 0, 1, 0, 1]
+
+    stats = store.duration_percentiles(["slow"])
+    assert stats["slow"]["p50"] == 4.0
+    assert stats["slow"]["samples"] == 5
+    assert "skipped" not in store.duration_percentiles()
+
+    slowest = store.slowest_tests(limit=2, last_runs=2)
+    assert [test["test_id"] for test in slowest] == ["slow", "unstable"]
+    assert slowest[0]["max"] == 6.0
+
+    assert store.prune(keep_runs=2) == 3
+    assert store.duration_percentiles(["slow"])["slow"]["samples"] == 2
+
+
+SAMPLE_TESTS = textwrap.dedent('''
+    def test_pass():
+        pass
+
+    def test_fail():
+        assert False
+''')
+
+
+def test_executor_records_each_run(tmp_path):
+    (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+    executor = ex.TestExecutor(
+        str(tmp_path),
+        workers=1,
+        allure_results_dir=str(tmp_path / "allure-results"),
+        poll_interval=0.05
+    )
+
+    executor.run_tests("test_sample.py")
+    executor.run_tests("test_sample.py", stream=True)
+
+    store = ResultsStore(str(tmp_path / ".test_results.db"))
+    runs = store.runs()
+    assert len(runs) == 2
+    assert runs[0]["metadata"]["test_pattern"] == "test_sample.py"
+    assert [run["pass_rate"] for run in store.pass_rate_trend()] == [0.5, 0.5]
+
+    output = subprocess.run(
+        [sys.executable, "-m", "ai_qa_pipeline.modules.test_execution.cli", "history", str(tmp_path)],
+        cwd=str(ex.REPO_ROOT), capture_output=True, text=True
+    ).stdout
+    assert "Slowest tests" in output
+    assert "test_sample.py::test_fail" in output
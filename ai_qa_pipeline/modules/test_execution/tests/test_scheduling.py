@@ -0,0 +1,151 @@
+"""
+Tests for duration-based scheduling
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+from ai_qa_pipeline.modules.test_execution.cli import synthetic_durations
+from ai_qa_pipeline.modules.test_execution import executor as ex
+from ai_qa_pipeline.modules.test_execution.scheduling import (
+    DurationStore,
+    lpt_partition,
+    bin_loads,
+    parse_shard,
+    benchmark_strategies,
+    strip_group_suffix,
+)
+
+
+def test_lpt_balances_long_tests():
+    costs = {"slow": 10.0, **{f"fast_{i}": 1.0 for i in range(10)}}
+
+    assignment = lpt_partition(costs, 2)
+
+    assert bin_loads(costs, assignment) == [10.0, 10.0]
+    assert sum(1 for index in assignment.values() if index == assignment["slow"]) == 1
+
+
+def test_lpt_is_deterministic_for_equal_costs():
+    costs = {f"t{i}": 1.0 for i in range(6)}
+
+    assert lpt_partition(costs, 3) == lpt_partition(dict(reversed(costs.items())), 3)
+
+
+def test_unknown_tests_estimated_with_median(tmp_path):
+    store = DurationStore(str(tmp_path / "durations.json"))
+    store.record("fast", 1.0)
+    store.record("slow", 9.0)
+    store.record("mid", 3.0)
+
+    costs = store.estimate(["fast", "slow", "mid", "new"])
+
+    assert costs["new"] == 3.0
+
+
+def test_durations_are_smoothed_and_persisted(tmp_path):
+    path = tmp_path / "durations.json"
+    store = DurationStore(str(path), alpha=0.5)
+    store.record("test", 10.0)
+    store.record("test", 2.0)
+    store.save()
+
+    assert DurationStore(str(path)).load().durations == {"test": 6.0}
+
+
+FIXTURE_HEAVY_TESTS = """
+import time
+import pytest
+
+@pytest.fixture
+def logged_in():
+    time.sleep(0.3)
+    yield
+    time.sleep(0.2)
+
+def test_with_login(logged_in):
+    pass
+
+@pytest.mark.skip
+def test_skipped(logged_in):
+    pass
+"""
+
+
+def test_recorded_duration_includes_fixtures(tmp_path):
+    (tmp_path / "test_sample.py").write_text(FIXTURE_HEAVY_TESTS, encoding="utf-8")
+    subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider",
+         "-p", "ai_qa_pipeline.modules.test_execution.scheduling",
+         f"--durations-file={tmp_path / 'durations.json'}"],
+        cwd=str(tmp_path), capture_output=True, text=True,
+        env={"PYTHONPATH": str(ex.REPO_ROOT), "PATH": ""}
+    )
+
+    durations = DurationStore(str(tmp_path / "durations.json")).load().durations
+
+    assert list(durations) == ["test_sample.py::test_with_login"]
+    assert durations["test_sample.py::test_with_login"] >= 0.5
+
+
+def test_xdist_group_suffix_removed():
+    assert strip_group_suffix("tests/test_a.py::test_x@duration_bin_1") == "tests/test_a.py::test_x"
+    assert strip_group_suffix("tests/test_a.py::test_x[user@host]") == "tests/test_a.py::test_x[user@host]"
+
+
+def test_shard_spec_parsed_and_validated():
+    assert parse_shard("2/3") == (2, 3)
+    for value in ("0/3", "4/3", "3", "a/b"):
+        with pytest.raises(ValueError):
+            parse_shard(value)
+
+
+def test_lpt_makespan_not_worse_than_naive_distribution():
+    costs = synthetic_durations(200)
+
+    for workers in (2, 4, 8):
+        results = benchmark_strategies(costs, workers)
+        assert results["lower_bound"] <= results["lpt"] <= results["round_robin"]
+        assert results["lpt"] <= results["loadfile"]
+        # LPT гарантирует не хуже 4/3 от оптимума
+        assert results["lpt"] <= results["lower_bound"] * 4 / 3
+
+
+def _collect_shard(tmp_path, shard):
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider",
+         "-p", "ai_qa_pipeline.modules.test_execution.scheduling",
+         f"--durations-file={tmp_path / 'durations.json'}", f"--shard={shard}"],
+        cwd=str(tmp_path), capture_output=True, text=True,
+        env={"PYTHONPATH": str(ex.REPO_ROOT), "PATH": ""}
+    )
+    return {line for line in result.stdout.splitlines() if "::" in line}
+
+
+def test_shards_split_suite_by_durations(tmp_path):
+    (tmp_path / "test_sample.py").write_text(
+        "".join(f"def test_{i}():\n    pass\n\n" for i in range(6)), encoding="utf-8"
+    )
+    store = DurationStore(str(tmp_path / "durations.json"))
+    store.record("test_sample.py::test_0", 10.0)
+    for i in range(1, 6):
+        store.record(f"test_sample.py::test_{i}", 2.0)
+    store.save()
+
+    first, second = _collect_shard(tmp_path, "1/2"), _collect_shard(tmp_path, "2/2")
+
+    assert not first & second
+    assert len(first | second) == 6
+    assert {len(first), len(second)} == {1, 5}
+
+
+def test_executor_command_enables_scheduling(tmp_path):
+    executor = ex.TestExecutor(str(tmp_path), workers=4, duration_schedule=True, shard="1/2")
+
+    cmd = executor._build_pytest_command("test_*.py", None)
+
+    assert f"--durations-file={(tmp_path / '.test_durations.json').resolve()}" in cmd
+    assert cmd[cmd.index("--dist") + 1] == "loadgroup"
+    assert "--duration-schedule" in cmd and "--shard=1/2" in cmd
@@ -0,0 +1,158 @@
+"""
+Tests for streaming execution (real pytest subprocess on a tiny suite)
+"""
+
+import time
+import textwrap
+
+from ai_qa_pipeline.modules.test_execution import executor as ex
+from ai_qa_pipeline.modules.test_execution.pytest_plugin import read_events
+
+
+SAMPLE_TESTS = textwrap.dedent('''
+    import time
+    import pytest
+
+    def test_pass():
+        pass
+
+    def test_fail():
+        assert 1 == 2
+
+    @pytest.mark.skip(reason="not ready")
+    def test_skip():
+        pass
+
+    @pytest.fixture
+    def broken():
+        raise RuntimeError("setup failed")
+
+    def test_error(broken):
+        pass
+
+    def test_slow():
+        time.sleep(1.5)
+''')
+
+
+def make_executor(tmp_path, workers=1):
+    (tmp_path / "test_sample.py").write_text(SAMPLE_TESTS, encoding="utf-8")
+    return ex.TestExecutor(
+        str(tmp_path),
+        workers=workers,
+        allure_results_dir=str(tmp_path / "allure-results"),
+        poll_interval=0.05
+    )
+
+
+def test_results_streamed_before_run_finishes(tmp_path):
+    executor = make_executor(tmp_path)
+    arrivals = []
+
+    result = executor.run_tests("test_sample.py", on_result=lambda r: arrivals.append((r, time.time())))
+    finished_at = time.time()
+
+    statuses = {r.test_id.split("::")[-1]: r.status for r, _ in arrivals}
+    assert statuses == {
+        "test_pass": "passed",
+        "test_fail": "failed",
+        "test_skip": "skipped",
+        "test_error": "error",
+        "test_slow": "passed",
+    }
+    first_arrival = min(at for _, at in arrivals)
+    assert finished_at - first_arrival >= 1.0
+    assert (result.total, result.passed, result.failed, result.skipped, result.errors) == (5, 2, 1, 1, 1)
+
+
+def test_failure_details_in_stream(tmp_path):
+    executor = make_executor(tmp_path, workers=2)
+
+    results = {r.test_id.split("::")[-1]: r for r in executor.stream_tests("test_sample.py")}
+
+    assert "assert 1 == 2" in results["test_fail"].error_message
+    assert results["test_skip"].error_message == "not ready"
+    assert results["test_pass"].worker.startswith("gw")
+
+
+XFAIL_TESTS = textwrap.dedent('''
+    import pytest
+
+    @pytest.mark.xfail(reason="known bug")
+    def test_marked():
+        assert False
+
+    def test_imperative():
+        pytest.xfail("flaky backend")
+''')
+
+
+def test_xfail_reason_reported(tmp_path):
+    (tmp_path / "test_xfail.py").write_text(XFAIL_TESTS, encoding="utf-8")
+    executor = ex.TestExecutor(str(tmp_path), workers=1, allure_results_dir=str(tmp_path / "allure-results"))
+
+    results = {r.test_id.split("::")[-1]: r for r in executor.run_tests("test_xfail.py").tests}
+
+    assert results["test_marked"].error_message == "known bug"
+    assert results["test_imperative"].error_message == "flaky backend"
+
+
+ATTACHMENT_TESTS = textwrap.dedent('''
+    import time
+    import pytest
+
+    @pytest.fixture
+    def slow_setup():
+        time.sleep(0.3)
+
+    def test_with_screenshot(request, slow_setup):
+        request.node.user_properties.append(("attachment", "screenshots/checkout.png"))
+        request.node.user_properties.append(("attachment", "videos/checkout.webm"))
+        assert "total" == "subtotal"
+''')
+
+
+def test_batch_run_parses_jsonl_records(tmp_path):
+    (tmp_path / "test_attachments.py").write_text(ATTACHMENT_TESTS, encoding="utf-8")
+    executor = ex.TestExecutor(str(tmp_path), workers=1, allure_results_dir=str(tmp_path / "allure-results"))
+
+    result = executor.run_tests("test_attachments.py")
+
+    assert (result.total, result.failed) == (1, 1)
+    test = result.tests[0]
+    assert test.error_message.startswith("AssertionError: assert 'total' == 'subtotal'")
+    assert "in test_with_screenshot" in test.error_traceback
+    assert set(test.phases) == {"setup", "call", "teardown"}
+    assert test.phases["setup"] >= 0.3
+    assert test.screenshots == ["screenshots/checkout.png"]
+    assert test.video == "videos/checkout.webm"
+    assert not (tmp_path / "test-results.json").exists()
+
+
+def test_truncated_event_line_skipped(tmp_path):
+    events = tmp_path / "events.jsonl"
+    events.write_text(
+        '{"event": "test", "nodeid": "t::a", "outcome": "passed"}\n{"event": "test", "nodeid": "t::b", "outc',
+        encoding="utf-8"
+    )
+
+    assert [event["nodeid"] for event in read_events(str(events))] == ["t::a"]
+
+
+class FinishedProcess:
+    def poll(self):
+        return -15
+
+
+def test_truncated_line_of_killed_run_skipped_while_following(tmp_path):
+    events = tmp_path / "events.jsonl"
+    events.write_text(
+        '{"event": "test", "nodeid": "t::a", "outcome": "passed"}\n{"event": "test", "nodeid": "t::b", "outc',
+        encoding="utf-8"
+    )
+    executor = ex.TestExecutor(str(tmp_path), workers=1, allure_results_dir=str(tmp_path / "allure-results"))
+
+    with open(events, 'r', encoding='utf-8') as f:
+        followed = list(executor._follow_events(f, FinishedProcess()))
+
+    assert [event["nodeid"] for event in followed] == ["t::a"]
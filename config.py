@@ -16,19 +16,62 @@ class Config:
     APPLITOOLS_API_KEY = os.getenv('APPLITOOLS_API_KEY', '')
     APPLITOOLS_SERVER_URL = 'https://eyes.applitools.com'
 
+    # Движок визуальных проверок: applitools или local (эталоны на диске)
+    VISUAL_ENGINE = os.getenv('VISUAL_ENGINE', 'applitools').lower()
+    VISUAL_BASELINE_DIR = os.getenv('VISUAL_BASELINE_DIR', 'visual_baselines')
+    VISUAL_DIFF_DIR = os.getenv('VISUAL_DIFF_DIR', 'reports/visual_diffs')
+    VISUAL_TOLERANCE = int(os.getenv('VISUAL_TOLERANCE', '16'))
+    VISUAL_UPDATE_BASELINE = os.getenv('VISUAL_UPDATE_BASELINE', 'false').lower() == 'true'
+    # Потоки фонового сравнения контрольных точек (0 - сравнение в тесте)
+    VISUAL_CHECK_WORKERS = int(os.getenv('VISUAL_CHECK_WORKERS', '2'))
+
     # Настройки приложения
-    BASE_URL = os.getenv('BASE_URL', 'https://www.saucedemo.com')
+    BASE_URL = os.getenv('BASE_URL', 'https://www.saucedemo.com').rstrip('/')
+
+    # Локальная сборка приложения (пусто - тесты идут на BASE_URL)
+    LOCAL_APP_DIR = os.getenv('LOCAL_APP_DIR', '')
+
+    # Кеш статических ресурсов и блокировка сторонней аналитики
+    ASSET_CACHE = os.getenv('ASSET_CACHE', 'false').lower() == 'true'
+    ASSET_CACHE_DIR = os.getenv('ASSET_CACHE_DIR', '.asset_cache')
+    BLOCK_THIRD_PARTY = os.getenv('BLOCK_THIRD_PARTY', 'false').lower() == 'true'
 
     # Настройки браузера
     BROWSER = os.getenv('BROWSER', 'chromium')
     HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
     VIEWPORT_WIDTH = 1920
     VIEWPORT_HEIGHT = 1080
+    # Перезапуск браузера воркера после N тестов (0 - без перезапуска)
+    BROWSER_RECYCLE_AFTER = int(os.getenv('BROWSER_RECYCLE_AFTER', '0'))
+    # Подключение к запущенному Chromium по CDP вместо запуска браузера
+    # (задается демоном test_execution для своих прогонов)
+    BROWSER_CDP_ENDPOINT = os.getenv('BROWSER_CDP_ENDPOINT', '')
+
+    # Максимум одновременных сценариев в async раннере
+    ASYNC_CONCURRENCY = int(os.getenv('ASYNC_CONCURRENCY', '8'))
 
     # Тестовые учетные данные
     TEST_USERNAME = os.getenv('TEST_USERNAME', 'standard_user')
     TEST_PASSWORD = os.getenv('TEST_PASSWORD', 'secret_sauce')
 
+    # Кеш авторизованных сессий (storage state)
+    AUTH_STATE_DIR = os.getenv('AUTH_STATE_DIR', '.auth')
+    AUTH_STATE_MAX_AGE = int(os.getenv('AUTH_STATE_MAX_AGE', '600'))
+
+    # Замеры производительности действий page objects (включать в CI;
+    # тесты с маркером perf_budget замеряются всегда)
+    PERF_TIMING = os.getenv('PERF_TIMING', 'false').lower() == 'true'
+    PERF_LOG_FILE = os.getenv('PERF_LOG_FILE', 'reports/perf_timing.jsonl')
+    # Бюджет по умолчанию для любого действия в мс (0 - без бюджета)
+    PERF_BUDGET_MS = int(os.getenv('PERF_BUDGET_MS', '0'))
+
+    # Артефакты упавших тестов (сжимаются и дедуплицируются в фоне)
+    ARTIFACTS_DIR = os.getenv('ARTIFACTS_DIR', 'reports/artifacts')
+    ARTIFACT_WORKERS = int(os.getenv('ARTIFACT_WORKERS', '2'))
+    CAPTURE_SCREENSHOTS = os.getenv('CAPTURE_SCREENSHOTS', 'true').lower() == 'true'
+    CAPTURE_TRACE = os.getenv('CAPTURE_TRACE', 'false').lower() == 'true'
+    CAPTURE_VIDEO = os.getenv('CAPTURE_VIDEO', 'false').lower() == 'true'
+
     # Таймауты (в миллисекундах для Playwright)
     DEFAULT_TIMEOUT = 30000
     NAVIGATION_TIMEOUT = 30000
@@ -41,8 +84,13 @@ class Config:
     @classmethod
     def validate(cls):
         """Валидация обязательных настроек"""
-        if not cls.APPLITOOLS_API_KEY:
+        if cls.VISUAL_ENGINE not in ('applitools', 'local'):
+            raise ValueError(
+                f"Неизвестный VISUAL_ENGINE '{cls.VISUAL_ENGINE}': допустимо applitools или local"
+            )
+        if cls.VISUAL_ENGINE == 'applitools' and not cls.APPLITOOLS_API_KEY:
             raise ValueError(
                 "APPLITOOLS_API_KEY не установлен. "
-                "Создайте .env файл на основе .env.example и добавьте ваш API ключ"
+                "Создайте .env файл на основе .env.example и добавьте ваш API ключ "
+                "или используйте локальный движок VISUAL_ENGINE=local"
             )
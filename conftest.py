@@ -2,28 +2,66 @@
 Конфигурация pytest и фикстуры для тестов
 """
 import pytest
-from playwright.sync_api import sync_playwright, Browser, Page, BrowserContext
+from playwright.sync_api import sync_playwright, Browser, Page, BrowserContext, Error as PlaywrightError
 from applitools.playwright import Eyes, Target, BatchInfo, Configuration as EyesConfiguration, ClassicRunner
 from config import Config
+from utils.browser_pool import BrowserPool
+from utils.auth_state import AuthStateCache, open_authenticated_page
+from utils.asset_cache import StaticAssetCache
+from utils.local_app_server import LocalAppServer
+from utils.async_runner import AsyncFlowRunner
+from utils.perf_timing import PerformanceRecorder
+from utils.visual_diff import LocalEyes, LocalRunner
+from utils.checkpoint_queue import CheckpointQueue
+from utils.artifact_store import ArtifactStore, ContextArtifacts
+from ai_qa_pipeline.modules.test_execution.pytest_plugin import ATTACHMENT_PROPERTY
 import os
 
+# Распределение тестов по xdist воркерам по историческим длительностям
+# (pytest -n 4 --dist loadgroup --duration-schedule), запуск только
+# тестов, затронутых изменениями (pytest --impact-diff origin/main),
+# порядок "падения первыми" (pytest --prioritize --maxfail 1)
+# и исключение тестов в карантине (pytest --skip-quarantined)
+pytest_plugins = [
+    "ai_qa_pipeline.modules.test_execution.scheduling",
+    "ai_qa_pipeline.modules.test_execution.impact",
+    "ai_qa_pipeline.modules.test_execution.history",
+    "ai_qa_pipeline.modules.test_execution.flaky",
+]
+
+# Тест упал (setup или call): по нему фикстуры решают, сохранять ли артефакты
+TEST_FAILED = pytest.StashKey[bool]()
+
+# Фикстуры страниц, с которых снимается скриншот при падении
+PAGE_FIXTURES = ("page", "authenticated_page", "eyes_page")
+
 
 @pytest.fixture(scope="session")
 def config():
     """
     Фикстура для загрузки конфигурации
-    Валидирует наличие API ключа Applitools
+    Валидирует наличие API ключа Applitools (для VISUAL_ENGINE=applitools)
     """
     Config.validate()
     return Config
 
 
 @pytest.fixture(scope="session")
-def runner():
+def runner(config):
     """
     Фикстура для создания ClassicRunner
     Используется для сбора результатов всех тестов
     """
+    if config.VISUAL_ENGINE == 'local':
+        # Сравнение скриншотов в фоновых потоках, тест не ждет обработки
+        queue = CheckpointQueue(config.VISUAL_CHECK_WORKERS) if config.VISUAL_CHECK_WORKERS else None
+        local_runner = LocalRunner(queue)
+        yield local_runner
+        if queue is not None:
+            queue.shutdown()
+        print_local_visual_summary(local_runner)
+        return
+
     classic_runner = ClassicRunner()
     yield classic_runner
 
@@ -41,6 +79,27 @@ def runner():
     print(f"{'='*80}\n")
 
 
+def print_local_visual_summary(local_runner):
+    """Сводка результатов локального движка визуальных проверок"""
+    print(f"\n{'='*80}")
+    print("LOCAL VISUAL TEST RESULTS SUMMARY")
+    print(f"{'='*80}")
+    all_results = local_runner.get_all_results()
+    print(f"Total tests: {len(all_results)}")
+
+    for result in all_results:
+        status = "✓ PASSED" if result.is_passed else "✗ FAILED"
+        print(f"{status}: {result.name}")
+        print(f"  Diffs: {result.url}")
+        for check in result.checks:
+            if check.baseline_created:
+                print(f"  {check.name}: новый эталон {check.baseline_path}")
+            elif not check.passed:
+                print(f"  {check.name}: {len(check.boxes)} областей изменений, "
+                      f"{check.diff_ratio:.2%} пикселей, diff: {check.diff_path}")
+    print(f"{'='*80}\n")
+
+
 @pytest.fixture(scope="session")
 def playwright_instance():
     """
@@ -51,49 +110,189 @@ def playwright_instance():
         yield playwright
 
 
+@pytest.fixture(scope="session", autouse=True)
+def app_server():
+    """
+    Фикстура локального сервера приложения
+    Если задан LOCAL_APP_DIR, сборка приложения раздается локально
+    и BASE_URL page objects указывает на нее
+    """
+    if not Config.LOCAL_APP_DIR:
+        yield None
+        return
+
+    server = LocalAppServer(Config.LOCAL_APP_DIR).start()
+    original_base_url = Config.BASE_URL
+    Config.BASE_URL = server.url
+    yield server
+    Config.BASE_URL = original_base_url
+    server.stop()
+
+
+@pytest.fixture(scope="session")
+def asset_cache(config):
+    """
+    Фикстура кеша статических ресурсов
+    Включается через ASSET_CACHE=true и/или BLOCK_THIRD_PARTY=true
+    """
+    if not (config.ASSET_CACHE or config.BLOCK_THIRD_PARTY):
+        return None
+    return StaticAssetCache(
+        config.ASSET_CACHE_DIR,
+        cache_static=config.ASSET_CACHE,
+        block_third_party=config.BLOCK_THIRD_PARTY
+    )
+
+
+@pytest.fixture(scope="session")
+def browser_pool(playwright_instance, config, asset_cache):
+    """
+    Фикстура пула браузеров
+    Scope: session - один браузер на процесс (xdist воркер),
+    переиспользуется всеми тестами воркера и перезапускается при падении
+    """
+    pool = BrowserPool(
+        playwright_instance,
+        browser_name=config.BROWSER,
+        headless=config.HEADLESS,
+        max_contexts_per_browser=config.BROWSER_RECYCLE_AFTER,
+        context_setup=asset_cache.attach if asset_cache is not None else None,
+        cdp_endpoint=config.BROWSER_CDP_ENDPOINT or None
+    )
+    yield pool
+    pool.close()
+
+
 @pytest.fixture(scope="function")
-def browser(playwright_instance, config):
+def browser(browser_pool):
     """
-    Фикстура для создания браузера
-    Scope: function - создается для каждого теста
+    Фикстура браузера
+    Возвращает живой браузер воркера из пула (с проверкой здоровья)
     """
-    # Выбор типа браузера из конфигурации
-    if config.BROWSER == "chromium":
-        browser = playwright_instance.chromium.launch(headless=config.HEADLESS)
-    elif config.BROWSER == "firefox":
-        browser = playwright_instance.firefox.launch(headless=config.HEADLESS)
-    elif config.BROWSER == "webkit":
-        browser = playwright_instance.webkit.launch(headless=config.HEADLESS)
-    else:
-        browser = playwright_instance.chromium.launch(headless=config.HEADLESS)
+    return browser_pool.browser
 
-    yield browser
-    browser.close()
+
+@pytest.fixture(scope="session")
+def artifact_store():
+    """
+    Фикстура хранилища артефактов упавших тестов
+    Сжатие и запись идут в фоновых потоках, в конце сессии очередь дописывается.
+    Не зависит от фикстуры config: настройки артефактов не требуют
+    APPLITOOLS_API_KEY (фикстура используется и Selenium тестами)
+    """
+    store = ArtifactStore(Config.ARTIFACTS_DIR, workers=Config.ARTIFACT_WORKERS)
+    yield store
+    store.shutdown()
 
 
 @pytest.fixture(scope="function")
-def context(browser, config):
+def context(browser_pool, config, artifact_store, request):
     """
     Фикстура для создания контекста браузера
-    Устанавливает viewport и другие настройки
+    Новый контекст на каждый тест изолирует cookies, storage и кеш;
+    трейс и видео (CAPTURE_TRACE / CAPTURE_VIDEO) сохраняются только при падении
     """
-    context = browser.new_context(
+    artifacts = ContextArtifacts(artifact_store, trace=config.CAPTURE_TRACE, video=config.CAPTURE_VIDEO)
+    context = browser_pool.new_context(
         viewport={
             'width': config.VIEWPORT_WIDTH,
             'height': config.VIEWPORT_HEIGHT
-        }
+        },
+        **artifacts.context_options()
     )
+    artifacts.start(context)
     yield context
+    try:
+        for path in artifacts.finish(context, request.node.stash.get(TEST_FAILED, False)):
+            request.node.user_properties.append((ATTACHMENT_PROPERTY, path))
+    except PlaywrightError:
+        # Браузер упал во время теста - пул перезапустит его для следующего
+        pass
+
+
+@pytest.fixture(scope="session")
+def auth_cache(config):
+    """
+    Фикстура кеша авторизованных сессий
+    Storage state хранится на диске и переиспользуется между тестами и запусками
+    """
+    return AuthStateCache(
+        config.AUTH_STATE_DIR,
+        config.TEST_PASSWORD,
+        max_age_seconds=config.AUTH_STATE_MAX_AGE
+    )
+
+
+@pytest.fixture(scope="function")
+def authenticated_page(auth_cache, browser_pool, config, artifact_store, request):
+    """
+    Фикстура страницы каталога в уже авторизованном контексте
+    Пользователь задается маркером @pytest.mark.login_as("problem_user"),
+    по умолчанию - TEST_USERNAME. UI логин выполняется только если
+    сохраненной сессии нет или она истекла. artifact_store нужен
+    хуку pytest_runtest_makereport для скриншота при падении.
+    """
+    marker = request.node.get_closest_marker("login_as")
+    username = marker.args[0] if marker else config.TEST_USERNAME
+
+    context, page = open_authenticated_page(
+        auth_cache,
+        browser_pool,
+        username,
+        {'viewport': {'width': config.VIEWPORT_WIDTH, 'height': config.VIEWPORT_HEIGHT}}
+    )
+    recorder = attach_perf_recorder(page, config, request)
+    yield page
+    if recorder is not None:
+        recorder.write(config.PERF_LOG_FILE)
     context.close()
 
 
+@pytest.fixture(scope="session")
+def async_runner(config):
+    """
+    Фикстура раннера async сценариев
+    Много легковесных сценариев выполняются конкурентно в одном процессе
+    (свой браузер и event loop в отдельном потоке)
+    """
+    return AsyncFlowRunner(
+        browser_name=config.BROWSER,
+        headless=config.HEADLESS,
+        concurrency=config.ASYNC_CONCURRENCY,
+        context_options={'viewport': {'width': config.VIEWPORT_WIDTH, 'height': config.VIEWPORT_HEIGHT}}
+    )
+
+
+def attach_perf_recorder(page, config, request):
+    """
+    Подключение замеров производительности к странице теста
+    Бюджеты задаются маркером @pytest.mark.perf_budget(2000, actions=("navigate_to",))
+    и глобально через PERF_BUDGET_MS. Замеры включаются PERF_TIMING=true
+    (CI) или маркером perf_budget у теста
+    """
+    budgets = [
+        (marker.args[0], tuple(marker.kwargs["actions"]) if "actions" in marker.kwargs else None)
+        for marker in request.node.iter_markers("perf_budget")
+    ]
+    if not config.PERF_TIMING and not budgets:
+        return None
+
+    if config.PERF_BUDGET_MS:
+        budgets.append((config.PERF_BUDGET_MS, None))
+
+    return PerformanceRecorder(request.node.nodeid, budgets).attach(page)
+
+
 @pytest.fixture(scope="function")
-def page(context):
+def page(context, config, request):
     """
     Фикстура для создания новой страницы
     """
     page = context.new_page()
+    recorder = attach_perf_recorder(page, config, request)
     yield page
+    if recorder is not None:
+        recorder.write(config.PERF_LOG_FILE)
     page.close()
 
 
@@ -103,6 +302,18 @@ def eyes(runner, config):
     Фикстура для создания и настройки Applitools Eyes
     Интегрируется с Playwright для визуального тестирования
     """
+    if config.VISUAL_ENGINE == 'local':
+        local_eyes = LocalEyes(
+            runner,
+            baseline_dir=config.VISUAL_BASELINE_DIR,
+            diff_dir=config.VISUAL_DIFF_DIR,
+            tolerance=config.VISUAL_TOLERANCE,
+            update_baseline=config.VISUAL_UPDATE_BASELINE
+        )
+        yield local_eyes
+        local_eyes.close_async()
+        return
+
     # Создание экземпляра Eyes
     eyes = Eyes(runner)
 
@@ -156,6 +367,33 @@ def eyes_page(page, eyes, config, request):
     # Eyes будет закрыт в фикстуре eyes
 
 
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """
+    Хук pytest: скриншот страницы при падении теста
+    Тест снимает PNG, сжатие в WebP и запись выполняет artifact_store в фоне
+    """
+    outcome = yield
+    rep = outcome.get_result()
+
+    if rep.when in ("setup", "call") and rep.failed:
+        item.stash[TEST_FAILED] = True
+
+        store = item.funcargs.get("artifact_store")
+        if rep.when != "call" or store is None or not Config.CAPTURE_SCREENSHOTS:
+            return
+        for name in PAGE_FIXTURES:
+            page = item.funcargs.get(name)
+            if page is None:
+                continue
+            try:
+                path = store.add_bytes(page.screenshot(), ".png")
+            except PlaywrightError:
+                continue
+            item.user_properties.append((ATTACHMENT_PROPERTY, path))
+            break
+
+
 def pytest_configure(config):
     """
     Хук pytest для настройки при запуске
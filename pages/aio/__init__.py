@@ -0,0 +1,10 @@
+"""
+Асинхронные Page Objects (playwright.async_api) для SauceDemo.
+Повторяют методы синхронных page objects и используют те же локаторы
+и скрипты, что позволяет выполнять много сценариев конкурентно в одном процессе.
+"""
+from pages.aio.base_page import AsyncBasePage
+from pages.aio.login_page import AsyncLoginPage
+from pages.aio.inventory_page import AsyncInventoryPage
+from pages.aio.cart_page import AsyncCartPage
+from pages.aio.checkout_page import AsyncCheckoutPage
@@ -0,0 +1,88 @@
+"""
+Асинхронный базовый класс для Page Objects
+"""
+from playwright.async_api import Page
+from pages.base_page import BasePage
+
+
+class AsyncBasePage:
+    """Базовая асинхронная страница с общими методами"""
+
+    READY_SELECTORS = ()
+
+    # Скрипты общие с синхронным BasePage
+    STYLES_APPLIED_SCRIPT = BasePage.STYLES_APPLIED_SCRIPT
+    FONTS_READY_SCRIPT = BasePage.FONTS_READY_SCRIPT
+    IMAGES_LOADED_PREDICATE = BasePage.IMAGES_LOADED_PREDICATE
+    TEXT_IF_PRESENT_SCRIPT = BasePage.TEXT_IF_PRESENT_SCRIPT
+
+    def __init__(self, page: Page):
+        """
+        Инициализация базовой страницы
+
+        Args:
+            page: Playwright async Page объект
+        """
+        self.page = page
+
+    async def navigate_to(self, url: str):
+        """Переход на указанный URL"""
+        await self.page.goto(url)
+
+    async def get_title(self) -> str:
+        """Получение заголовка страницы"""
+        return await self.page.title()
+
+    async def wait_for_url(self, url: str, timeout: int = 30000):
+        """Ожидание загрузки определенного URL"""
+        await self.page.wait_for_url(url, timeout=timeout)
+
+    async def click(self, selector: str):
+        """Клик по элементу"""
+        await self.page.click(selector)
+
+    async def fill(self, selector: str, text: str):
+        """Заполнение текстового поля"""
+        await self.page.fill(selector, text)
+
+    async def is_visible(self, selector: str) -> bool:
+        """Проверка видимости элемента"""
+        return await self.page.is_visible(selector)
+
+    async def get_text(self, selector: str) -> str:
+        """Получение текста элемента"""
+        return await self.page.locator(selector).inner_text()
+
+    async def get_text_if_present(self, selector: str, default=None):
+        """Текст элемента или default, если элемента нет"""
+        text = await self.page.evaluate(self.TEXT_IF_PRESENT_SCRIPT, selector)
+        return default if text is None else text
+
+    async def all_inner_texts(self, selector: str) -> list:
+        """Тексты всех элементов по селектору за один вызов в браузер"""
+        return await self.page.locator(selector).all_inner_texts()
+
+    async def evaluate_all(self, selector: str, script: str, arg=None):
+        """Выполнение JavaScript над всеми элементами по селектору за один вызов"""
+        return await self.page.eval_on_selector_all(selector, script, arg)
+
+    async def wait_until_ready(self, timeout: int = 30000):
+        """Ожидание готовности страницы (см. BasePage.wait_until_ready)"""
+        for selector in self.READY_SELECTORS:
+            await self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+        await self.page.evaluate(self.FONTS_READY_SCRIPT)
+        await self.wait_for_condition(self.IMAGES_LOADED_PREDICATE, timeout=timeout)
+        await self.wait_for_styles_applied()
+
+    async def wait_for_styles_applied(self):
+        """Ожидание пересчета стилей и отрисовки следующего кадра"""
+        await self.page.evaluate(self.STYLES_APPLIED_SCRIPT)
+
+    async def wait_for_condition(self, predicate: str, arg=None, timeout: int = 30000):
+        """Ожидание выполнения JavaScript условия на странице"""
+        await self.page.wait_for_function(predicate, arg=arg, timeout=timeout)
+
+    async def inject_visual_defect(self, script: str):
+        """Внедрение JavaScript кода для создания визуального дефекта"""
+        await self.page.evaluate(script)
+        await self.wait_for_styles_applied()
@@ -0,0 +1,62 @@
+"""
+Асинхронный Page Object для страницы корзины SauceDemo
+"""
+from playwright.async_api import Page
+from pages.aio.base_page import AsyncBasePage
+from pages.cart_page import CartPage
+from config import Config
+
+
+class AsyncCartPage(AsyncBasePage):
+    """Страница корзины (async)"""
+
+    # Локаторы и скрипты общие с синхронным CartPage
+    CART_CONTAINER = CartPage.CART_CONTAINER
+    CART_ITEM = CartPage.CART_ITEM
+    CART_ITEM_NAME = CartPage.CART_ITEM_NAME
+    CART_ITEM_PRICE = CartPage.CART_ITEM_PRICE
+    CHECKOUT_BUTTON = CartPage.CHECKOUT_BUTTON
+    CONTINUE_SHOPPING_BUTTON = CartPage.CONTINUE_SHOPPING_BUTTON
+    REMOVE_BUTTON = CartPage.REMOVE_BUTTON
+    CART_QUANTITY = CartPage.CART_QUANTITY
+    CART_SNAPSHOT_SCRIPT = CartPage.CART_SNAPSHOT_SCRIPT
+    READY_SELECTORS = CartPage.READY_SELECTORS
+    VISUAL_DEFECT_SCRIPT = CartPage.VISUAL_DEFECT_SCRIPT
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{Config.BASE_URL}/cart.html"
+
+    async def is_page_loaded(self) -> bool:
+        """Проверка загрузки страницы корзины"""
+        return await self.is_visible(self.CART_CONTAINER)
+
+    async def get_cart_items_count(self) -> int:
+        """Получение количества товаров в корзине"""
+        return await self.page.locator(self.CART_ITEM).count()
+
+    async def proceed_to_checkout(self):
+        """Переход к оформлению заказа"""
+        await self.click(self.CHECKOUT_BUTTON)
+
+    async def continue_shopping(self):
+        """Возврат к покупкам"""
+        await self.click(self.CONTINUE_SHOPPING_BUTTON)
+
+    async def get_item_names(self) -> list:
+        """Получение списка названий товаров в корзине"""
+        return await self.all_inner_texts(self.CART_ITEM_NAME)
+
+    async def get_cart_snapshot(self) -> list:
+        """Снимок всех позиций корзины за один вызов в браузер"""
+        return await self.evaluate_all(self.CART_ITEM, self.CART_SNAPSHOT_SCRIPT)
+
+    async def remove_item(self, index: int = 0):
+        """Удаление товара из корзины по индексу"""
+        remove_buttons = self.page.locator(self.REMOVE_BUTTON)
+        if index < await remove_buttons.count():
+            await remove_buttons.nth(index).click()
+
+    async def inject_cart_visual_defects(self):
+        """Дефект 3: Изменение цвета кнопки Checkout и нарушение layout"""
+        await self.inject_visual_defect(self.VISUAL_DEFECT_SCRIPT)
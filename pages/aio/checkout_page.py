@@ -0,0 +1,62 @@
+"""
+Асинхронный Page Object для страницы оформления заказа SauceDemo
+"""
+from playwright.async_api import Page
+from pages.aio.base_page import AsyncBasePage
+from pages.checkout_page import CheckoutPage
+from config import Config
+
+
+class AsyncCheckoutPage(AsyncBasePage):
+    """Страница оформления заказа (async)"""
+
+    # Локаторы и скрипты общие с синхронным CheckoutPage
+    CHECKOUT_CONTAINER = CheckoutPage.CHECKOUT_CONTAINER
+    FIRST_NAME_INPUT = CheckoutPage.FIRST_NAME_INPUT
+    LAST_NAME_INPUT = CheckoutPage.LAST_NAME_INPUT
+    POSTAL_CODE_INPUT = CheckoutPage.POSTAL_CODE_INPUT
+    CONTINUE_BUTTON = CheckoutPage.CONTINUE_BUTTON
+    CANCEL_BUTTON = CheckoutPage.CANCEL_BUTTON
+    ERROR_MESSAGE = CheckoutPage.ERROR_MESSAGE
+    FORM_FIELDS = CheckoutPage.FORM_FIELDS
+    FORM_VALUES_SCRIPT = CheckoutPage.FORM_VALUES_SCRIPT
+    READY_SELECTORS = CheckoutPage.READY_SELECTORS
+    VISUAL_DEFECT_SCRIPT = CheckoutPage.VISUAL_DEFECT_SCRIPT
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{Config.BASE_URL}/checkout-step-one.html"
+
+    async def is_page_loaded(self) -> bool:
+        """Проверка загрузки страницы оформления заказа"""
+        return await self.is_visible(self.CHECKOUT_CONTAINER)
+
+    async def fill_checkout_form(self, first_name: str, last_name: str, postal_code: str):
+        """Заполнение формы оформления заказа"""
+        await self.fill(self.FIRST_NAME_INPUT, first_name)
+        await self.fill(self.LAST_NAME_INPUT, last_name)
+        await self.fill(self.POSTAL_CODE_INPUT, postal_code)
+
+    async def get_form_values(self) -> dict:
+        """Текущие значения полей формы за один вызов в браузер"""
+        return await self.page.evaluate(self.FORM_VALUES_SCRIPT, self.FORM_FIELDS)
+
+    async def click_continue(self):
+        """Клик по кнопке Continue"""
+        await self.click(self.CONTINUE_BUTTON)
+
+    async def click_cancel(self):
+        """Клик по кнопке Cancel"""
+        await self.click(self.CANCEL_BUTTON)
+
+    async def is_error_displayed(self) -> bool:
+        """Проверка отображения ошибки"""
+        return await self.is_visible(self.ERROR_MESSAGE)
+
+    async def get_error_message(self) -> str:
+        """Получение текста сообщения об ошибке"""
+        return await self.get_text(self.ERROR_MESSAGE)
+
+    async def inject_checkout_visual_defects(self):
+        """Дефект 4: Скрытие поля First Name и изменение размера кнопки Continue"""
+        await self.inject_visual_defect(self.VISUAL_DEFECT_SCRIPT)
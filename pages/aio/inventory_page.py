@@ -0,0 +1,73 @@
+"""
+Асинхронный Page Object для страницы каталога товаров SauceDemo
+"""
+from playwright.async_api import Page
+from pages.aio.base_page import AsyncBasePage
+from pages.inventory_page import InventoryPage
+from config import Config
+
+
+class AsyncInventoryPage(AsyncBasePage):
+    """Страница каталога товаров (async)"""
+
+    # Локаторы и скрипты общие с синхронным InventoryPage
+    INVENTORY_CONTAINER = InventoryPage.INVENTORY_CONTAINER
+    INVENTORY_ITEM = InventoryPage.INVENTORY_ITEM
+    INVENTORY_ITEM_NAME = InventoryPage.INVENTORY_ITEM_NAME
+    INVENTORY_ITEM_PRICE = InventoryPage.INVENTORY_ITEM_PRICE
+    ADD_TO_CART_BUTTON = InventoryPage.ADD_TO_CART_BUTTON
+    REMOVE_BUTTON = InventoryPage.REMOVE_BUTTON
+    SHOPPING_CART_BADGE = InventoryPage.SHOPPING_CART_BADGE
+    SHOPPING_CART_LINK = InventoryPage.SHOPPING_CART_LINK
+    BURGER_MENU = InventoryPage.BURGER_MENU
+    LOGOUT_LINK = InventoryPage.LOGOUT_LINK
+    PRODUCTS = InventoryPage.PRODUCTS
+    ITEMS_SNAPSHOT_SCRIPT = InventoryPage.ITEMS_SNAPSHOT_SCRIPT
+    READY_SELECTORS = InventoryPage.READY_SELECTORS
+    VISUAL_DEFECT_SCRIPT = InventoryPage.VISUAL_DEFECT_SCRIPT
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{Config.BASE_URL}/inventory.html"
+
+    async def is_page_loaded(self) -> bool:
+        """Проверка загрузки страницы каталога"""
+        return await self.is_visible(self.INVENTORY_CONTAINER)
+
+    async def add_first_item_to_cart(self):
+        """Добавление первого товара в корзину"""
+        await self.click(f"{self.INVENTORY_ITEM}:first-child {self.ADD_TO_CART_BUTTON}")
+
+    async def add_item_to_cart_by_name(self, item_name: str):
+        """Добавление товара в корзину по имени"""
+        item_name_formatted = item_name.lower().replace(' ', '-')
+        await self.click(f'[data-test="add-to-cart-{item_name_formatted}"]')
+
+    async def get_cart_items_count(self) -> str:
+        """Получение количества товаров в корзине"""
+        return await self.get_text_if_present(self.SHOPPING_CART_BADGE, default='0')
+
+    async def go_to_cart(self):
+        """Переход в корзину"""
+        await self.click(self.SHOPPING_CART_LINK)
+
+    async def get_items_count(self) -> int:
+        """Получение количества товаров на странице"""
+        return await self.page.locator(self.INVENTORY_ITEM).count()
+
+    async def get_item_names(self) -> list:
+        """Получение названий всех товаров"""
+        return await self.all_inner_texts(self.INVENTORY_ITEM_NAME)
+
+    async def get_item_prices(self) -> list:
+        """Получение цен всех товаров"""
+        prices = await self.all_inner_texts(self.INVENTORY_ITEM_PRICE)
+        return [float(price.replace('$', '')) for price in prices]
+
+    async def get_items_snapshot(self) -> list:
+        """Снимок всех товаров каталога за один вызов в браузер"""
+        return await self.evaluate_all(self.INVENTORY_ITEM, self.ITEMS_SNAPSHOT_SCRIPT)
+
+    async def inject_inventory_visual_defects(self):
+        """Дефект 2: Изменение цвета фона первого товара и скрытие цены"""
+        await self.inject_visual_defect(self.VISUAL_DEFECT_SCRIPT)
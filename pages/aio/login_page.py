@@ -0,0 +1,46 @@
+"""
+Асинхронный Page Object для страницы авторизации SauceDemo
+"""
+from playwright.async_api import Page
+from pages.aio.base_page import AsyncBasePage
+from pages.login_page import LoginPage
+from config import Config
+
+
+class AsyncLoginPage(AsyncBasePage):
+    """Страница авторизации (async)"""
+
+    # Локаторы и скрипты общие с синхронным LoginPage
+    USERNAME_INPUT = LoginPage.USERNAME_INPUT
+    PASSWORD_INPUT = LoginPage.PASSWORD_INPUT
+    LOGIN_BUTTON = LoginPage.LOGIN_BUTTON
+    ERROR_MESSAGE = LoginPage.ERROR_MESSAGE
+    LOGIN_LOGO = LoginPage.LOGIN_LOGO
+    READY_SELECTORS = LoginPage.READY_SELECTORS
+    VISUAL_DEFECT_SCRIPT = LoginPage.VISUAL_DEFECT_SCRIPT
+
+    def __init__(self, page: Page):
+        super().__init__(page)
+        self.url = f"{Config.BASE_URL}/"
+
+    async def open(self):
+        """Открытие страницы авторизации"""
+        await self.navigate_to(self.url)
+
+    async def login(self, username: str, password: str):
+        """Выполнение авторизации"""
+        await self.fill(self.USERNAME_INPUT, username)
+        await self.fill(self.PASSWORD_INPUT, password)
+        await self.click(self.LOGIN_BUTTON)
+
+    async def is_error_displayed(self) -> bool:
+        """Проверка отображения ошибки"""
+        return await self.is_visible(self.ERROR_MESSAGE)
+
+    async def get_error_message(self) -> str:
+        """Получение текста сообщения об ошибке"""
+        return await self.get_text(self.ERROR_MESSAGE)
+
+    async def inject_login_visual_defects(self):
+        """Дефект 1: Скрытие кнопки Login"""
+        await self.inject_visual_defect(self.VISUAL_DEFECT_SCRIPT)
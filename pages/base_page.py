@@ -3,11 +3,35 @@
 Содержит общие методы для работы со страницами
 """
 from playwright.sync_api import Page, expect
+from utils.perf_timing import timed_action
 
 
 class BasePage:
     """Базовая страница с общими методами"""
 
+    # Селекторы, видимость которых означает готовность страницы
+    # (переопределяются в наследниках)
+    READY_SELECTORS = ()
+
+    # Два requestAnimationFrame: первый кадр применяет изменения DOM/стилей,
+    # после второго они гарантированно отрисованы
+    STYLES_APPLIED_SCRIPT = """
+    () => new Promise(resolve =>
+        requestAnimationFrame(() => requestAnimationFrame(() => resolve()))
+    )
+    """
+
+    FONTS_READY_SCRIPT = "() => document.fonts ? document.fonts.ready.then(() => true) : true"
+
+    IMAGES_LOADED_PREDICATE = "() => Array.from(document.images).every(img => img.complete)"
+
+    TEXT_IF_PRESENT_SCRIPT = """
+    (selector) => {
+        const el = document.querySelector(selector);
+        return el ? el.innerText : null;
+    }
+    """
+
     def __init__(self, page: Page):
         """
         Инициализация базовой страницы
@@ -24,7 +48,8 @@ class BasePage:
         Args:
             url: URL адрес страницы
         """
-        self.page.goto(url)
+        with self._timed("navigate_to", url, navigation=True):
+            self.page.goto(url)
 
     def get_title(self) -> str:
         """
@@ -43,7 +68,8 @@ class BasePage:
             url: URL для ожидания
             timeout: Таймаут ожидания в миллисекундах
         """
-        self.page.wait_for_url(url, timeout=timeout)
+        with self._timed("wait_for_url", url):
+            self.page.wait_for_url(url, timeout=timeout)
 
     def click(self, selector: str):
         """
@@ -52,7 +78,8 @@ class BasePage:
         Args:
             selector: CSS селектор элемента
         """
-        self.page.click(selector)
+        with self._timed("click", selector):
+            self.page.click(selector)
 
     def fill(self, selector: str, text: str):
         """
@@ -62,7 +89,8 @@ class BasePage:
             selector: CSS селектор элемента
             text: Текст для ввода
         """
-        self.page.fill(selector, text)
+        with self._timed("fill", selector):
+            self.page.fill(selector, text)
 
     def is_visible(self, selector: str) -> bool:
         """
@@ -88,11 +116,96 @@ class BasePage:
         """
         return self.page.locator(selector).inner_text()
 
+    def get_text_if_present(self, selector: str, default=None):
+        """
+        Текст элемента или default, если элемента нет (один вызов в браузер
+        вместо проверки видимости и отдельного чтения текста)
+
+        Args:
+            selector: CSS селектор элемента
+            default: Значение при отсутствии элемента
+
+        Returns:
+            Текст элемента или default
+        """
+        text = self.page.evaluate(self.TEXT_IF_PRESENT_SCRIPT, selector)
+        return default if text is None else text
+
+    def all_inner_texts(self, selector: str) -> list:
+        """
+        Тексты всех элементов по селектору за один вызов в браузер
+
+        Args:
+            selector: CSS селектор элементов
+
+        Returns:
+            Список текстов элементов
+        """
+        return self.page.locator(selector).all_inner_texts()
+
+    def evaluate_all(self, selector: str, script: str, arg=None):
+        """
+        Выполнение JavaScript над всеми элементами по селектору за один вызов
+
+        Args:
+            selector: CSS селектор элементов
+            script: JavaScript функция, принимающая массив элементов (и arg)
+            arg: Дополнительный аргумент функции
+
+        Returns:
+            Результат функции (сериализуемый в JSON)
+        """
+        return self.page.eval_on_selector_all(selector, script, arg)
+
+    def wait_until_ready(self, timeout: int = 30000):
+        """
+        Ожидание готовности страницы к проверкам и снимкам:
+        видимы READY_SELECTORS, загружены шрифты и изображения,
+        стили применены и отрисованы
+
+        Args:
+            timeout: Таймаут ожидания каждого условия в миллисекундах
+        """
+        with self._timed("wait_until_ready"):
+            for selector in self.READY_SELECTORS:
+                self.page.wait_for_selector(selector, state="visible", timeout=timeout)
+            self.page.evaluate(self.FONTS_READY_SCRIPT)
+            self.wait_for_condition(self.IMAGES_LOADED_PREDICATE, timeout=timeout)
+            self.wait_for_styles_applied()
+
+    def wait_for_styles_applied(self):
+        """Ожидание пересчета стилей и отрисовки следующего кадра"""
+        self.page.evaluate(self.STYLES_APPLIED_SCRIPT)
+
+    def wait_for_condition(self, predicate: str, arg=None, timeout: int = 30000):
+        """
+        Ожидание выполнения JavaScript условия на странице
+
+        Args:
+            predicate: JavaScript функция, возвращающая truthy значение
+            arg: Аргумент, передаваемый в функцию
+            timeout: Таймаут ожидания в миллисекундах
+        """
+        self.page.wait_for_function(predicate, arg=arg, timeout=timeout)
+
     def inject_visual_defect(self, script: str):
         """
         Внедрение JavaScript кода для создания визуального дефекта
+        Возвращает управление после отрисовки измененных стилей
 
         Args:
             script: JavaScript код для выполнения
         """
         self.page.evaluate(script)
+        self.wait_for_styles_applied()
+
+    def _timed(self, action: str, target: str = None, navigation: bool = False):
+        """
+        Контекст замера действия page object (см. utils.perf_timing)
+
+        Args:
+            action: Имя метода
+            target: Селектор или URL
+            navigation: Снять Navigation/Paint Timing после действия
+        """
+        return timed_action(self.page, f"{type(self).__name__}.{action}", target, navigation)
@@ -3,6 +3,7 @@ Page Object для страницы корзины SauceDemo
 """
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from config import Config
 
 
 class CartPage(BasePage):
@@ -18,6 +19,34 @@ class CartPage(BasePage):
     REMOVE_BUTTON = '[data-test^="remove"]'
     CART_QUANTITY = '.cart_quantity'
 
+    # Снимок всех позиций корзины за один вызов в браузер
+    CART_SNAPSHOT_SCRIPT = """
+    (items) => items.map(item => ({
+        name: item.querySelector('.inventory_item_name').innerText,
+        price: parseFloat(item.querySelector('.inventory_item_price').innerText.replace('$', '')),
+        quantity: parseInt(item.querySelector('.cart_quantity').innerText, 10)
+    }))
+    """
+
+    # Элементы, по которым определяется готовность страницы
+    READY_SELECTORS = (CART_CONTAINER, CHECKOUT_BUTTON)
+
+    # Дефект 3: зеленая кнопка Checkout и смещение layout
+    VISUAL_DEFECT_SCRIPT = """
+    // Изменяем цвет кнопки Checkout на зеленый
+    var checkoutBtn = document.querySelector('[data-test="checkout"]');
+    if (checkoutBtn) {
+        checkoutBtn.style.backgroundColor = '#00ff00';
+        checkoutBtn.style.color = '#000000';
+    }
+
+    // Нарушаем layout - смещаем контейнер корзины
+    var cartContainer = document.querySelector('.cart_contents_container');
+    if (cartContainer) {
+        cartContainer.style.marginLeft = '100px';
+    }
+    """
+
     def __init__(self, page: Page):
         """
         Инициализация страницы корзины
@@ -26,7 +55,7 @@ class CartPage(BasePage):
             page: Playwright Page объект
         """
         super().__init__(page)
-        self.url = 'https://www.saucedemo.com/cart.html'
+        self.url = f"{Config.BASE_URL}/cart.html"
 
     def is_page_loaded(self) -> bool:
         """
@@ -61,8 +90,16 @@ class CartPage(BasePage):
         Returns:
             Список названий товаров
         """
-        items = self.page.locator(self.CART_ITEM_NAME).all()
-        return [item.inner_text() for item in items]
+        return self.all_inner_texts(self.CART_ITEM_NAME)
+
+    def get_cart_snapshot(self) -> list:
+        """
+        Снимок всех позиций корзины за один вызов в браузер
+
+        Returns:
+            Список словарей: name, price, quantity
+        """
+        return self.evaluate_all(self.CART_ITEM, self.CART_SNAPSHOT_SCRIPT)
 
     def remove_item(self, index: int = 0):
         """
@@ -71,27 +108,13 @@ class CartPage(BasePage):
         Args:
             index: Индекс товара (по умолчанию 0 - первый товар)
         """
-        remove_buttons = self.page.locator(self.REMOVE_BUTTON).all()
-        if index < len(remove_buttons):
-            remove_buttons[index].click()
+        remove_buttons = self.page.locator(self.REMOVE_BUTTON)
+        if index < remove_buttons.count():
+            remove_buttons.nth(index).click()
 
     def inject_cart_visual_defects(self):
         """
         Внедрение визуальных дефектов на странице корзины
         Дефект 3: Изменение цвета кнопки Checkout и нарушение layout
         """
-        defect_script = """
-        // Изменяем цвет кнопки Checkout на зеленый
-        var checkoutBtn = document.querySelector('[data-test="checkout"]');
-        if (checkoutBtn) {
-            checkoutBtn.style.backgroundColor = '#00ff00';
-            checkoutBtn.style.color = '#000000';
-        }
-
-        // Нарушаем layout - смещаем контейнер корзины
-        var cartContainer = document.querySelector('.cart_contents_container');
-        if (cartContainer) {
-            cartContainer.style.marginLeft = '100px';
-        }
-        """
-        self.inject_visual_defect(defect_script)
+        self.inject_visual_defect(self.VISUAL_DEFECT_SCRIPT)
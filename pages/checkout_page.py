@@ -3,6 +3,7 @@ Page Object для страницы оформления заказа SauceDemo
 """
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from config import Config
 
 
 class CheckoutPage(BasePage):
@@ -17,6 +18,37 @@ class CheckoutPage(BasePage):
     CANCEL_BUTTON = '[data-test="cancel"]'
     ERROR_MESSAGE = '[data-test="error"]'
 
+    # Поля формы и чтение их значений за один вызов в браузер
+    FORM_FIELDS = {
+        'first_name': FIRST_NAME_INPUT,
+        'last_name': LAST_NAME_INPUT,
+        'postal_code': POSTAL_CODE_INPUT
+    }
+    FORM_VALUES_SCRIPT = """
+    (fields) => Object.fromEntries(Object.entries(fields).map(
+        ([key, selector]) => [key, document.querySelector(selector)?.value ?? null]
+    ))
+    """
+
+    # Элементы, по которым определяется готовность страницы
+    READY_SELECTORS = (CHECKOUT_CONTAINER, FIRST_NAME_INPUT, CONTINUE_BUTTON)
+
+    # Дефект 4: скрытое поле First Name и маленькая кнопка Continue
+    VISUAL_DEFECT_SCRIPT = """
+    // Скрываем поле First Name
+    var firstNameInput = document.querySelector('[data-test="firstName"]');
+    if (firstNameInput) {
+        firstNameInput.style.opacity = '0';
+    }
+
+    // Изменяем размер кнопки Continue - делаем её очень маленькой
+    var continueBtn = document.querySelector('[data-test="continue"]');
+    if (continueBtn) {
+        continueBtn.style.width = '50px';
+        continueBtn.style.fontSize = '8px';
+    }
+    """
+
     def __init__(self, page: Page):
         """
         Инициализация страницы оформления заказа
@@ -25,7 +57,7 @@ class CheckoutPage(BasePage):
             page: Playwright Page объект
         """
         super().__init__(page)
-        self.url = 'https://www.saucedemo.com/checkout-step-one.html'
+        self.url = f"{Config.BASE_URL}/checkout-step-one.html"
 
     def is_page_loaded(self) -> bool:
         """
@@ -49,6 +81,15 @@ class CheckoutPage(BasePage):
         self.fill(self.LAST_NAME_INPUT, last_name)
         self.fill(self.POSTAL_CODE_INPUT, postal_code)
 
+    def get_form_values(self) -> dict:
+        """
+        Текущие значения полей формы за один вызов в браузер
+
+        Returns:
+            Словарь first_name, last_name, postal_code
+        """
+        return self.page.evaluate(self.FORM_VALUES_SCRIPT, self.FORM_FIELDS)
+
     def click_continue(self):
         """Клик по кнопке Continue"""
         self.click(self.CONTINUE_BUTTON)
@@ -80,18 +121,4 @@ class CheckoutPage(BasePage):
         Внедрение визуальных дефектов на странице оформления заказа
         Дефект 4: Скрытие поля First Name и изменение размера кнопки Continue
         """
-        defect_script = """
-        // Скрываем поле First Name
-        var firstNameInput = document.querySelector('[data-test="firstName"]');
-        if (firstNameInput) {
-            firstNameInput.style.opacity = '0';
-        }
-
-        // Изменяем размер кнопки Continue - делаем её очень маленькой
-        var continueBtn = document.querySelector('[data-test="continue"]');
-        if (continueBtn) {
-            continueBtn.style.width = '50px';
-            continueBtn.style.fontSize = '8px';
-        }
-        """
-        self.inject_visual_defect(defect_script)
+        self.inject_visual_defect(self.VISUAL_DEFECT_SCRIPT)
@@ -3,6 +3,7 @@ Page Object для страницы каталога товаров SauceDemo
 """
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from config import Config
 
 
 class InventoryPage(BasePage):
@@ -20,6 +21,43 @@ class InventoryPage(BasePage):
     BURGER_MENU = '#react-burger-menu-btn'
     LOGOUT_LINK = '#logout_sidebar_link'
 
+    # Ассортимент SauceDemo (названия совпадают с data-test кнопок после
+    # приведения к нижнему регистру и замены пробелов на дефисы)
+    PRODUCTS = (
+        'Sauce Labs Backpack',
+        'Sauce Labs Bike Light',
+        'Sauce Labs Bolt T-Shirt',
+        'Sauce Labs Fleece Jacket',
+        'Sauce Labs Onesie',
+        'Test.allTheThings() T-Shirt (Red)',
+    )
+
+    # Снимок всех карточек товаров за один вызов в браузер
+    ITEMS_SNAPSHOT_SCRIPT = """
+    (items) => items.map(item => {
+        const button = item.querySelector('button');
+        return {
+            name: item.querySelector('.inventory_item_name').innerText,
+            description: item.querySelector('.inventory_item_desc').innerText,
+            price: parseFloat(item.querySelector('.inventory_item_price').innerText.replace('$', '')),
+            button: button ? button.getAttribute('data-test') : null,
+            in_cart: button ? button.getAttribute('data-test').startsWith('remove') : false
+        };
+    })
+    """
+
+    # Элементы, по которым определяется готовность страницы
+    READY_SELECTORS = (INVENTORY_CONTAINER, INVENTORY_ITEM, SHOPPING_CART_LINK)
+
+    # Дефект 2: красный фон первого товара и скрытая цена
+    VISUAL_DEFECT_SCRIPT = """
+    // Изменяем цвет фона первого товара на ярко-красный
+    document.querySelector('.inventory_item').style.backgroundColor = '#ff0000';
+
+    // Скрываем цену первого товара
+    document.querySelector('.inventory_item_price').style.visibility = 'hidden';
+    """
+
     def __init__(self, page: Page):
         """
         Инициализация страницы каталога
@@ -28,7 +66,7 @@ class InventoryPage(BasePage):
             page: Playwright Page объект
         """
         super().__init__(page)
-        self.url = 'https://www.saucedemo.com/inventory.html'
+        self.url = f"{Config.BASE_URL}/inventory.html"
 
     def is_page_loaded(self) -> bool:
         """
@@ -64,9 +102,7 @@ class InventoryPage(BasePage):
         Returns:
             Количество товаров в корзине
         """
-        if self.is_visible(self.SHOPPING_CART_BADGE):
-            return self.get_text(self.SHOPPING_CART_BADGE)
-        return '0'
+        return self.get_text_if_present(self.SHOPPING_CART_BADGE, default='0')
 
     def go_to_cart(self):
         """Переход в корзину"""
@@ -81,16 +117,37 @@ class InventoryPage(BasePage):
         """
         return self.page.locator(self.INVENTORY_ITEM).count()
 
+    def get_item_names(self) -> list:
+        """
+        Получение названий всех товаров
+
+        Returns:
+            Список названий товаров в порядке отображения
+        """
+        return self.all_inner_texts(self.INVENTORY_ITEM_NAME)
+
+    def get_item_prices(self) -> list:
+        """
+        Получение цен всех товаров
+
+        Returns:
+            Список цен (float) в порядке отображения
+        """
+        return [float(price.replace('$', '')) for price in self.all_inner_texts(self.INVENTORY_ITEM_PRICE)]
+
+    def get_items_snapshot(self) -> list:
+        """
+        Снимок всех товаров каталога за один вызов в браузер
+
+        Returns:
+            Список словарей: name, description, price, button (data-test кнопки),
+            in_cart (товар уже добавлен в корзину)
+        """
+        return self.evaluate_all(self.INVENTORY_ITEM, self.ITEMS_SNAPSHOT_SCRIPT)
+
     def inject_inventory_visual_defects(self):
         """
         Внедрение визуальных дефектов на странице каталога
         Дефект 2: Изменение цвета фона первого товара и скрытие цены
         """
-        defect_script = """
-        // Изменяем цвет фона первого товара на ярко-красный
-        document.querySelector('.inventory_item').style.backgroundColor = '#ff0000';
-
-        // Скрываем цену первого товара
-        document.querySelector('.inventory_item_price').style.visibility = 'hidden';
-        """
-        self.inject_visual_defect(defect_script)
+        self.inject_visual_defect(self.VISUAL_DEFECT_SCRIPT)
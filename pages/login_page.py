@@ -3,6 +3,7 @@ Page Object для страницы авторизации SauceDemo
 """
 from playwright.sync_api import Page
 from pages.base_page import BasePage
+from config import Config
 
 
 class LoginPage(BasePage):
@@ -15,6 +16,15 @@ class LoginPage(BasePage):
     ERROR_MESSAGE = '[data-test="error"]'
     LOGIN_LOGO = '.login_logo'
 
+    # Элементы, по которым определяется готовность страницы
+    READY_SELECTORS = (LOGIN_LOGO, USERNAME_INPUT, PASSWORD_INPUT, LOGIN_BUTTON)
+
+    # Дефект 1: скрытие кнопки Login
+    VISUAL_DEFECT_SCRIPT = """
+    // Скрываем кнопку Login
+    document.querySelector('[data-test="login-button"]').style.display = 'none';
+    """
+
     def __init__(self, page: Page):
         """
         Инициализация страницы авторизации
@@ -23,7 +33,7 @@ class LoginPage(BasePage):
             page: Playwright Page объект
         """
         super().__init__(page)
-        self.url = 'https://www.saucedemo.com/'
+        self.url = f"{Config.BASE_URL}/"
 
     def open(self):
         """Открытие страницы авторизации"""
@@ -64,8 +74,4 @@ class LoginPage(BasePage):
         Внедрение визуальных дефектов на странице авторизации
         Дефект 1: Скрытие кнопки Login
         """
-        defect_script = """
-        // Скрываем кнопку Login
-        document.querySelector('[data-test="login-button"]').style.display = 'none';
-        """
-        self.inject_visual_defect(defect_script)
+        self.inject_visual_defect(self.VISUAL_DEFECT_SCRIPT)
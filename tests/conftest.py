@@ -3,12 +3,15 @@ import allure
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
+from ai_qa_pipeline.modules.test_execution.pytest_plugin import ATTACHMENT_PROPERTY
 
 @pytest.fixture(scope="function")
-def driver():
+def driver(artifact_store):
     """
     Фикстура для инициализации и закрытия веб-драйвера.
     Запускается перед каждым тестом и закрывается после.
+    artifact_store нужен хуку скриншотов при падении
+    (не требует APPLITOOLS_API_KEY).
     """
     # Настройка опций Chrome
     options = webdriver.ChromeOptions()
@@ -28,6 +31,8 @@ def driver():
 def pytest_runtest_makereport(item, call):
     """
     Хук для создания скриншотов при падении тестов.
+    PNG прикладывается в Allure, сжатая копия записывается
+    artifact_store в фоне (путь попадает в результаты TestExecutor).
     """
     outcome = yield
     rep = outcome.get_result()
@@ -35,8 +40,12 @@ def pytest_runtest_makereport(item, call):
     if rep.when == "call" and rep.failed:
         driver = item.funcargs.get("driver", None)
         if driver:
+            png = driver.get_screenshot_as_png()
             allure.attach(
-                driver.get_screenshot_as_png(),
+                png,
                 name="Screenshot",
                 attachment_type=allure.attachment_type.PNG
             )
+            store = item.funcargs.get("artifact_store", None)
+            if store:
+                item.user_properties.append((ATTACHMENT_PROPERTY, store.add_bytes(png, ".png")))
@@ -0,0 +1,142 @@
+"""
+Тесты хранилища артефактов упавших тестов (без браузера)
+"""
+import gzip
+import os
+import threading
+from utils import artifact_store as artifacts
+from utils.artifact_store import ArtifactStore, ContextArtifacts
+
+
+def test_add_returns_path_before_write_finishes(tmp_path, monkeypatch):
+    release = threading.Event()
+    encode = ArtifactStore._encode
+
+    def slow_encode(self, data, suffix):
+        release.wait(5)
+        return encode(self, data, suffix)
+
+    monkeypatch.setattr(ArtifactStore, "_encode", slow_encode)
+    store = ArtifactStore(str(tmp_path / "artifacts"), workers=1)
+
+    path = store.add_bytes(b"<html>error</html>", ".html")
+    assert store.pending == 1
+    assert not os.path.exists(path)
+
+    release.set()
+    store.shutdown()
+    assert os.path.exists(path)
+
+
+def test_identical_artifacts_stored_once(tmp_path):
+    store = ArtifactStore(str(tmp_path / "artifacts"))
+
+    first = store.add_bytes(b"same page", ".html")
+    second = store.add_bytes(b"same page", ".html")
+    other = store.add_bytes(b"other page", ".html")
+    store.shutdown()
+
+    assert first == second != other
+    assert (store.stored, store.deduplicated) == (2, 1)
+
+    # Повторный прогон находит уже записанный артефакт на диске
+    rerun = ArtifactStore(str(tmp_path / "artifacts"))
+    assert rerun.add_bytes(b"same page", ".html") == first
+    assert rerun.deduplicated == 1
+    rerun.shutdown()
+
+
+def test_text_artifacts_compressed(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifacts, "zstandard", None)
+    store = ArtifactStore(str(tmp_path / "artifacts"))
+
+    data = b"<div>row</div>\n" * 1000
+    path = store.add_bytes(data, ".html")
+    store.shutdown()
+
+    assert path.endswith(".html.gz")
+    with gzip.open(path, 'rb') as f:
+        assert f.read() == data
+    assert os.path.getsize(path) < len(data) / 10
+
+
+class FakeVideo:
+    def __init__(self, path):
+        self._path = path
+
+    def path(self):
+        return self._path
+
+
+class FakePage:
+    def __init__(self, video):
+        self.video = video
+
+
+class FakeTracing:
+    def __init__(self):
+        self.started = False
+
+    def start(self, **options):
+        self.started = True
+
+    def stop(self, path=None):
+        if path:
+            with open(path, 'wb') as f:
+                f.write(b"trace zip")
+
+
+class FakeContext:
+    def __init__(self, video_path):
+        self.tracing = FakeTracing()
+        self.pages = []
+        self.video_path = video_path
+        self.closed = False
+        self._page_handlers = []
+
+    def on(self, event, handler):
+        assert event == "page"
+        self._page_handlers.append(handler)
+
+    def new_page(self):
+        page = FakePage(FakeVideo(self.video_path))
+        self.pages.append(page)
+        for handler in self._page_handlers:
+            handler(page)
+        return page
+
+    def close_page(self, page):
+        # Playwright дописывает видео страницы при ее закрытии
+        with open(page.video.path(), 'wb') as f:
+            f.write(b"webm")
+        self.pages.remove(page)
+
+    def close(self):
+        for page in list(self.pages):
+            self.close_page(page)
+        self.closed = True
+
+
+def test_trace_and_video_kept_only_for_failed_tests(tmp_path):
+    store = ArtifactStore(str(tmp_path / "artifacts"))
+    recorder = ContextArtifacts(store, trace=True, video=True)
+    assert recorder.context_options() == {'record_video_dir': store.incoming_dir}
+
+    passed = FakeContext(os.path.join(store.incoming_dir, "passed.webm"))
+    recorder.start(passed)
+    passed.new_page()
+    assert recorder.finish(passed, failed=False) == []
+    assert passed.closed and not os.path.exists(passed.video_path)
+
+    # Фикстура page закрывает страницу до teardown контекста
+    recorder = ContextArtifacts(store, trace=True, video=True)
+    failed = FakeContext(os.path.join(store.incoming_dir, "failed.webm"))
+    recorder.start(failed)
+    failed.close_page(failed.new_page())
+    paths = recorder.finish(failed, failed=True)
+    store.drain()
+
+    assert [os.path.splitext(path)[1] for path in paths] == [".zip", ".webm"]
+    assert all(os.path.exists(path) for path in paths)
+    assert os.listdir(store.incoming_dir) == []
+    store.shutdown()
@@ -0,0 +1,149 @@
+"""
+Тесты кеша статики и локального сервера приложения (без запуска браузера)
+"""
+import urllib.request
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+from utils.asset_cache import StaticAssetCache
+from utils.local_app_server import LocalAppServer
+
+
+class FakeResponse:
+    def __init__(self, status=200, body=b"console.log(1)", etag='"v1"'):
+        self.status = status
+        self._body = body
+        self.headers = {"content-type": "application/javascript", "etag": etag,
+                        "content-length": str(len(body))}
+
+    def body(self):
+        return self._body
+
+
+class FakeRequest:
+    def __init__(self, url, resource_type="script", method="GET"):
+        self.url = url
+        self.resource_type = resource_type
+        self.method = method
+        self.headers = {}
+
+
+class FakeRoute:
+    """Заглушка Playwright Route, запоминающая действие обработчика"""
+
+    def __init__(self, request, response=None):
+        self.request = request
+        self.response = response or FakeResponse()
+        self.fetched_headers = None
+        self.action = None
+        self.fulfilled = None
+
+    def fetch(self, headers=None):
+        self.fetched_headers = headers
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+    def fulfill(self, status=None, headers=None, body=None, response=None):
+        self.action = "fulfill"
+        self.fulfilled = {"status": status, "headers": headers, "body": body, "response": response}
+
+    def continue_(self):
+        self.action = "continue"
+
+    def abort(self):
+        self.action = "abort"
+
+
+BUNDLE_URL = "https://www.saucedemo.com/static/js/main.js"
+
+
+def test_second_request_served_from_disk(tmp_path):
+    cache = StaticAssetCache(str(tmp_path))
+    cache._handle_route(FakeRoute(FakeRequest(BUNDLE_URL)))
+
+    route = FakeRoute(FakeRequest(BUNDLE_URL))
+    cache._handle_route(route)
+
+    assert cache.misses == 1 and cache.hits == 1
+    assert route.fetched_headers is None
+    assert route.fulfilled["body"] == b"console.log(1)"
+    assert "content-length" not in route.fulfilled["headers"]
+
+
+def test_expired_entry_revalidated_by_etag(tmp_path):
+    cache = StaticAssetCache(str(tmp_path), max_age_seconds=-1)
+    cache._handle_route(FakeRoute(FakeRequest(BUNDLE_URL)))
+
+    route = FakeRoute(FakeRequest(BUNDLE_URL), FakeResponse(status=304, body=b""))
+    cache._handle_route(route)
+
+    assert route.fetched_headers["If-None-Match"] == '"v1"'
+    assert route.fulfilled["body"] == b"console.log(1)"
+    assert cache.revalidated == 1
+
+
+def test_new_etag_replaces_old_body(tmp_path):
+    cache = StaticAssetCache(str(tmp_path), max_age_seconds=-1)
+    cache._handle_route(FakeRoute(FakeRequest(BUNDLE_URL)))
+    cache._handle_route(FakeRoute(FakeRequest(BUNDLE_URL), FakeResponse(body=b"console.log(2)", etag='"v2"')))
+
+    bodies = [path for path in tmp_path.iterdir() if path.suffix == ".bin"]
+    assert len(bodies) == 1
+    assert bodies[0].read_bytes() == b"console.log(2)"
+
+
+def test_fetch_failure_falls_back_to_browser(tmp_path):
+    cache = StaticAssetCache(str(tmp_path))
+    route = FakeRoute(FakeRequest(BUNDLE_URL), PlaywrightError("net::ERR_CONNECTION_REFUSED"))
+
+    cache._handle_route(route)
+
+    assert route.action == "continue"
+
+
+def test_closed_page_ignored(tmp_path):
+    cache = StaticAssetCache(str(tmp_path))
+    route = FakeRoute(
+        FakeRequest(BUNDLE_URL),
+        PlaywrightError("Target page, context or browser has been closed")
+    )
+
+    cache._handle_route(route)
+
+    assert route.action is None
+
+
+def test_documents_and_xhr_go_to_network(tmp_path):
+    cache = StaticAssetCache(str(tmp_path))
+    route = FakeRoute(FakeRequest("https://www.saucedemo.com/", resource_type="document"))
+
+    cache._handle_route(route)
+
+    assert route.action == "continue"
+
+
+def test_third_party_analytics_blocked(tmp_path):
+    cache = StaticAssetCache(str(tmp_path), cache_static=False, block_third_party=True)
+    blocked = FakeRoute(FakeRequest("https://events.backtrace.io/api/post", resource_type="fetch"))
+    bundle = FakeRoute(FakeRequest(BUNDLE_URL))
+
+    cache._handle_route(blocked)
+    cache._handle_route(bundle)
+
+    assert blocked.action == "abort"
+    assert bundle.action == "continue"
+
+
+def test_local_server_serves_spa_routes(tmp_path):
+    (tmp_path / "index.html").write_text("<div id='root'></div>", encoding="utf-8")
+    server = LocalAppServer(str(tmp_path)).start()
+    try:
+        with urllib.request.urlopen(f"{server.url}/inventory.html") as response:
+            assert b"root" in response.read()
+    finally:
+        server.stop()
+
+
+def test_local_server_requires_index(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        LocalAppServer(str(tmp_path))
@@ -0,0 +1,49 @@
+"""
+Конкурентные checkout сценарии на async page objects:
+оформление заказа для каждого товара каталога в одном процессе
+"""
+import pytest
+from pages.aio import AsyncLoginPage, AsyncInventoryPage, AsyncCartPage, AsyncCheckoutPage
+from pages.inventory_page import InventoryPage
+
+
+def make_checkout_flow(product, username, password):
+    """Сценарий: логин -> товар в корзину -> корзина -> форма оформления"""
+
+    async def flow(page):
+        login_page = AsyncLoginPage(page)
+        await login_page.open()
+        await login_page.login(username, password)
+        await page.wait_for_url("**/inventory.html")
+
+        inventory_page = AsyncInventoryPage(page)
+        await inventory_page.add_item_to_cart_by_name(product)
+        assert await inventory_page.get_cart_items_count() == "1"
+        await inventory_page.go_to_cart()
+
+        cart_page = AsyncCartPage(page)
+        await cart_page.wait_until_ready()
+        assert await cart_page.get_item_names() == [product]
+        await cart_page.proceed_to_checkout()
+
+        checkout_page = AsyncCheckoutPage(page)
+        await checkout_page.wait_until_ready()
+        await checkout_page.fill_checkout_form("John", "Doe", "12345")
+        return await checkout_page.get_form_values()
+
+    return flow
+
+
+@pytest.mark.smoke
+def test_checkout_for_every_product_concurrently(async_runner, config):
+    """Оформление заказа для каждого товара, все сценарии параллельно"""
+    flows = {
+        product: make_checkout_flow(product, config.TEST_USERNAME, config.TEST_PASSWORD)
+        for product in InventoryPage.PRODUCTS
+    }
+
+    results = async_runner.run(flows)
+
+    failed = [f"{result.name}: {result.error}" for result in results if not result.passed]
+    assert not failed, "Упавшие сценарии:\n" + "\n".join(failed)
+    assert all(result.value["postal_code"] == "12345" for result in results)
@@ -0,0 +1,54 @@
+"""
+Тесты кеша авторизованных сессий (без запуска браузера)
+"""
+import json
+import os
+import time
+from utils.auth_state import AuthStateCache
+
+
+def write_state(cache, username, cookies):
+    with open(cache.state_path(username), 'w', encoding='utf-8') as f:
+        json.dump({"cookies": cookies, "origins": []}, f)
+
+
+def test_missing_state_is_invalid(tmp_path):
+    cache = AuthStateCache(str(tmp_path), "secret_sauce")
+
+    assert not cache.is_valid("standard_user")
+
+
+def test_fresh_state_is_valid(tmp_path):
+    cache = AuthStateCache(str(tmp_path), "secret_sauce")
+    write_state(cache, "standard_user",
+                [{"name": "session-username", "expires": time.time() + 600}])
+
+    assert cache.is_valid("standard_user")
+
+
+def test_expired_cookie_invalidates_state(tmp_path):
+    cache = AuthStateCache(str(tmp_path), "secret_sauce")
+    write_state(cache, "standard_user",
+                [{"name": "session-username", "expires": time.time() - 1}])
+
+    assert not cache.is_valid("standard_user")
+
+
+def test_old_state_file_is_invalid(tmp_path):
+    """Файл старше max_age не используется даже с живыми cookies"""
+    cache = AuthStateCache(str(tmp_path), "secret_sauce", max_age_seconds=60)
+    write_state(cache, "standard_user", [{"name": "session-username", "expires": -1}])
+    old = time.time() - 120
+    os.utime(cache.state_path("standard_user"), (old, old))
+
+    assert not cache.is_valid("standard_user")
+
+
+def test_invalidate_removes_state(tmp_path):
+    cache = AuthStateCache(str(tmp_path), "secret_sauce")
+    write_state(cache, "standard_user", [{"name": "session-username", "expires": -1}])
+
+    cache.invalidate("standard_user")
+    cache.invalidate("standard_user")
+
+    assert not os.path.exists(cache.state_path("standard_user"))
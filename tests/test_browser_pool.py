@@ -0,0 +1,133 @@
+"""
+Тесты пула браузеров (без запуска реального браузера)
+"""
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+from utils.browser_pool import BrowserPool
+
+
+class FakeBrowser:
+    """Заглушка Playwright Browser"""
+
+    def __init__(self):
+        self.connected = True
+        self.closed = False
+        self.fail_new_context = False
+        self.handlers = {}
+
+    def is_connected(self):
+        return self.connected
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def new_context(self, **options):
+        if self.fail_new_context:
+            raise PlaywrightError("Target closed")
+        return {"browser": self, **options}
+
+    def close(self):
+        self.closed = True
+
+    def crash(self):
+        self.connected = False
+        self.handlers["disconnected"](self)
+
+
+class FakeBrowserType:
+    """Заглушка BrowserType, запоминающая запущенные браузеры"""
+
+    def __init__(self):
+        self.launched = []
+
+    def launch(self, **options):
+        browser = FakeBrowser()
+        self.launched.append(browser)
+        return browser
+
+    def connect_over_cdp(self, endpoint):
+        browser = FakeBrowser()
+        browser.endpoint = endpoint
+        self.launched.append(browser)
+        return browser
+
+
+class FakePlaywright:
+    def __init__(self):
+        self.chromium = FakeBrowserType()
+        self.firefox = FakeBrowserType()
+        self.webkit = FakeBrowserType()
+
+
+@pytest.fixture
+def playwright():
+    return FakePlaywright()
+
+
+def test_browser_is_reused_between_contexts(playwright):
+    """Один браузер обслуживает все контексты воркера"""
+    pool = BrowserPool(playwright)
+
+    first = pool.new_context(viewport={"width": 1, "height": 1})
+    second = pool.new_context()
+
+    assert first["browser"] is second["browser"]
+    assert pool.launches == 1
+    assert pool.contexts_created == 2
+
+
+def test_crashed_browser_is_relaunched(playwright):
+    """После падения браузера следующий контекст создается на новом"""
+    pool = BrowserPool(playwright)
+    crashed = pool.new_context()["browser"]
+
+    crashed.crash()
+    context = pool.new_context()
+
+    assert context["browser"] is not crashed
+    assert pool.launches == 2
+
+
+def test_failed_new_context_retries_on_fresh_browser(playwright):
+    """Ошибка создания контекста приводит к перезапуску и повтору"""
+    pool = BrowserPool(playwright)
+    broken = pool.browser
+    broken.fail_new_context = True
+
+    context = pool.new_context()
+
+    assert broken.closed
+    assert context["browser"] is playwright.chromium.launched[-1]
+
+
+def test_browser_recycled_after_limit(playwright):
+    """Браузер перезапускается после max_contexts_per_browser контекстов"""
+    pool = BrowserPool(playwright, max_contexts_per_browser=2)
+
+    browsers = [pool.new_context()["browser"] for _ in range(5)]
+
+    assert pool.launches == 3
+    assert browsers[0] is browsers[1]
+    assert browsers[1] is not browsers[2]
+
+
+def test_unknown_browser_falls_back_to_chromium(playwright):
+    """Неизвестный браузер в конфигурации -> chromium"""
+    pool = BrowserPool(playwright, browser_name="safari")
+
+    pool.new_context()
+
+    assert len(playwright.chromium.launched) == 1
+
+
+def test_cdp_endpoint_connects_instead_of_launching(playwright):
+    """С cdp_endpoint воркер подключается к запущенному браузеру и переподключается после падения"""
+    pool = BrowserPool(playwright, browser_name="chromium", cdp_endpoint="ws://127.0.0.1:9222/devtools/browser/x")
+
+    browser = pool.new_context()["browser"]
+    browser.crash()
+    reconnected = pool.new_context()["browser"]
+
+    assert browser.endpoint == reconnected.endpoint == "ws://127.0.0.1:9222/devtools/browser/x"
+    assert reconnected is not browser
+    assert pool.launches == 2
@@ -0,0 +1,70 @@
+"""
+Тесты фоновой обработки визуальных контрольных точек (без браузера)
+"""
+import threading
+from utils.checkpoint_queue import CheckpointQueue
+from utils.visual_diff import LocalEyes, LocalRunner, DiffResult
+
+
+class FakePage:
+    def set_viewport_size(self, size):
+        pass
+
+    def screenshot(self, full_page=False):
+        return b"png"
+
+
+def make_eyes(runner, compare):
+    eyes = LocalEyes(runner)
+    eyes._compare = compare
+    eyes.open(FakePage(), app_name="SauceDemo", test_name="test_flow")
+    return eyes
+
+
+def test_check_returns_before_comparison_finishes():
+    release = threading.Event()
+
+    def slow_compare(name, png_bytes, regions, test_dir):
+        release.wait(5)
+        return DiffResult(name, passed=True)
+
+    queue = CheckpointQueue(workers=2)
+    runner = LocalRunner(queue)
+    eyes = make_eyes(runner, slow_compare)
+
+    eyes.check("Login Page")
+    eyes.check("Inventory Page")
+    assert queue.pending == 2
+
+    eyes.close_async()
+    release.set()
+    queue.shutdown()
+
+    results = runner.get_all_results()
+    assert [check.name for check in results[0].checks] == ["Login Page", "Inventory Page"]
+    assert results[0].is_passed
+
+
+def test_failed_processing_marks_test_failed():
+    def broken_compare(name, png_bytes, regions, test_dir):
+        raise OSError("disk full")
+
+    queue = CheckpointQueue(workers=1)
+    runner = LocalRunner(queue)
+    eyes = make_eyes(runner, broken_compare)
+
+    eyes.check("Cart Page")
+    eyes.close_async()
+    queue.drain()
+
+    assert not runner.get_all_results()[0].is_passed
+
+
+def test_without_queue_check_is_synchronous():
+    runner = LocalRunner()
+    eyes = make_eyes(runner, lambda name, png, regions, test_dir: DiffResult(name, passed=False))
+
+    result = eyes.check("Checkout Page")
+
+    assert isinstance(result, DiffResult)
+    assert eyes.results.checks == [result]
@@ -0,0 +1,82 @@
+"""
+Тесты замеров производительности (без запуска браузера)
+"""
+import json
+import pytest
+from pages.base_page import BasePage
+from utils.perf_timing import PerformanceRecorder, PerformanceBudgetExceeded
+
+
+class FakePage:
+    """Заглушка Playwright Page: клик порождает сетевые запросы"""
+
+    def __init__(self):
+        self.url = "https://www.saucedemo.com/"
+        self.handlers = {}
+
+    def on(self, event, handler):
+        self.handlers[event] = handler
+
+    def click(self, selector):
+        for _ in range(3):
+            if "request" in self.handlers:
+                self.handlers["request"](object())
+
+    def goto(self, url):
+        self.url = url
+
+    def evaluate(self, script, arg=None):
+        return {"load_ms": 120.0}
+
+
+def test_actions_recorded_with_request_counts():
+    page = FakePage()
+    recorder = PerformanceRecorder("tests/test_x.py::test_a").attach(page)
+
+    BasePage(page).click("#login")
+
+    record = recorder.records[0]
+    assert record["action"] == "BasePage.click"
+    assert record["target"] == "#login"
+    assert record["requests"] == 3
+
+
+def test_navigation_timing_captured_after_goto():
+    page = FakePage()
+    recorder = PerformanceRecorder("t").attach(page)
+
+    BasePage(page).navigate_to("https://www.saucedemo.com/inventory.html")
+
+    assert recorder.records[0]["navigation"] == {"load_ms": 120.0}
+
+
+def test_budget_exceeded_fails_action():
+    page = FakePage()
+    PerformanceRecorder("t", budgets=[(-1, ("click",))]).attach(page)
+
+    with pytest.raises(PerformanceBudgetExceeded):
+        BasePage(page).click("#login")
+
+
+def test_budget_applies_only_to_listed_actions():
+    recorder = PerformanceRecorder("t", budgets=[(100, ("navigate_to",)), (500, None)])
+
+    assert recorder.budget_for("LoginPage.navigate_to") == 100
+    assert recorder.budget_for("LoginPage.click") == 500
+
+
+def test_page_without_recorder_is_not_measured():
+    BasePage(FakePage()).click("#login")
+
+
+def test_records_written_as_jsonl(tmp_path):
+    page = FakePage()
+    recorder = PerformanceRecorder("t").attach(page)
+    BasePage(page).click("#a")
+    BasePage(page).click("#b")
+
+    path = tmp_path / "perf.jsonl"
+    recorder.write(str(path))
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["target"] for line in lines] == ["#a", "#b"]
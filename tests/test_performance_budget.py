@@ -0,0 +1,28 @@
+"""
+Бюджеты производительности перехода Login -> Inventory
+"""
+import pytest
+from pages.login_page import LoginPage
+from utils.perf_timing import PerformanceBudgetExceeded
+
+
+def login_and_wait_inventory(page, username, password):
+    login_page = LoginPage(page)
+    login_page.open()
+    login_page.login(username, password)
+    login_page.wait_for_url("**/inventory.html")
+
+
+@pytest.mark.smoke
+@pytest.mark.perf_budget(3000, actions=("wait_for_url",))
+def test_standard_user_login_within_budget(page, config):
+    """Переход на каталог после логина укладывается в бюджет"""
+    login_and_wait_inventory(page, "standard_user", config.TEST_PASSWORD)
+
+
+@pytest.mark.regression
+@pytest.mark.perf_budget(3000, actions=("wait_for_url",))
+def test_performance_glitch_user_exceeds_budget(page, config):
+    """У performance_glitch_user переход на каталог выходит за бюджет"""
+    with pytest.raises(PerformanceBudgetExceeded):
+        login_and_wait_inventory(page, "performance_glitch_user", config.TEST_PASSWORD)
@@ -44,8 +44,8 @@ class TestSauceDemoBaseline:
         login_page = LoginPage(page)
         login_page.open()
 
-        # Ожидание полной загрузки страницы
-        page.wait_for_load_state("networkidle")
+        # Ожидание готовности страницы
+        login_page.wait_until_ready()
 
         # ВИЗУАЛЬНАЯ КОНТРОЛЬНАЯ ТОЧКА 1: Login Page
         print("[STEP 1] Создание визуального снимка: Login Page")
@@ -62,7 +62,7 @@ class TestSauceDemoBaseline:
 
         # Ожидание загрузки страницы каталога
         page.wait_for_url("**/inventory.html")
-        page.wait_for_load_state("networkidle")
+        inventory_page.wait_until_ready()
 
         # Проверка что страница загружена
         assert inventory_page.is_page_loaded(), "Страница каталога не загружена"
@@ -97,7 +97,7 @@ class TestSauceDemoBaseline:
 
         # Ожидание загрузки страницы корзины
         page.wait_for_url("**/cart.html")
-        page.wait_for_load_state("networkidle")
+        cart_page.wait_until_ready()
 
         # Проверка что страница корзины загружена
         assert cart_page.is_page_loaded(), "Страница корзины не загружена"
@@ -126,7 +126,7 @@ class TestSauceDemoBaseline:
 
         # Ожидание загрузки страницы оформления заказа
         page.wait_for_url("**/checkout-step-one.html")
-        page.wait_for_load_state("networkidle")
+        checkout_page.wait_until_ready()
 
         # Проверка что страница оформления заказа загружена
         assert checkout_page.is_page_loaded(), "Страница оформления заказа не загружена"
@@ -43,8 +43,8 @@ class TestSauceDemoVisualDefects:
         login_page = LoginPage(page)
         login_page.open()
 
-        # Ожидание полной загрузки страницы
-        page.wait_for_load_state("networkidle")
+        # Ожидание готовности страницы
+        login_page.wait_until_ready()
 
         print("[STEP 1] Выполнение авторизации (до внесения дефекта)...")
         login_page.login(config.TEST_USERNAME, config.TEST_PASSWORD)
@@ -55,23 +55,20 @@ class TestSauceDemoVisualDefects:
         # Возвращаемся на страницу login для демонстрации дефекта
         print("[STEP 1] Возврат на страницу Login для внесения визуального дефекта...")
         login_page.open()
-        page.wait_for_load_state("networkidle")
+        login_page.wait_until_ready()
 
         # ВНЕСЕНИЕ ДЕФЕКТА 1: Скрытие кнопки Login
         print("[STEP 1] ⚠️  ВНЕСЕНИЕ ДЕФЕКТА 1: Скрытие кнопки Login")
         login_page.inject_login_visual_defects()
 
-        # Небольшая задержка для применения стилей
-        page.wait_for_timeout(500)
-
         # ВИЗУАЛЬНАЯ КОНТРОЛЬНАЯ ТОЧКА 1: Login Page (с дефектом)
         print("[STEP 1] Создание визуального снимка: Login Page (с дефектом)")
         eyes.check("Login Page", Target.window().fully())
 
         # Снова авторизуемся для продолжения теста
         print("[STEP 1] Повторная авторизация для продолжения теста...")
-        page.goto(config.BASE_URL)
-        page.wait_for_load_state("networkidle")
+        login_page.open()
+        login_page.wait_until_ready()
         login_page.login(config.TEST_USERNAME, config.TEST_PASSWORD)
 
         # ============================================================
@@ -82,7 +79,7 @@ class TestSauceDemoVisualDefects:
 
         # Ожидание загрузки страницы каталога
         page.wait_for_url("**/inventory.html")
-        page.wait_for_load_state("networkidle")
+        inventory_page.wait_until_ready()
 
         # Проверка что страница загружена
         assert inventory_page.is_page_loaded(), "Страница каталога не загружена"
@@ -91,9 +88,6 @@ class TestSauceDemoVisualDefects:
         print("[STEP 2] ⚠️  ВНЕСЕНИЕ ДЕФЕКТА 2: Красный фон первого товара + скрытие цены")
         inventory_page.inject_inventory_visual_defects()
 
-        # Небольшая задержка для применения стилей
-        page.wait_for_timeout(500)
-
         # ВИЗУАЛЬНАЯ КОНТРОЛЬНАЯ ТОЧКА 2: Inventory Page (с дефектом)
         print("[STEP 2] Создание визуального снимка: Inventory Page (с дефектом)")
         eyes.check("Inventory Page", Target.window().fully())
@@ -119,7 +113,7 @@ class TestSauceDemoVisualDefects:
 
         # Ожидание загрузки страницы корзины
         page.wait_for_url("**/cart.html")
-        page.wait_for_load_state("networkidle")
+        cart_page.wait_until_ready()
 
         # Проверка что страница корзины загружена
         assert cart_page.is_page_loaded(), "Страница корзины не загружена"
@@ -128,9 +122,6 @@ class TestSauceDemoVisualDefects:
         print("[STEP 4] ⚠️  ВНЕСЕНИЕ ДЕФЕКТА 3: Зеленая кнопка Checkout + смещение контейнера")
         cart_page.inject_cart_visual_defects()
 
-        # Небольшая задержка для применения стилей
-        page.wait_for_timeout(500)
-
         # ВИЗУАЛЬНАЯ КОНТРОЛЬНАЯ ТОЧКА 3: Cart Page (с дефектом)
         print("[STEP 4] Создание визуального снимка: Cart Page (с дефектом)")
         eyes.check("Cart Page", Target.window().fully())
@@ -145,7 +136,7 @@ class TestSauceDemoVisualDefects:
 
         # Ожидание загрузки страницы оформления заказа
         page.wait_for_url("**/checkout-step-one.html")
-        page.wait_for_load_state("networkidle")
+        checkout_page.wait_until_ready()
 
         # Проверка что страница оформления заказа загружена
         assert checkout_page.is_page_loaded(), "Страница оформления заказа не загружена"
@@ -154,9 +145,6 @@ class TestSauceDemoVisualDefects:
         print("[STEP 5] ⚠️  ВНЕСЕНИЕ ДЕФЕКТА 4: Скрытие First Name + уменьшение кнопки Continue")
         checkout_page.inject_checkout_visual_defects()
 
-        # Небольшая задержка для применения стилей
-        page.wait_for_timeout(500)
-
         # ВИЗУАЛЬНАЯ КОНТРОЛЬНАЯ ТОЧКА 4: Checkout Page (с дефектом)
         print("[STEP 5] Создание визуального снимка: Checkout Page - Step One (с дефектом)")
         eyes.check("Checkout Page - Step One", Target.window().fully())
@@ -0,0 +1,87 @@
+"""
+Тесты локального визуального diff (на массивах, без браузера)
+"""
+import numpy as np
+from utils.visual_diff import compare_images, render_diff, Region
+
+
+def blank(height=64, width=64, color=(255, 255, 255)):
+    image = np.zeros((height, width, 3), dtype=np.uint8)
+    image[:] = color
+    return image
+
+
+def with_box(image, x, y, w, h, color):
+    image = image.copy()
+    image[y:y + h, x:x + w] = color
+    return image
+
+
+def test_identical_images_have_no_changes():
+    image = with_box(blank(), 10, 10, 20, 20, (0, 0, 0))
+
+    mask, boxes = compare_images(image, image.copy())
+
+    assert not mask.any()
+    assert boxes == []
+
+
+def test_changed_area_reported_as_bounding_box():
+    baseline = blank()
+    actual = with_box(baseline, 20, 20, 16, 16, (255, 0, 0))
+
+    mask, boxes = compare_images(baseline, actual)
+
+    assert mask.sum() > 0
+    assert boxes == [(16, 16, 32, 32)]
+
+
+def test_one_pixel_edge_shift_is_suppressed():
+    """Сдвиг границы на 1px (антиалиасинг/субпиксельный рендеринг) - не изменение"""
+    baseline = with_box(blank(), 20, 20, 20, 20, (0, 0, 0))
+    actual = with_box(blank(), 21, 20, 20, 20, (0, 0, 0))
+
+    _, boxes = compare_images(baseline, actual)
+
+    assert boxes == []
+    _, boxes = compare_images(baseline, actual, antialiasing=False)
+    assert boxes
+
+
+def test_small_color_noise_within_tolerance():
+    baseline = blank(color=(200, 200, 200))
+    actual = blank(color=(210, 205, 200))
+
+    _, boxes = compare_images(baseline, actual, tolerance=16)
+
+    assert boxes == []
+
+
+def test_region_tolerance_and_ignore():
+    baseline = blank()
+    actual = with_box(baseline, 0, 0, 16, 16, (0, 0, 0))
+    actual = with_box(actual, 40, 40, 16, 16, (230, 230, 230))
+
+    _, boxes = compare_images(baseline, actual, regions=[
+        Region(0, 0, 16, 16, ignore=True),
+        Region(40, 40, 16, 16, tolerance=40),
+    ])
+
+    assert boxes == []
+
+
+def test_size_mismatch_is_full_change():
+    _, boxes = compare_images(blank(64, 64), blank(80, 64))
+
+    assert boxes == [(0, 0, 64, 80)]
+
+
+def test_diff_image_highlights_changes():
+    baseline = blank()
+    actual = with_box(baseline, 20, 20, 16, 16, (0, 0, 255))
+    mask, boxes = compare_images(baseline, actual)
+
+    diff = render_diff(actual, mask, boxes)
+
+    assert tuple(diff[28, 28]) == (255, 0, 0)
+    assert tuple(diff[16, 16]) == (255, 0, 255)
@@ -0,0 +1,244 @@
+"""
+Хранилище артефактов упавших тестов (скриншоты, трейсы, видео).
+Тест только снимает артефакт (Playwright нельзя вызывать из других
+потоков) и считает хеш содержимого, а сжатие и запись на диск
+выполняются пулом потоков. Путь артефакта зависит только от хеша,
+поэтому известен сразу и одинаковые артефакты (например, одна и та же
+страница ошибки в нескольких тестах) хранятся один раз.
+
+Сжатие:
+- скриншоты PNG -> WebP (Pillow; без Pillow хранятся как есть)
+- текстовые артефакты (html, json, har, log) -> zstd (zstandard) или gzip
+- трейсы (zip) и видео (webm) уже сжаты и хранятся как есть
+"""
+import gzip
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+IMAGE_SUFFIXES = ('.png',)
+TEXT_SUFFIXES = ('.html', '.json', '.har', '.log', '.txt')
+
+
+def _has_pillow():
+    try:
+        import PIL  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class ArtifactStore:
+    """Дедупликация по хешу и фоновое сжатие артефактов"""
+
+    def __init__(self, root="reports/artifacts", workers=2, webp_quality=80):
+        """
+        Инициализация хранилища
+
+        Args:
+            root: Директория артефактов
+            workers: Количество потоков сжатия
+            webp_quality: Качество WebP для скриншотов (0-100)
+        """
+        self.root = os.path.abspath(root)
+        self.incoming_dir = os.path.join(self.root, "_incoming")
+        self.webp_quality = webp_quality
+        self.webp = _has_pillow()
+        self.stored = 0
+        self.deduplicated = 0
+        self.errors = []
+        os.makedirs(self.incoming_dir, exist_ok=True)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artifact")
+        self._futures = []
+        self._paths = {}
+        self._lock = threading.Lock()
+
+    def add_bytes(self, data, suffix):
+        """
+        Сохранение артефакта из памяти (скриншот)
+
+        Args:
+            data: Содержимое
+            suffix: Исходное расширение (.png, .html...)
+
+        Returns:
+            Путь, по которому артефакт будет записан
+        """
+        digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+        return self._submit(digest, suffix, data=data)
+
+    def add_file(self, path, remove=True):
+        """
+        Сохранение артефакта из файла (трейс, видео)
+
+        Args:
+            path: Файл артефакта
+            remove: Удалить исходный файл после записи
+
+        Returns:
+            Путь, по которому артефакт будет записан
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return self._submit(digest.hexdigest(), os.path.splitext(path)[1], source=path, remove=remove)
+
+    def incoming_path(self, suffix):
+        """Временный файл для артефакта, который записывает браузер (трейс)"""
+        return os.path.join(self.incoming_dir, f"{uuid.uuid4().hex}{suffix}")
+
+    def stored_suffix(self, suffix):
+        """Расширение артефакта после сжатия"""
+        suffix = suffix.lower()
+        if suffix in IMAGE_SUFFIXES and self.webp:
+            return '.webp'
+        if suffix in TEXT_SUFFIXES:
+            return suffix + ('.zst' if zstandard is not None else '.gz')
+        return suffix
+
+    def _submit(self, digest, suffix, data=None, source=None, remove=False):
+        target = os.path.join(self.root, digest[:2], digest + self.stored_suffix(suffix))
+        with self._lock:
+            if digest in self._paths or os.path.exists(target):
+                self.deduplicated += 1
+                self._paths[digest] = target
+                if source is not None and remove:
+                    os.remove(source)
+                return target
+            self._paths[digest] = target
+            self.stored += 1
+
+        future = self._executor.submit(self._write, target, suffix.lower(), data, source, remove)
+        self._futures.append(future)
+        return target
+
+    def _write(self, target, suffix, data, source, remove):
+        try:
+            if data is None and (suffix in TEXT_SUFFIXES or (suffix in IMAGE_SUFFIXES and self.webp)):
+                with open(source, 'rb') as f:
+                    data = f.read()
+
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), suffix=".tmp")
+            with os.fdopen(fd, 'wb') as f:
+                if data is None:
+                    with open(source, 'rb') as src:
+                        shutil.copyfileobj(src, f)
+                else:
+                    f.write(self._encode(data, suffix))
+            os.replace(tmp_path, target)
+        except Exception as error:
+            self.errors.append((target, error))
+            raise
+        finally:
+            if source is not None and remove and os.path.exists(source):
+                os.remove(source)
+
+    def _encode(self, data, suffix):
+        if suffix in IMAGE_SUFFIXES and self.webp:
+            from PIL import Image
+            output = io.BytesIO()
+            Image.open(io.BytesIO(data)).save(output, format='WEBP', quality=self.webp_quality, method=4)
+            return output.getvalue()
+        if suffix in TEXT_SUFFIXES:
+            if zstandard is not None:
+                return zstandard.ZstdCompressor(level=10).compress(data)
+            return gzip.compress(data, compresslevel=6)
+        return data
+
+    @property
+    def pending(self):
+        """Количество еще не записанных артефактов"""
+        return sum(1 for future in self._futures if not future.done())
+
+    def drain(self):
+        """Ожидание записи всех поставленных артефактов"""
+        for future in self._futures:
+            future.exception()
+        self._futures = [future for future in self._futures if not future.done()]
+
+    def shutdown(self):
+        """Остановка потоков после записи очереди"""
+        self._executor.shutdown(wait=True)
+        shutil.rmtree(self.incoming_dir, ignore_errors=True)
+
+
+class ContextArtifacts:
+    """
+    Трейс и видео контекста браузера, сохраняемые только при падении теста
+
+    Запись идет всегда (заранее неизвестно, упадет ли тест), но для
+    прошедших тестов трейс не экспортируется, а видео удаляется.
+    """
+
+    def __init__(self, store, trace=False, video=False):
+        """
+        Args:
+            store: ArtifactStore
+            trace: Записывать Playwright трейс
+            video: Записывать видео страниц
+        """
+        self.store = store
+        self.trace = trace
+        self.video = video
+        self._videos = []
+
+    def context_options(self):
+        """Параметры browser.new_context для записи видео"""
+        return {'record_video_dir': self.store.incoming_dir} if self.video else {}
+
+    def start(self, context):
+        if self.trace:
+            context.tracing.start(screenshots=True, snapshots=True)
+        if self.video:
+            # Страницы закрываются раньше контекста (фикстура page),
+            # поэтому видео запоминаются при создании страниц
+            context.on("page", self._remember_video)
+
+    def _remember_video(self, page):
+        if page.video:
+            self._videos.append(page.video)
+
+    def finish(self, context, failed):
+        """
+        Остановка записи и закрытие контекста
+
+        Args:
+            context: BrowserContext из start
+            failed: Тест упал
+
+        Returns:
+            Пути сохраненных артефактов (пусто для прошедшего теста)
+        """
+        paths = []
+
+        if self.trace:
+            if failed:
+                trace_path = self.store.incoming_path('.zip')
+                context.tracing.stop(path=trace_path)
+                paths.append(self.store.add_file(trace_path))
+            else:
+                context.tracing.stop()
+
+        # Видео дописывается на диск при закрытии контекста
+        context.close()
+
+        for video in self._videos:
+            video_path = video.path()
+            if failed:
+                paths.append(self.store.add_file(video_path))
+            elif os.path.exists(video_path):
+                os.remove(video_path)
+        return paths
@@ -0,0 +1,199 @@
+"""
+Кеш статических ресурсов для тестов.
+JS бандлы, стили, шрифты и изображения SauceDemo перехватываются через
+context.route и отдаются с диска; сеть используется только при первом
+запросе ресурса (или при ревалидации по ETag). Дополнительно можно
+блокировать запросы сторонней аналитики.
+"""
+import hashlib
+import json
+import os
+import tempfile
+import time
+from urllib.parse import urlparse
+
+from playwright.sync_api import Error as PlaywrightError
+
+
+def _is_target_closed(error):
+    """Ошибка из-за закрытой страницы/контекста (TargetClosedError в Playwright >= 1.41)"""
+    return "has been closed" in str(error)
+
+
+class StaticAssetCache:
+    """
+    Дисковый кеш статики, подключаемый к BrowserContext.
+
+    Для каждого URL хранится файл метаданных (ETag, заголовки, время
+    сохранения) и тело ответа, ключ которого - URL + ETag. Файлы пишутся
+    атомарно, поэтому кеш можно разделять между xdist воркерами.
+    """
+
+    STATIC_RESOURCE_TYPES = ("script", "stylesheet", "image", "font")
+
+    # Хосты аналитики и сбора ошибок, не влияющие на UI
+    THIRD_PARTY_HOSTS = (
+        "google-analytics.com",
+        "googletagmanager.com",
+        "doubleclick.net",
+        "backtrace.io",
+        "segment.io",
+        "hotjar.com",
+    )
+
+    # Заголовки, которые не переносятся в ответ из кеша
+    SKIPPED_HEADERS = ("content-length", "content-encoding", "transfer-encoding", "set-cookie")
+
+    def __init__(self, cache_dir, cache_static=True, block_third_party=False,
+                 max_age_seconds=86400):
+        """
+        Инициализация кеша
+
+        Args:
+            cache_dir: Директория кеша
+            cache_static: Отдавать статику из кеша (False - только блокировка)
+            block_third_party: Блокировать запросы к THIRD_PARTY_HOSTS
+            max_age_seconds: Через сколько секунд ресурс ревалидируется по ETag
+        """
+        self.cache_dir = cache_dir
+        self.cache_static = cache_static
+        self.block_third_party = block_third_party
+        self.max_age_seconds = max_age_seconds
+        os.makedirs(cache_dir, exist_ok=True)
+
+        # Статистика для отладки
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+        self.blocked = 0
+
+    def attach(self, context):
+        """
+        Подключение перехвата запросов к контексту
+
+        Args:
+            context: Playwright BrowserContext
+        """
+        context.route("**/*", self._handle_route)
+
+    def is_third_party(self, url):
+        """Проверка, что URL относится к сторонней аналитике"""
+        host = urlparse(url).hostname or ""
+        return any(host == blocked or host.endswith("." + blocked)
+                   for blocked in self.THIRD_PARTY_HOSTS)
+
+    def _handle_route(self, route):
+        """Обработчик перехваченного запроса"""
+        request = route.request
+
+        if self.block_third_party and self.is_third_party(request.url):
+            self.blocked += 1
+            route.abort()
+            return
+
+        if (not self.cache_static or request.method != "GET"
+                or request.resource_type not in self.STATIC_RESOURCE_TYPES):
+            route.continue_()
+            return
+
+        try:
+            self._serve_static(route, request.url)
+        except PlaywrightError as error:
+            # Страница закрылась во время загрузки ресурса - отвечать уже некому
+            if not _is_target_closed(error):
+                raise
+
+    def _serve_static(self, route, url):
+        """Ответ из кеша, ревалидация или загрузка из сети"""
+        meta = self._load_meta(url)
+        body = self._read_body(meta) if meta is not None else None
+
+        if body is not None and time.time() - meta["stored_at"] <= self.max_age_seconds:
+            self.hits += 1
+            route.fulfill(status=200, headers=meta["headers"], body=body)
+            return
+
+        request_headers = dict(route.request.headers)
+        if body is not None and meta.get("etag"):
+            request_headers["If-None-Match"] = meta["etag"]
+
+        try:
+            response = route.fetch(headers=request_headers)
+        except PlaywrightError as error:
+            if _is_target_closed(error):
+                raise
+            # Отказ соединения, таймаут, TLS: запрос без ответа висел бы до
+            # таймаута страницы, поэтому его выполняет сам браузер
+            route.continue_()
+            return
+
+        if response.status == 304 and body is not None:
+            self.revalidated += 1
+            meta["stored_at"] = time.time()
+            self._write_json(self._meta_path(url), meta)
+            route.fulfill(status=200, headers=meta["headers"], body=body)
+            return
+
+        self.misses += 1
+        if response.status == 200:
+            self._store(url, response)
+        route.fulfill(response=response)
+
+    def _store(self, url, response):
+        """Сохранение ответа на диск"""
+        headers = {
+            name: value for name, value in response.headers.items()
+            if name.lower() not in self.SKIPPED_HEADERS
+        }
+        etag = headers.get("etag", "")
+        body_file = self._key(url + etag) + ".bin"
+        previous = self._load_meta(url)
+
+        self._write_bytes(os.path.join(self.cache_dir, body_file), response.body())
+        self._write_json(self._meta_path(url), {
+            "url": url,
+            "etag": etag,
+            "headers": headers,
+            "body_file": body_file,
+            "stored_at": time.time()
+        })
+
+        # Тело прошлой версии ресурса (другой ETag) больше не нужно
+        if previous is not None and previous.get("body_file") not in (None, body_file):
+            try:
+                os.remove(os.path.join(self.cache_dir, previous["body_file"]))
+            except OSError:
+                pass
+
+    def _load_meta(self, url):
+        """Метаданные ресурса или None"""
+        try:
+            with open(self._meta_path(url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _read_body(self, meta):
+        """Тело ресурса из кеша или None если файл удален"""
+        try:
+            with open(os.path.join(self.cache_dir, meta["body_file"]), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _meta_path(self, url):
+        return os.path.join(self.cache_dir, self._key(url) + ".json")
+
+    @staticmethod
+    def _key(value):
+        return hashlib.sha256(value.encode('utf-8')).hexdigest()
+
+    def _write_json(self, path, data):
+        self._write_bytes(path, json.dumps(data).encode('utf-8'))
+
+    def _write_bytes(self, path, data):
+        """Атомарная запись (параллельные воркеры могут писать один ресурс)"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
@@ -0,0 +1,111 @@
+"""
+Конкурентное выполнение легковесных сценариев на async Playwright.
+Один браузер и один event loop обслуживают десятки сценариев, каждый
+в своем BrowserContext, без отдельного Python процесса на сценарий.
+"""
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from playwright.async_api import async_playwright
+
+
+@dataclass
+class FlowResult:
+    """Результат одного сценария"""
+    name: str
+    passed: bool
+    duration: float
+    error: Optional[str] = None
+    value: object = field(default=None, repr=False)
+
+
+class AsyncFlowRunner:
+    """
+    Запуск async сценариев конкурентно в одном процессе.
+
+    Сценарий - async функция, принимающая async Page. Event loop
+    выполняется в отдельном потоке, поэтому раннер можно вызывать из
+    синхронных тестов, где уже запущен sync Playwright.
+    """
+
+    SUPPORTED_BROWSERS = ("chromium", "firefox", "webkit")
+
+    def __init__(self, browser_name="chromium", headless=True, concurrency=8,
+                 context_options=None, flow_timeout=60):
+        """
+        Инициализация раннера
+
+        Args:
+            browser_name: chromium/firefox/webkit (неизвестное имя -> chromium)
+            headless: Headless режим
+            concurrency: Максимум одновременно открытых контекстов
+            context_options: Параметры browser.new_context (viewport и т.д.)
+            flow_timeout: Таймаут одного сценария в секундах
+        """
+        self.browser_name = browser_name if browser_name in self.SUPPORTED_BROWSERS else "chromium"
+        self.headless = headless
+        self.concurrency = concurrency
+        self.context_options = context_options or {}
+        self.flow_timeout = flow_timeout
+
+    def run(self, flows):
+        """
+        Выполнение сценариев
+
+        Args:
+            flows: Словарь {имя: async функция(page)} или список функций
+
+        Returns:
+            Список FlowResult в порядке переданных сценариев
+        """
+        if not isinstance(flows, dict):
+            flows = {flow.__name__: flow for flow in flows}
+
+        results = []
+        errors = []
+
+        def target():
+            try:
+                results.extend(asyncio.run(self._run_all(flows)))
+            except BaseException as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=target, name="async-flow-runner")
+        thread.start()
+        thread.join()
+
+        if errors:
+            raise errors[0]
+        return results
+
+    async def _run_all(self, flows):
+        """Запуск браузера и всех сценариев с ограничением конкурентности"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with async_playwright() as playwright:
+            browser = await getattr(playwright, self.browser_name).launch(headless=self.headless)
+            try:
+                return await asyncio.gather(*(
+                    self._run_flow(browser, semaphore, name, flow)
+                    for name, flow in flows.items()
+                ))
+            finally:
+                await browser.close()
+
+    async def _run_flow(self, browser, semaphore, name, flow):
+        """Выполнение одного сценария в изолированном контексте"""
+        async with semaphore:
+            start = time.perf_counter()
+            context = await browser.new_context(**self.context_options)
+            try:
+                page = await context.new_page()
+                value = await asyncio.wait_for(flow(page), timeout=self.flow_timeout)
+                return FlowResult(name, True, time.perf_counter() - start, value=value)
+            except Exception as e:
+                return FlowResult(name, False, time.perf_counter() - start,
+                                  error=f"{type(e).__name__}: {e}")
+            finally:
+                await context.close()
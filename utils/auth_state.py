@@ -0,0 +1,152 @@
+"""
+Кеш авторизованных сессий (Playwright storage state).
+UI логин выполняется один раз на пользователя, состояние (cookies, localStorage)
+сохраняется на диск и переиспользуется тестами до истечения сессии.
+"""
+import json
+import os
+import tempfile
+import time
+
+from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
+
+
+class LoginFailedError(Exception):
+    """Авторизация пользователя не удалась (например, locked_out_user)"""
+
+    def __init__(self, username, message):
+        super().__init__(f"Не удалось авторизоваться как '{username}': {message}")
+        self.username = username
+        self.message = message
+
+
+class AuthStateCache:
+    """Кеш storage state по пользователям"""
+
+    def __init__(self, cache_dir, password, max_age_seconds=600, login_timeout=10000):
+        """
+        Инициализация кеша
+
+        Args:
+            cache_dir: Директория для файлов storage state
+            password: Пароль тестовых пользователей
+            max_age_seconds: Максимальный возраст сохраненной сессии
+            login_timeout: Таймаут перехода на каталог после логина (мс)
+        """
+        self.cache_dir = cache_dir
+        self.password = password
+        self.max_age_seconds = max_age_seconds
+        self.login_timeout = login_timeout
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def state_path(self, username):
+        """Путь к файлу storage state пользователя"""
+        return os.path.join(self.cache_dir, f"{username}.json")
+
+    def get_state(self, browser, username, context_options=None):
+        """
+        Storage state авторизованного пользователя (логин при необходимости)
+
+        Args:
+            browser: Браузер для выполнения логина
+            username: Имя пользователя
+            context_options: Параметры контекста для логина (viewport и т.д.)
+
+        Returns:
+            Путь к файлу storage state
+        """
+        if not self.is_valid(username):
+            self._login(browser, username, context_options or {})
+        return self.state_path(username)
+
+    def is_valid(self, username):
+        """
+        Проверка сохраненной сессии: файл есть, не старше max_age
+        и cookies сессии не истекли
+
+        Args:
+            username: Имя пользователя
+
+        Returns:
+            True если сохраненное состояние можно использовать
+        """
+        path = self.state_path(username)
+        if not os.path.exists(path):
+            return False
+        if time.time() - os.path.getmtime(path) > self.max_age_seconds:
+            return False
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        now = time.time()
+        cookies = state.get("cookies", [])
+        # expires == -1 у session cookies (живут пока жив контекст)
+        return bool(cookies) and all(
+            cookie.get("expires", -1) == -1 or cookie["expires"] > now
+            for cookie in cookies
+        )
+
+    def invalidate(self, username):
+        """Удаление сохраненной сессии пользователя"""
+        try:
+            os.remove(self.state_path(username))
+        except FileNotFoundError:
+            pass
+
+    def _login(self, browser, username, context_options):
+        """UI логин и сохранение storage state"""
+        context = browser.new_context(**context_options)
+        try:
+            page = context.new_page()
+            login_page = LoginPage(page)
+            login_page.open()
+            login_page.login(username, self.password)
+
+            try:
+                page.wait_for_url("**/inventory.html", timeout=self.login_timeout)
+            except Exception:
+                message = login_page.get_text_if_present(
+                    LoginPage.ERROR_MESSAGE, default="нет перехода на каталог")
+                raise LoginFailedError(username, message)
+
+            # Атомарная запись: параллельные xdist воркеры могут логиниться одновременно
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".json")
+            os.close(fd)
+            context.storage_state(path=tmp_path)
+            os.replace(tmp_path, self.state_path(username))
+        finally:
+            context.close()
+
+
+def open_authenticated_page(auth_cache, browser_pool, username, context_options):
+    """
+    Открытие каталога в авторизованном контексте
+
+    Если сессия оказалась недействительной (редирект на логин),
+    кеш сбрасывается и выполняется повторный логин.
+
+    Returns:
+        Tuple (context, page) с открытой страницей каталога
+    """
+    for _ in range(2):
+        state_path = auth_cache.get_state(browser_pool.browser, username, context_options)
+        context = browser_pool.new_context(storage_state=state_path, **context_options)
+        page = context.new_page()
+        inventory_page = InventoryPage(page)
+        inventory_page.navigate_to(inventory_page.url)
+
+        # Без действующей сессии SauceDemo перенаправляет на страницу логина
+        try:
+            page.wait_for_selector(InventoryPage.INVENTORY_CONTAINER,
+                                   timeout=auth_cache.login_timeout)
+            return context, page
+        except Exception:
+            context.close()
+            auth_cache.invalidate(username)
+
+    raise LoginFailedError(username, "сохраненная сессия недействительна после повторного логина")
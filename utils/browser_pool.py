@@ -0,0 +1,137 @@
+"""
+Пул браузеров для тестов.
+Один браузер на процесс pytest (xdist воркер) переиспользуется всеми тестами,
+изоляция обеспечивается новым BrowserContext для каждого теста.
+С cdp_endpoint воркеры подключаются к уже запущенному Chromium
+(например, браузеру демона test_execution) вместо запуска своего.
+"""
+from playwright.sync_api import Error as PlaywrightError
+
+
+class BrowserPool:
+    """
+    Браузер воркера с проверкой здоровья и перезапуском.
+
+    Если браузер упал или отключился, следующий запрос контекста
+    запускает новый процесс браузера.
+    """
+
+    SUPPORTED_BROWSERS = ("chromium", "firefox", "webkit")
+
+    def __init__(self, playwright, browser_name="chromium", headless=False,
+                 max_contexts_per_browser=0, launch_options=None, context_setup=None,
+                 cdp_endpoint=None):
+        """
+        Инициализация пула
+
+        Args:
+            playwright: Экземпляр Playwright
+            browser_name: chromium/firefox/webkit (неизвестное имя -> chromium)
+            headless: Headless режим
+            max_contexts_per_browser: Перезапускать браузер после N контекстов
+                (0 - не перезапускать), ограничивает рост памяти
+            launch_options: Дополнительные параметры запуска браузера
+            context_setup: Функция, вызываемая для каждого нового контекста
+                (например, подключение перехвата запросов)
+            cdp_endpoint: Адрес запущенного Chromium (ws://... или http://host:port);
+                браузер не запускается, а подключается по CDP
+        """
+        if browser_name not in self.SUPPORTED_BROWSERS:
+            browser_name = "chromium"
+        self.browser_type = getattr(playwright, browser_name)
+        self.headless = headless
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self.launch_options = launch_options or {}
+        self.context_setup = context_setup
+        self.cdp_endpoint = cdp_endpoint
+        self._chromium = playwright.chromium
+
+        self._browser = None
+        self._disconnected = False
+        self._contexts_since_launch = 0
+
+        # Статистика для отладки
+        self.launches = 0
+        self.contexts_created = 0
+
+    @property
+    def browser(self):
+        """Живой браузер воркера (запускается или перезапускается при необходимости)"""
+        if not self.is_healthy():
+            self._relaunch()
+        return self._browser
+
+    def is_healthy(self):
+        """
+        Проверка здоровья браузера
+
+        Returns:
+            True если браузер запущен и подключен
+        """
+        return (
+            self._browser is not None
+            and not self._disconnected
+            and self._browser.is_connected()
+        )
+
+    def new_context(self, **context_options):
+        """
+        Новый изолированный контекст на браузере воркера
+
+        Если браузер упал между проверкой и созданием контекста,
+        браузер перезапускается и попытка повторяется один раз.
+
+        Args:
+            **context_options: Параметры browser.new_context (viewport и т.д.)
+
+        Returns:
+            BrowserContext
+        """
+        if (self.max_contexts_per_browser
+                and self._contexts_since_launch >= self.max_contexts_per_browser):
+            self.recycle()
+
+        try:
+            context = self.browser.new_context(**context_options)
+        except PlaywrightError:
+            self.recycle()
+            context = self.browser.new_context(**context_options)
+
+        if self.context_setup is not None:
+            self.context_setup(context)
+
+        self._contexts_since_launch += 1
+        self.contexts_created += 1
+        return context
+
+    def recycle(self):
+        """Закрытие текущего браузера; новый будет запущен при следующем запросе"""
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except PlaywrightError:
+                # Браузер уже упал - закрывать нечего
+                pass
+        self._browser = None
+
+    def close(self):
+        """Закрытие пула в конце сессии"""
+        self.recycle()
+
+    def _relaunch(self):
+        """Запуск нового процесса браузера"""
+        self.recycle()
+        if self.cdp_endpoint:
+            # close() подключенного браузера только отключается от него
+            self._browser = self._chromium.connect_over_cdp(self.cdp_endpoint)
+        else:
+            self._browser = self.browser_type.launch(headless=self.headless, **self.launch_options)
+        self._disconnected = False
+        self._contexts_since_launch = 0
+        self._browser.on("disconnected", self._on_disconnected)
+        self.launches += 1
+
+    def _on_disconnected(self, browser):
+        """Обработчик падения/отключения браузера"""
+        if browser is self._browser:
+            self._disconnected = True
@@ -0,0 +1,48 @@
+"""
+Фоновая очередь обработки визуальных контрольных точек.
+Тест только снимает скриншот (Playwright нельзя вызывать из других
+потоков), а декодирование, сравнение с эталоном и запись diff
+выполняются воркерами очереди. Результаты собираются в конце сессии.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CheckpointQueue:
+    """Пул потоков для обработки контрольных точек"""
+
+    def __init__(self, workers=2):
+        """
+        Инициализация очереди
+
+        Args:
+            workers: Количество потоков обработки
+        """
+        self.workers = workers
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="checkpoint")
+        self._futures = []
+
+    def submit(self, fn, *args, **kwargs):
+        """
+        Постановка обработки в очередь
+
+        Returns:
+            Future с результатом fn
+        """
+        future = self._executor.submit(fn, *args, **kwargs)
+        self._futures.append(future)
+        return future
+
+    @property
+    def pending(self):
+        """Количество еще не обработанных контрольных точек"""
+        return sum(1 for future in self._futures if not future.done())
+
+    def drain(self):
+        """Ожидание обработки всех поставленных контрольных точек"""
+        for future in self._futures:
+            future.exception()
+        self._futures = [future for future in self._futures if not future.done()]
+
+    def shutdown(self):
+        """Остановка воркеров после обработки очереди"""
+        self._executor.shutdown(wait=True)
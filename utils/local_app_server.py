@@ -0,0 +1,64 @@
+"""
+Локальный HTTP сервер для собранной копии тестируемого приложения.
+Позволяет гонять тесты без обращения к www.saucedemo.com:
+статика отдается из директории, неизвестные пути (роуты SPA)
+отдают index.html.
+"""
+import os
+import threading
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+
+
+class _SpaRequestHandler(SimpleHTTPRequestHandler):
+    """Обработчик статики с fallback на index.html"""
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if not os.path.exists(path):
+            self.path = "/index.html"
+        return super().send_head()
+
+    def log_message(self, format, *args):
+        # Без логирования каждого запроса в вывод pytest
+        pass
+
+
+class LocalAppServer:
+    """HTTP сервер в фоновом потоке"""
+
+    def __init__(self, directory, host="127.0.0.1", port=0):
+        """
+        Инициализация сервера
+
+        Args:
+            directory: Директория со сборкой приложения (index.html, static/)
+            host: Адрес для прослушивания
+            port: Порт (0 - свободный порт, выбирается ОС)
+        """
+        if not os.path.isfile(os.path.join(directory, "index.html")):
+            raise FileNotFoundError(f"В директории {directory} нет index.html")
+
+        self.directory = directory
+        handler = partial(_SpaRequestHandler, directory=directory)
+        self._server = ThreadingHTTPServer((host, port), handler)
+        self._thread = None
+
+    @property
+    def url(self):
+        """Базовый URL сервера (без завершающего слеша)"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Запуск сервера в daemon потоке"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Остановка сервера"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
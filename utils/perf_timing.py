@@ -0,0 +1,145 @@
+"""
+Замеры производительности действий page objects.
+Для каждого действия BasePage (переход, клик, ввод, ожидание URL)
+записываются время выполнения, количество сетевых запросов и, после
+навигации, Navigation/Paint Timing браузера. Записи сохраняются в JSONL
+(одна строка на действие) и могут проверяться по бюджетам.
+"""
+import json
+import os
+import time
+import weakref
+from contextlib import contextmanager, nullcontext
+
+
+NAVIGATION_TIMING_SCRIPT = """
+() => {
+    const nav = performance.getEntriesByType('navigation')[0];
+    const paint = Object.fromEntries(
+        performance.getEntriesByType('paint').map(entry => [entry.name, entry.startTime])
+    );
+    if (!nav) {
+        return null;
+    }
+    return {
+        ttfb_ms: nav.responseStart - nav.requestStart,
+        response_end_ms: nav.responseEnd,
+        dom_content_loaded_ms: nav.domContentLoadedEventEnd,
+        load_ms: nav.loadEventEnd,
+        transfer_size: nav.transferSize,
+        first_paint_ms: paint['first-paint'] ?? null,
+        first_contentful_paint_ms: paint['first-contentful-paint'] ?? null
+    };
+}
+"""
+
+
+class PerformanceBudgetExceeded(AssertionError):
+    """Действие выполнялось дольше заданного бюджета"""
+
+    def __init__(self, action, duration_ms, budget_ms):
+        super().__init__(
+            f"Действие '{action}' заняло {duration_ms:.0f} мс при бюджете {budget_ms:.0f} мс"
+        )
+        self.action = action
+        self.duration_ms = duration_ms
+        self.budget_ms = budget_ms
+
+
+class PerformanceRecorder:
+    """Сбор замеров действий одной страницы в рамках теста"""
+
+    def __init__(self, test_id, budgets=None):
+        """
+        Инициализация
+
+        Args:
+            test_id: Идентификатор теста (nodeid)
+            budgets: Список (max_ms, actions): actions - кортеж имен действий
+                (например "InventoryPage.go_to_cart" или "navigate_to")
+                или None для всех действий
+        """
+        self.test_id = test_id
+        self.budgets = budgets or []
+        self.records = []
+        self.requests = 0
+
+    def attach(self, page):
+        """Подключение к странице: подсчет запросов и регистрация для BasePage"""
+        page.on("request", self._on_request)
+        _recorders[page] = self
+        return self
+
+    def _on_request(self, request):
+        self.requests += 1
+
+    @contextmanager
+    def measure(self, page, action, target=None, navigation=False):
+        """
+        Замер действия
+
+        Args:
+            page: Playwright Page
+            action: Имя действия ("LoginPage.click")
+            target: Селектор или URL
+            navigation: Снять Navigation/Paint Timing после действия
+        """
+        requests_before = self.requests
+        start = time.perf_counter()
+        yield
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        record = {
+            "test": self.test_id,
+            "action": action,
+            "target": target,
+            "duration_ms": round(duration_ms, 2),
+            "requests": self.requests - requests_before,
+            "url": page.url,
+            "timestamp": time.time()
+        }
+        if navigation:
+            record["navigation"] = page.evaluate(NAVIGATION_TIMING_SCRIPT)
+        self.records.append(record)
+
+        budget_ms = self.budget_for(action)
+        if budget_ms is not None and duration_ms > budget_ms:
+            record["budget_ms"] = budget_ms
+            raise PerformanceBudgetExceeded(action, duration_ms, budget_ms)
+
+    def budget_for(self, action):
+        """Наименьший бюджет, применимый к действию (или None)"""
+        method = action.rsplit(".", 1)[-1]
+        applicable = [
+            max_ms for max_ms, actions in self.budgets
+            if actions is None or action in actions or method in actions
+        ]
+        return min(applicable) if applicable else None
+
+    def write(self, path):
+        """Дозапись замеров в JSONL файл (одна строка на действие)"""
+        if not self.records:
+            return
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        lines = "".join(json.dumps(record, ensure_ascii=False) + "\n" for record in self.records)
+        # Один write в режиме append: строки параллельных xdist воркеров не перемешиваются
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+
+_recorders = weakref.WeakKeyDictionary()
+
+
+def get_recorder(page):
+    """Recorder, подключенный к странице, или None"""
+    return _recorders.get(page)
+
+
+def timed_action(page, action, target=None, navigation=False):
+    """Контекст замера действия (no-op если к странице не подключен recorder)"""
+    recorder = get_recorder(page)
+    if recorder is None:
+        return nullcontext()
+    return recorder.measure(page, action, target, navigation)
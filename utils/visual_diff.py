@@ -0,0 +1,335 @@
+"""
+Локальный движок визуальных проверок (без Applitools).
+Эталонные скриншоты хранятся на диске, сравнение - векторизованный
+NumPy diff с допуском по регионам, подавлением антиалиасинга и
+поиском ограничивающих прямоугольников измененных областей.
+
+LocalEyes повторяет используемую тестами часть API Applitools Eyes
+(open / check / close_async / abort_async), поэтому тесты работают
+с любым движком без изменений.
+"""
+import io
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+
+# Смещения соседних пикселей для подавления антиалиасинга
+NEIGHBOR_SHIFTS = [(dy, dx) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if (dy, dx) != (0, 0)]
+
+
+@dataclass
+class Region:
+    """
+    Прямоугольная область скриншота со своим допуском
+
+    tolerance - максимальная разница канала (0-255), не считающаяся
+    изменением; ignore - область не сравнивается вовсе.
+    """
+    x: int
+    y: int
+    width: int
+    height: int
+    tolerance: Optional[int] = None
+    ignore: bool = False
+
+
+@dataclass
+class DiffResult:
+    """Результат сравнения скриншота с эталоном"""
+    name: str
+    passed: bool
+    diff_pixels: int = 0
+    diff_ratio: float = 0.0
+    boxes: List[Tuple[int, int, int, int]] = field(default_factory=list)
+    baseline_created: bool = False
+    baseline_path: Optional[str] = None
+    diff_path: Optional[str] = None
+    duration_ms: float = 0.0
+
+
+def compare_images(
+    baseline: np.ndarray,
+    actual: np.ndarray,
+    tolerance: int = 16,
+    regions: Optional[List[Region]] = None,
+    antialiasing: bool = True,
+    block_size: int = 16,
+    min_block_pixels: int = 4
+):
+    """
+    Сравнение двух RGB изображений
+
+    Args:
+        baseline: Эталон (H x W x 3, uint8)
+        actual: Текущий скриншот (H x W x 3, uint8)
+        tolerance: Допуск разницы канала по умолчанию
+        regions: Области с собственным допуском или игнорируемые
+        antialiasing: Подавлять отличия из-за сдвига краев на 1px
+        block_size: Размер ячейки сетки для поиска измененных областей
+        min_block_pixels: Минимум измененных пикселей, чтобы ячейка считалась измененной
+
+    Returns:
+        Tuple (mask измененных пикселей, список boxes (x, y, w, h))
+    """
+    if baseline.shape != actual.shape:
+        height = max(baseline.shape[0], actual.shape[0])
+        width = max(baseline.shape[1], actual.shape[1])
+        return np.ones((height, width), dtype=bool), [(0, 0, width, height)]
+
+    base = baseline.astype(np.int16)
+    current = actual.astype(np.int16)
+    delta = np.abs(base - current).max(axis=2)
+
+    threshold = np.full(delta.shape, tolerance, dtype=np.int16)
+    for region in regions or []:
+        area = (slice(region.y, region.y + region.height), slice(region.x, region.x + region.width))
+        if region.ignore:
+            threshold[area] = np.iinfo(np.int16).max
+        elif region.tolerance is not None:
+            threshold[area] = region.tolerance
+
+    mask = delta > threshold
+
+    if antialiasing and mask.any():
+        mask &= ~(_matches_neighbor(current, base, threshold) & _matches_neighbor(base, current, threshold))
+
+    return mask, _changed_boxes(mask, block_size, min_block_pixels)
+
+
+def _matches_neighbor(image, other, threshold):
+    """Пиксели image, совпадающие с одним из соседних пикселей other (сдвиг края на 1px)"""
+    padded = np.pad(other, ((1, 1), (1, 1), (0, 0)), mode="edge")
+    height, width = image.shape[:2]
+    matched = np.zeros((height, width), dtype=bool)
+    for dy, dx in NEIGHBOR_SHIFTS:
+        shifted = padded[1 + dy:1 + dy + height, 1 + dx:1 + dx + width]
+        matched |= np.abs(image - shifted).max(axis=2) <= threshold
+    return matched
+
+
+def _changed_boxes(mask, block_size, min_block_pixels):
+    """Ограничивающие прямоугольники связных групп измененных ячеек сетки"""
+    height, width = mask.shape
+    rows = -(-height // block_size)
+    cols = -(-width // block_size)
+
+    padded = np.zeros((rows * block_size, cols * block_size), dtype=bool)
+    padded[:height, :width] = mask
+    counts = padded.reshape(rows, block_size, cols, block_size).sum(axis=(1, 3))
+    hot = counts >= min_block_pixels
+
+    boxes = []
+    visited = np.zeros_like(hot)
+    for row, col in zip(*np.nonzero(hot)):
+        if visited[row, col]:
+            continue
+        # Обход связной группы ячеек (8-связность)
+        stack = [(row, col)]
+        visited[row, col] = True
+        top, left, bottom, right = row, col, row, col
+        while stack:
+            r, c = stack.pop()
+            top, left, bottom, right = min(top, r), min(left, c), max(bottom, r), max(right, c)
+            for dr in (-1, 0, 1):
+                for dc in (-1, 0, 1):
+                    nr, nc = r + dr, c + dc
+                    if 0 <= nr < rows and 0 <= nc < cols and hot[nr, nc] and not visited[nr, nc]:
+                        visited[nr, nc] = True
+                        stack.append((nr, nc))
+
+        x, y = int(left * block_size), int(top * block_size)
+        boxes.append((
+            x, y,
+            min((int(right) + 1) * block_size, width) - x,
+            min((int(bottom) + 1) * block_size, height) - y
+        ))
+
+    return boxes
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    """PNG байты -> RGB массив"""
+    from PIL import Image
+    return np.asarray(Image.open(io.BytesIO(data)).convert("RGB"))
+
+
+def save_png(image: np.ndarray, path: str):
+    """RGB массив -> PNG файл"""
+    from PIL import Image
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    Image.fromarray(image).save(path)
+
+
+def render_diff(actual: np.ndarray, mask: np.ndarray, boxes) -> np.ndarray:
+    """Изображение для отчета: измененные пиксели красным, области в рамках"""
+    if actual.shape[:2] != mask.shape:
+        return actual
+    result = actual.copy()
+    result[mask] = (255, 0, 0)
+    for x, y, w, h in boxes:
+        result[y:y + h, [x, x + w - 1]] = (255, 0, 255)
+        result[[y, y + h - 1], x:x + w] = (255, 0, 255)
+    return result
+
+
+def slugify(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name).strip("_") or "checkpoint"
+
+
+@dataclass
+class LocalTestResults:
+    """Результаты визуальных проверок одного теста"""
+    name: str
+    checks: List[DiffResult] = field(default_factory=list)
+    url: str = ""
+    # Futures контрольных точек, обрабатываемых в CheckpointQueue
+    pending: list = field(default_factory=list, repr=False)
+
+    def resolve(self):
+        """Ожидание фоновых контрольных точек и перенос их результатов в checks"""
+        for future in self.pending:
+            try:
+                self.checks.append(future.result())
+            except Exception as e:
+                self.checks.append(DiffResult(f"<ошибка обработки: {e}>", passed=False))
+        self.pending = []
+
+    @property
+    def is_passed(self) -> bool:
+        self.resolve()
+        return all(check.passed for check in self.checks)
+
+
+class LocalRunner:
+    """Сборщик результатов LocalEyes за сессию (аналог ClassicRunner)"""
+
+    def __init__(self, queue=None):
+        """
+        Args:
+            queue: CheckpointQueue для фоновой обработки (None - синхронно в тесте)
+        """
+        self.queue = queue
+        self.results: List[LocalTestResults] = []
+
+    def add(self, results: LocalTestResults):
+        self.results.append(results)
+
+    def get_all_results(self) -> List[LocalTestResults]:
+        """Результаты всех тестов после завершения фоновой обработки"""
+        for results in self.results:
+            results.resolve()
+        return self.results
+
+
+class LocalEyes:
+    """Визуальные проверки на локальных эталонах"""
+
+    def __init__(self, runner=None, baseline_dir="visual_baselines", diff_dir="reports/visual_diffs",
+                 tolerance=16, update_baseline=False):
+        """
+        Инициализация
+
+        Args:
+            runner: LocalRunner для сбора результатов сессии
+            baseline_dir: Директория эталонных скриншотов
+            diff_dir: Директория изображений отличий
+            tolerance: Допуск разницы канала по умолчанию (0-255)
+            update_baseline: Перезаписывать эталоны текущими скриншотами
+        """
+        self.runner = runner
+        self.baseline_dir = baseline_dir
+        self.diff_dir = diff_dir
+        self.tolerance = tolerance
+        self.update_baseline = update_baseline
+        self.page = None
+        self.results = None
+        self._test_dir = None
+
+    def open(self, page, app_name, test_name, viewport_size=None):
+        """Начало визуального теста"""
+        self.page = page
+        if viewport_size:
+            page.set_viewport_size(viewport_size)
+        self._test_dir = os.path.join(slugify(app_name), slugify(test_name))
+        self.results = LocalTestResults(test_name, url=os.path.join(self.diff_dir, self._test_dir))
+        return page
+
+    def selector_region(self, selector, tolerance=None, ignore=False) -> Optional[Region]:
+        """Region по текущему положению элемента на странице (None если элемента нет)"""
+        box = self.page.locator(selector).first.bounding_box()
+        if box is None:
+            return None
+        return Region(int(box["x"]), int(box["y"]), int(box["width"]), int(box["height"]),
+                      tolerance=tolerance, ignore=ignore)
+
+    def check(self, name, target=None, regions=None) -> DiffResult:
+        """
+        Визуальная контрольная точка: скриншот всей страницы и сравнение с эталоном
+
+        Args:
+            name: Имя контрольной точки
+            target: Игнорируется (совместимость с Target.window().fully())
+            regions: Области с собственным допуском / игнорируемые
+        """
+        return self.check_image(name, self.page.screenshot(full_page=True), regions)
+
+    def check_image(self, name, png_bytes, regions=None):
+        """
+        Сравнение готового скриншота (PNG байты) с эталоном
+
+        Если у runner есть CheckpointQueue, сравнение выполняется в фоне
+        и метод сразу возвращает Future; иначе - DiffResult.
+        """
+        queue = self.runner.queue if self.runner is not None else None
+        if queue is not None:
+            future = queue.submit(self._compare, name, png_bytes, regions, self._test_dir)
+            self.results.pending.append(future)
+            return future
+
+        result = self._compare(name, png_bytes, regions, self._test_dir)
+        self.results.checks.append(result)
+        return result
+
+    def _compare(self, name, png_bytes, regions, test_dir) -> DiffResult:
+        """Декодирование, сравнение и запись diff (потокобезопасно, без Playwright)"""
+        start = time.perf_counter()
+        baseline_path = os.path.join(self.baseline_dir, test_dir, f"{slugify(name)}.png")
+        actual = decode_png(png_bytes)
+
+        if self.update_baseline or not os.path.exists(baseline_path):
+            save_png(actual, baseline_path)
+            result = DiffResult(name, True, baseline_created=True, baseline_path=baseline_path)
+        else:
+            with open(baseline_path, 'rb') as f:
+                baseline = decode_png(f.read())
+            mask, boxes = compare_images(baseline, actual, self.tolerance, regions)
+            result = DiffResult(
+                name,
+                passed=not boxes,
+                diff_pixels=int(mask.sum()),
+                diff_ratio=float(mask.mean()),
+                boxes=boxes,
+                baseline_path=baseline_path
+            )
+            if boxes:
+                result.diff_path = os.path.join(self.diff_dir, test_dir, f"{slugify(name)}.png")
+                save_png(render_diff(actual, mask, boxes), result.diff_path)
+
+        result.duration_ms = (time.perf_counter() - start) * 1000
+        return result
+
+    def close_async(self):
+        """Завершение теста: результаты передаются в runner"""
+        if self.results is not None and self.runner is not None:
+            self.runner.add(self.results)
+        results, self.results = self.results, None
+        return results
+
+    def abort_async(self):
+        """Прерывание теста (результаты уже переданы в close_async)"""
+        self.results = None